@@ -3,7 +3,6 @@ import shutil
 import subprocess
 import sys
 import argparse
-import openpyxl
 from pathlib import Path
 
 def clean():
@@ -47,9 +46,10 @@ def install():
         sys.exit(1)
 
 def get_excel_config():
-    """Reads configuration from Excel file."""
+    """Reads configuration from Excel file and publishes the config snapshot for Gauge workers."""
+    from core.ConfigSnapshot import ConfigSnapshot
     # Try to read TEST_DATA_FILE from env/default/default.properties
-    config_excel_name = "td_FrameworkData.xlsx" # Default fallback
+    config_excel_name = None # Discovered from data/ when not configured
     default_props_path = Path("env/default/default.properties")
     
     if default_props_path.exists():
@@ -66,27 +66,31 @@ def get_excel_config():
         except Exception:
             pass
 
-    config_path = Path(f"data/{config_excel_name}")
-    sheet_name = "Environment"
     config = {}
-    
-    if not config_path.exists():
-        print(f"Warning: Config file not found at {config_path}. Using defaults.")
-        return config
     try:
-        workbook = openpyxl.load_workbook(config_path, data_only=True)
-        if sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                if row[0]:
-                    key = str(row[0]).strip()
-                    value = row[1] if row[1] is not None else ""
-                    config[key] = str(value).strip()
-        workbook.close()
+        config, config_path = ConfigSnapshot.resolve(config_excel_name)
+        print(f"Configuration resolved from {config_path} (snapshot: {ConfigSnapshot.get_snapshot_path()})")
+    except FileNotFoundError as e:
+        print(f"Warning: {e} Using defaults.")
     except Exception as e:
         print(f"Error reading Excel config: {e}")
     return config
 
+def compile_test_data(fmt="sqlite"):
+    """Compiles data/*.xlsx into the runtime test data format (.cache/compiled/)."""
+    from core.TestDataBackends import compile_workbook
+    config = get_excel_config()
+    test_id_columns = [c.strip() for c in config.get("TEST_ID_COLUMNS", "").split(",") if c.strip()]
+    print(f"Compiling test data to {fmt} (indexed columns: {', '.join(test_id_columns) or 'none'})...")
+    for xlsx_path in sorted(Path("data").glob("*.xlsx")):
+        if xlsx_path.name.startswith("~$"):
+            continue
+        try:
+            output_path = compile_workbook(str(xlsx_path), fmt, test_id_columns)
+            print(f"Compiled {xlsx_path} -> {output_path}")
+        except Exception as e:
+            print(f"Error compiling {xlsx_path}: {e}")
+
 def setup_environment(env_name):
     """Creates environment folder if it doesn't exist by copying default."""
     if not env_name or env_name.lower() == "default":
@@ -115,6 +119,8 @@ def run():
     print(f"Running Gauge specs in environment: {env_name}...")
     env_vars = os.environ.copy()
     env_vars["GAUGE_PROJECT_NAME"] = app_name
+    from core.ConfigSnapshot import ConfigSnapshot
+    env_vars["CONFIG_SNAPSHOT_FILE"] = str(ConfigSnapshot.get_snapshot_path())
     try:
         cmd = f"gauge run specs --env {env_name}"
         subprocess.check_call(cmd, shell=True, env=env_vars)
@@ -129,6 +135,10 @@ def main():
                         help='Skip dependency installation')
     parser.add_argument('--skip-clean', action='store_true', 
                         help='Skip cleaning build artifacts')
+    parser.add_argument('--compile-data', action='store_true',
+                        help='Compile data/*.xlsx into the runtime test data format')
+    parser.add_argument('--data-format', default='sqlite', choices=['sqlite', 'json', 'csv', 'parquet'],
+                        help='Runtime test data format used by --compile-data')
     args = parser.parse_args()
     if not args.skip_clean:
         clean()
@@ -138,6 +148,8 @@ def main():
         install()
     else:
         print("Skipping dependency installation...")
+    if args.compile_data:
+        compile_test_data(args.data_format)
     
     #run()
 
@@ -0,0 +1,294 @@
+"""
+Async Base Page - asyncio engine for many concurrent sessions in one process
+Built on playwright.async_api: one event loop and one browser drive many isolated
+contexts at once, so independent flows (e.g. data-driven login checks) run tens at a
+time per worker instead of one page per Gauge stream.
+
+Example:
+    async def check_login(session):
+        await session.navigate_to(session.get_app_url())
+        await session.login("standard_user", "secret_sauce")
+        await session.assert_element_visible(Objectlocators.APP_LOGO, "Login")
+
+    results = AsyncFlowRunner(concurrency=20).run([("TC001", check_login), ...])
+    print(AsyncFlowRunner.format_summary(results))
+"""
+from collections import namedtuple
+from core.Core_basePage import BasePage
+from core.BrowserServer import resolve_browser_type
+from locators.Objectlocators import Objectlocators
+from playwright.async_api import async_playwright
+import asyncio
+import time
+import traceback
+
+
+class AsyncBasePage:
+    """
+    One isolated session (browser context + page) with the BasePage surface as coroutines.
+    Unlike BasePage, state is per instance, so any number of sessions can run concurrently.
+    Element/URL assertions act on the session's own page (no page argument).
+    Page objects subclass it and override the login locators, like the sync page objects.
+    """
+    username_input = Objectlocators.USERNAME_INPUT
+    password_input = Objectlocators.PASSWORD_INPUT
+    login_button = Objectlocators.LOGIN_BUTTON
+
+    def __init__(self, context, page, name=""):
+        self.context = context
+        self.page = page
+        self.name = name
+        self.messages = []   # Per-session log; Gauge messages are not safe to interleave
+        self._soft_errors = []
+
+    # ====================================
+    # Configuration (shared, read-only settings)
+    # ====================================
+    @staticmethod
+    def get_settings():
+        return BasePage.get_settings()
+
+    def get_app_url(self):
+        return BasePage.get_app_url()
+
+    def log(self, message):
+        self.messages.append(message)
+
+    # ====================================
+    # Browser Actions
+    # ====================================
+    async def navigate_to(self, url):
+        """Navigate to the specified URL."""
+        self.log(f"Navigate to {url}")
+        try:
+            await self.page.goto(url)
+        except Exception as e:
+            await self.take_screenshot("Error_Navigate")
+            raise AssertionError(f"Navigation failed: {str(e)}")
+
+    async def get_title(self):
+        """Get the current page title."""
+        return await self.page.title()
+
+    async def take_screenshot(self, name="screenshot"):
+        """Take a screenshot into the Gauge screenshots folder. Returns the path or None."""
+        try:
+            path = BasePage.get_screenshot_path(f"{self.name}_{name}" if self.name else name)
+            await self.page.screenshot(path=path)
+            return path
+        except Exception:
+            return None
+
+    # ====================================
+    # Login Actions
+    # ====================================
+    async def login(self, username, password):
+        """Perform the UI login with the page object's locators."""
+        self.log(f"Login as {username}")
+        try:
+            await self.page.fill(self.username_input, username)
+            await self.page.fill(self.password_input, password)
+            await self.page.click(self.login_button)
+        except Exception as e:
+            await self.take_screenshot("Error_Login")
+            raise AssertionError(f"Login failed: {str(e)}")
+
+    # ====================================
+    # Assertions
+    # ====================================
+    # Value assertions are pure and shared with BasePage
+    assert_equal = BasePage.assert_equal
+    assert_not_equal = BasePage.assert_not_equal
+    assert_true = BasePage.assert_true
+    assert_false = BasePage.assert_false
+    assert_contains = BasePage.assert_contains
+    assert_not_contains = BasePage.assert_not_contains
+    assert_greater_than = BasePage.assert_greater_than
+    assert_less_than = BasePage.assert_less_than
+
+    # Soft Assertions (per session)
+    def soft_assert_equal(self, actual, expected, message=""):
+        if actual != expected:
+            self._soft_errors.append(f"{message}: Expected '{expected}', got '{actual}'")
+
+    def soft_assert_true(self, condition, message=""):
+        if not condition:
+            self._soft_errors.append(f"{message}: Condition is not True")
+
+    def soft_assert_contains(self, text, substring, message=""):
+        if substring not in text:
+            self._soft_errors.append(f"{message}: '{text}' does not contain '{substring}'")
+
+    def assert_all_soft(self):
+        """Assert all collected soft assertion failures at once."""
+        if self._soft_errors:
+            errors = "\n".join(self._soft_errors)
+            self._soft_errors = []
+            raise AssertionError(f"Soft assertion failures:\n{errors}")
+
+    def get_soft_error_count(self):
+        return len(self._soft_errors)
+
+    # Playwright-specific Assertions
+    async def assert_element_visible(self, selector, message="", timeout=None):
+        """Assert that an element becomes visible (waits up to VISIBILITY_TIMEOUT)."""
+        timeout = timeout or self.get_settings().visibility_timeout or self.get_settings().default_timeout
+        try:
+            await self.page.wait_for_selector(selector, state='visible', timeout=timeout)
+        except Exception:
+            raise AssertionError(f"{message}: Element not visible - {selector}")
+
+    async def assert_element_not_visible(self, selector, message=""):
+        assert not await self.page.is_visible(selector), f"{message}: Element should not be visible - {selector}"
+
+    async def assert_element_enabled(self, selector, message=""):
+        assert await self.page.is_enabled(selector), f"{message}: Element not enabled - {selector}"
+
+    async def assert_element_disabled(self, selector, message=""):
+        assert not await self.page.is_enabled(selector), f"{message}: Element should be disabled - {selector}"
+
+    async def assert_text_equals(self, selector, expected_text, message=""):
+        actual_text = await self.page.text_content(selector)
+        assert actual_text == expected_text, f"{message}: Expected '{expected_text}', got '{actual_text}'"
+
+    async def assert_text_contains(self, selector, expected_text, message=""):
+        actual_text = await self.page.text_content(selector)
+        assert expected_text in actual_text, f"{message}: '{actual_text}' does not contain '{expected_text}'"
+
+    async def assert_url_equals(self, expected_url, message=""):
+        actual_url = self.page.url
+        assert actual_url == expected_url, f"{message}: Expected URL '{expected_url}', got '{actual_url}'"
+
+    async def assert_url_contains(self, expected_substring, message=""):
+        actual_url = self.page.url
+        assert expected_substring in actual_url, f"{message}: URL '{actual_url}' does not contain '{expected_substring}'"
+
+    async def assert_title_equals(self, expected_title, message=""):
+        actual_title = await self.page.title()
+        assert actual_title == expected_title, f"{message}: Expected title '{expected_title}', got '{actual_title}'"
+
+
+class AsyncEngine:
+    """
+    Owns the async Playwright driver and one browser (launched, or connected through
+    BROWSER_WS_ENDPOINT) and hands out isolated sessions.
+    """
+
+    def __init__(self, settings=None):
+        self.settings = settings or BasePage.get_settings()
+        self._playwright = None
+        self.browser = None
+
+    async def start(self):
+        """Start Playwright and launch (or connect to) the configured browser."""
+        settings = self.settings
+        self._playwright = await async_playwright().start()
+        engine, channel = resolve_browser_type(settings.browser)
+        browser_type = getattr(self._playwright, engine)
+        if settings.browser_ws_endpoint:
+            self.browser = await browser_type.connect(settings.browser_ws_endpoint, slow_mo=settings.slow_mo)
+        else:
+            options = {'headless': settings.headless, 'slow_mo': settings.slow_mo}
+            if channel:
+                options['channel'] = channel
+            if engine == 'chromium' and not settings.headless:
+                options['args'] = ["--start-maximized"]
+            self.browser = await browser_type.launch(**options)
+        return self
+
+    async def new_session(self, page_class=AsyncBasePage, name=""):
+        """Create a fresh context with the configured timeouts and an open page."""
+        context = await self.browser.new_context(no_viewport=True)
+        context.set_default_timeout(self.settings.default_timeout)
+        context.set_default_navigation_timeout(self.settings.navigation_timeout)
+        page = await context.new_page()
+        return page_class(context, page, name)
+
+    async def close(self):
+        if self.browser:
+            await self.browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+        self.browser = None
+        self._playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+
+FlowResult = namedtuple('FlowResult', 'name passed error duration_ms messages')
+
+
+class AsyncFlowRunner:
+    """
+    Runs independent flows concurrently on one event loop and one browser.
+    A flow is an `async def flow(session)`; each gets its own context, closed afterwards.
+    """
+
+    def __init__(self, concurrency=10, page_class=AsyncBasePage, settings=None):
+        """
+        Args:
+            concurrency: Maximum number of sessions open at the same time
+            page_class: AsyncBasePage subclass handed to each flow
+            settings: Settings to use (default: BasePage.get_settings())
+        """
+        self.concurrency = max(int(concurrency), 1)
+        self.page_class = page_class
+        self.settings = settings
+
+    def run(self, flows):
+        """
+        Run flows to completion (blocking).
+        Args:
+            flows: Iterable of (name, async callable taking the session)
+        Returns:
+            list: FlowResult per flow, in input order
+        """
+        return asyncio.run(self.run_async(flows))
+
+    async def run_async(self, flows):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with AsyncEngine(self.settings) as engine:
+            return await asyncio.gather(*(self._run_flow(engine, semaphore, name, flow) for name, flow in flows))
+
+    async def _run_flow(self, engine, semaphore, name, flow):
+        async with semaphore:
+            start = time.perf_counter()
+            session = None
+            try:
+                session = await engine.new_session(self.page_class, name)
+                await flow(session)
+                session.assert_all_soft()
+                return FlowResult(name, True, None, (time.perf_counter() - start) * 1000, session.messages)
+            except Exception as e:
+                error = str(e) or traceback.format_exc(limit=3)
+                if session:
+                    await session.take_screenshot("failed")
+                return FlowResult(name, False, error, (time.perf_counter() - start) * 1000,
+                                  session.messages if session else [])
+            finally:
+                if session:
+                    try:
+                        await session.context.close()
+                    except Exception:
+                        pass
+
+    @staticmethod
+    def format_summary(results, wall_time=None):
+        """Human-readable pass/fail table plus throughput."""
+        lines = []
+        for r in results:
+            status = "PASS" if r.passed else "FAIL"
+            line = f"  [{status}] {r.name} ({r.duration_ms:.0f} ms)"
+            if r.error:
+                line += f" - {r.error.splitlines()[0]}"
+            lines.append(line)
+        passed = sum(1 for r in results if r.passed)
+        summary = f"{passed}/{len(results)} flows passed"
+        if wall_time:
+            summary += f" in {wall_time:.1f}s ({len(results) / wall_time:.1f} sessions/s)"
+        return "\n".join(lines + [summary])
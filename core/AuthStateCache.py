@@ -0,0 +1,130 @@
+"""
+Auth State Cache - Reuse logged-in sessions instead of logging in through the UI
+The first UI login for an (app URL, username, password) combination saves the context's
+Playwright storage_state (cookies + localStorage) under .cache/auth/ with a TTL; later
+scenarios with the same credentials restore it into their context and go straight to the
+landing page. The key holds a hash of the password, so a wrong or changed password misses
+the cache and goes through the login form.
+Scenarios tagged 'fresh-login', and logins whose outcome the scenario asserts (test data
+with an ExpectedError), always log in through the UI.
+"""
+from pathlib import Path
+import hashlib
+import json
+import os
+import time
+
+
+class AuthStateCache:
+    """
+    File-based storage_state cache keyed by (app URL, username, password hash).
+    Files are shared by all Gauge workers and written atomically. They hold live
+    session cookies, so the cache is opt-in (AUTH_STATE_CACHE) and lives in the
+    gitignored .cache folder. Passwords are never stored.
+    """
+    OPT_OUT_TAG = 'fresh-login'
+    DEFAULT_TTL = 1800
+    CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'auth'
+    _stats = {'restored': 0, 'saved': 0, 'ui_logins': 0, 'rejected': 0}
+
+    # Applies saved localStorage once per tab and origin (sessionStorage marker), so a
+    # logout later in the scenario is not undone by the next navigation.
+    _RESTORE_SCRIPT = """
+    (() => {
+        const origins = %s;
+        const items = origins[window.location.origin];
+        if (!items || window.sessionStorage.getItem('__auth_state_restored')) return;
+        for (const item of items) window.localStorage.setItem(item.name, item.value);
+        window.sessionStorage.setItem('__auth_state_restored', '1');
+    })();
+    """
+
+    @classmethod
+    def get_path(cls, app_url, username, password):
+        password_hash = hashlib.sha256((password or '').encode('utf-8')).hexdigest()
+        key = hashlib.sha256(f"{cls.normalize_url(app_url)}\n{username}\n{password_hash}".encode('utf-8')).hexdigest()[:32]
+        return cls.CACHE_DIR / f"{key}.json"
+
+    @classmethod
+    def load(cls, app_url, username, password, ttl=DEFAULT_TTL):
+        """
+        Get the saved session for an (app URL, username, password) combination.
+        Returns:
+            dict: Entry with 'storage_state' and 'landing_url', or None if missing/expired
+        """
+        path = cls.get_path(app_url, username, password)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get('saved_at', 0) > ttl:
+            cls.invalidate(app_url, username, password)
+            return None
+        return entry
+
+    @classmethod
+    def save(cls, app_url, username, password, storage_state, landing_url):
+        """Save a logged-in context's storage_state (atomic replace). The password only feeds the key."""
+        path = cls.get_path(app_url, username, password)
+        entry = {
+            'app_url': cls.normalize_url(app_url),
+            'username': username,
+            'landing_url': landing_url,
+            'saved_at': time.time(),
+            'storage_state': storage_state,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        cls._stats['saved'] += 1
+        return path
+
+    @classmethod
+    def restore(cls, context, entry):
+        """
+        Load a saved storage_state into an existing context (cookies now,
+        localStorage on the next navigation to each saved origin).
+        """
+        state = entry['storage_state']
+        if state.get('cookies'):
+            context.add_cookies(state['cookies'])
+        origins = {o['origin']: o.get('localStorage', []) for o in state.get('origins', []) if o.get('localStorage')}
+        if origins:
+            context.add_init_script(cls._RESTORE_SCRIPT % json.dumps(origins))
+        cls._stats['restored'] += 1
+
+    @classmethod
+    def invalidate(cls, app_url, username, password):
+        """Drop a saved session (e.g. when the server no longer accepts it)."""
+        try:
+            os.remove(cls.get_path(app_url, username, password))
+        except OSError:
+            pass
+
+    @classmethod
+    def clear(cls):
+        """Remove every saved session."""
+        if cls.CACHE_DIR.exists():
+            for path in cls.CACHE_DIR.glob('*.json'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @classmethod
+    def record(cls, event):
+        """Count a login outcome ('ui_logins' or 'rejected')."""
+        cls._stats[event] += 1
+
+    @classmethod
+    def format_stats(cls):
+        s = cls._stats
+        return (f"Auth state cache: {s['restored']} restored, {s['ui_logins']} UI logins, "
+                f"{s['saved']} saved, {s['rejected']} rejected")
+
+    @staticmethod
+    def normalize_url(url):
+        return (url or '').split('#')[0].split('?')[0].rstrip('/')
@@ -0,0 +1,116 @@
+"""
+Browser Server - One shared local Playwright browser per browser type
+The runners start a browser server on a localhost websocket and export its endpoint as
+BROWSER_WS_ENDPOINT; BasePage.initialize() in every Gauge stream then connects to it
+instead of launching its own browser. Each stream still gets isolated contexts.
+"""
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+
+# Framework BROWSER value -> (Playwright browser type, channel); mirrors BasePage.initialize
+BROWSER_TYPES = {
+    'chromium': ('chromium', 'chrome'),
+    'chrome': ('chromium', 'chrome'),
+    'edge': ('chromium', 'msedge'),
+    'firefox': ('firefox', None),
+    'webkit': ('webkit', None),
+}
+
+
+def resolve_browser_type(browser):
+    """Map a BROWSER value to (Playwright browser type name, channel)."""
+    return BROWSER_TYPES.get((browser or 'chromium').lower(), BROWSER_TYPES['chromium'])
+
+
+class BrowserServer:
+    """
+    Local Playwright browser server (`playwright launch-server`) bound to localhost.
+
+    Example:
+        with BrowserServer('chrome', headless=True) as server:
+            env['BROWSER_WS_ENDPOINT'] = server.ws_endpoint
+            ...run gauge...
+    """
+    START_TIMEOUT = 60
+
+    def __init__(self, browser, headless=True):
+        """
+        Args:
+            browser: Framework BROWSER value (chrome, chromium, edge, firefox, webkit)
+            headless: Launch the shared browser headless
+        """
+        self.browser = browser
+        self.headless = headless
+        self.ws_endpoint = None
+        self._process = None
+        self._config_path = None
+
+    def start(self, timeout=START_TIMEOUT):
+        """
+        Launch the server and wait for its websocket endpoint.
+        Returns:
+            str: ws:// endpoint to pass to BrowserType.connect()
+        Raises:
+            RuntimeError: If the server exits or prints no endpoint within the timeout
+        """
+        browser_type, channel = resolve_browser_type(self.browser)
+        options = {'headless': self.headless, 'host': '127.0.0.1'}
+        if channel:
+            options['channel'] = channel
+        if not self.headless and browser_type == 'chromium':
+            options['args'] = ['--start-maximized']
+        fd, self._config_path = tempfile.mkstemp(prefix='pw_server_', suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(options, f)
+
+        self._process = subprocess.Popen(
+            [sys.executable, '-m', 'playwright', 'launch-server', '--browser', browser_type, '--config', self._config_path],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        lines = queue.Queue()
+        threading.Thread(target=self._pump_output, args=(lines,), daemon=True).start()
+        output = []
+        while True:
+            try:
+                line = lines.get(timeout=timeout)
+            except queue.Empty:
+                self.stop()
+                raise RuntimeError(f"Browser server for {self.browser} did not start within {timeout}s")
+            if line is None:
+                self.stop()
+                raise RuntimeError(f"Browser server for {self.browser} exited:\n{''.join(output)}")
+            if line.strip().startswith('ws://'):
+                self.ws_endpoint = line.strip()
+                return self.ws_endpoint
+            output.append(line)
+
+    def stop(self):
+        """Shut the server (and its browser) down."""
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        if self._config_path and os.path.exists(self._config_path):
+            os.remove(self._config_path)
+        self._config_path = None
+
+    def _pump_output(self, lines):
+        # Keep draining stdout so the server never blocks on a full pipe
+        for line in self._process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
@@ -0,0 +1,236 @@
+"""
+Browser Session - Instance-scoped Playwright state
+A BrowserSession owns its Playwright driver, browser, context pool, current context and
+page, soft assertion errors and page objects. BasePage is a facade over the "current"
+session: the one bound to the running thread/context (contextvar), or the process-wide
+default session used by the Gauge hooks and steps.
+
+Example (N independent sessions in one process, each thread with its own sync Playwright):
+    with SessionExecutor(max_workers=4, settings=BasePage.get_settings()) as executor:
+        results = executor.map(run_login_check, rows)   # BasePage.* inside acts on the thread's session
+"""
+from concurrent.futures import Future
+from playwright.sync_api import sync_playwright
+from core.ContextPool import ContextPool
+from core.BrowserServer import resolve_browser_type
+from core.NetworkProfiles import NetworkProfiles
+from core.StaticAssetCache import StaticAssetCache
+import contextvars
+import queue
+import threading
+
+_current_session = contextvars.ContextVar('browser_session', default=None)
+
+
+class BrowserSession:
+    """
+    One browser session. Sync Playwright objects are bound to the thread that started
+    them, so a session must be started, used and closed on the same thread.
+    """
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, name="default"):
+        self.name = name
+        self.settings = None
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.context_pool = None
+        self.network_profile = None
+        self.soft_errors = []
+        self.page_objects = {}
+
+    # ====================================
+    # Current Session
+    # ====================================
+    @classmethod
+    def current(cls):
+        """Session bound to the running thread/context, else the process-wide default."""
+        session = _current_session.get()
+        if session is not None:
+            return session
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def activate(self):
+        """Bind this session as current for the running thread/context. Returns a reset token."""
+        return _current_session.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current_session.reset(token)
+
+    # ====================================
+    # Lifecycle
+    # ====================================
+    @property
+    def started(self):
+        return self.browser is not None
+
+    def start(self, settings):
+        """Start Playwright and launch the browser (or connect to the shared browser server)."""
+        if self.playwright is not None:
+            return self
+        self.settings = settings
+        self.playwright = sync_playwright().start()
+        browser_type = settings.browser
+        headless = settings.headless
+        slow_mo = settings.slow_mo
+        # Get browser
+        launch_args = ["--start-maximized"] if not headless else []
+        if settings.browser_ws_endpoint:
+            # Shared server started by the runner (BrowserServer) - connect instead of launching
+            engine, _ = resolve_browser_type(browser_type)
+            self.browser = getattr(self.playwright, engine).connect(settings.browser_ws_endpoint, slow_mo=slow_mo)
+        elif browser_type.lower() == 'firefox':
+            self.browser = self.playwright.firefox.launch(headless=headless, slow_mo=slow_mo)
+        elif browser_type.lower() == 'webkit':
+            self.browser = self.playwright.webkit.launch(headless=headless, slow_mo=slow_mo)
+        elif browser_type.lower() == 'edge':
+            self.browser = self.playwright.chromium.launch(channel="msedge", headless=headless, slow_mo=slow_mo, args=launch_args)
+        else:  # chromium (default)
+            self.browser = self.playwright.chromium.launch(channel="chrome", headless=headless, slow_mo=slow_mo, args=launch_args)
+        self.network_profile = NetworkProfiles.get_profile(settings.network_profile, settings.network_block_patterns)
+        self.context_pool = ContextPool(self.new_context, settings.context_pool_size, settings.context_pool_max_age)
+        self.context_pool.refill()
+        return self
+
+    def new_context(self):
+        """Create a fresh context with timeouts set and a page opened. Returns (context, page)."""
+        # Use no_viewport=True to allow the browser to control the size (needed for maximize)
+        context = self.browser.new_context(no_viewport=True)
+        # Set timeouts
+        context.set_default_timeout(self.settings.default_timeout)
+        context.set_default_navigation_timeout(self.settings.navigation_timeout)
+        # Routes registered later run first: network profile -> asset cache -> network.
+        # The asset cache stays off with HAR record/replay so HAR files hold real traffic.
+        if self.settings.static_cache and self.settings.har_mode == 'off':
+            StaticAssetCache.apply(context)
+        # Block/stub resources per NETWORK_PROFILE (before the first request)
+        NetworkProfiles.apply(context, self.network_profile, self.settings.network_learn_sizes)
+        # Create page
+        page = context.new_page()
+        return context, page
+
+    def create_context(self):
+        """Take a pre-warmed context from the pool and start with no soft errors."""
+        self.context, self.page = self.context_pool.acquire()
+        self.soft_errors = []
+
+    def close_context(self):
+        if self.context:
+            self.context.close()
+            self.context = None
+            self.page = None
+
+    def refill_context_pool(self):
+        if self.context_pool and self.browser:
+            self.context_pool.refill()
+
+    def close(self):
+        """Close the context, pool, browser and Playwright."""
+        if self.context:
+            self.context.close()
+        if self.context_pool:
+            self.context_pool.close()
+        if self.browser:
+            self.browser.close()
+        if self.playwright:
+            self.playwright.stop()
+        self.context = None
+        self.page = None
+        self.context_pool = None
+        self.browser = None
+        self.playwright = None
+        self.page_objects.clear()
+
+    def __enter__(self):
+        self._token = self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.deactivate(self._token)
+        return False
+
+
+class SessionExecutor:
+    """
+    Fixed pool of worker threads, each owning one BrowserSession for its whole life.
+    Every task runs with the worker's session as current and in a fresh context, so
+    BasePage / PageObjectManager calls inside the task are isolated per thread.
+    """
+    _STOP = object()
+
+    def __init__(self, max_workers, settings):
+        """
+        Args:
+            max_workers: Number of threads (= concurrent browser sessions)
+            settings: Settings used to start every session
+        """
+        self.settings = settings
+        self._tasks = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"browser-session-{i + 1}", daemon=True)
+            for i in range(max(int(max_workers), 1))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) on a session. Returns a concurrent.futures.Future."""
+        future = Future()
+        self._tasks.put((future, fn, args, kwargs))
+        return future
+
+    def map(self, fn, iterable):
+        """Run fn over the items concurrently; results in input order (exceptions re-raised)."""
+        futures = [self.submit(fn, item) for item in iterable]
+        return [f.result() for f in futures]
+
+    def shutdown(self):
+        """Finish queued tasks, then close every session on its own thread."""
+        for _ in self._threads:
+            self._tasks.put(self._STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _worker(self):
+        session = BrowserSession(name=threading.current_thread().name)
+        token = session.activate()
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is self._STOP:
+                    break
+                future, fn, args, kwargs = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    session.start(self.settings)
+                    session.create_context()
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+                finally:
+                    try:
+                        session.close_context()
+                        session.refill_context_pool()
+                    except Exception:
+                        pass
+        finally:
+            try:
+                session.close()
+            finally:
+                session.deactivate(token)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
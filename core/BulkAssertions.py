@@ -0,0 +1,202 @@
+"""
+Bulk Assertions - Many element/page expectations checked in one browser round trip
+The BasePage Playwright assertions (assert_element_visible, assert_text_equals, ...) make
+one IPC call each. BulkAssertions collects expectations for many selectors, reads every
+fact they need with a single page.evaluate and compares them in Python.
+
+Example:
+    report = (BasePage.bulk_assert()
+              .visible(Objectlocators.DASHBOARD_MENU)
+              .enabled(Objectlocators.LOGOUT_BUTTON)
+              .text_equals(Objectlocators.USER_PROFILE, "Admin")
+              .attribute_contains(Objectlocators.USER_PROFILE, "class", "active")
+              .url_contains("/dashboard")
+              .soft())                  # failures go to the soft-assertion collector
+    BasePage.assert_all_soft()
+"""
+from collections import namedtuple
+from core.BrowserSession import BrowserSession
+from core.EventLog import EventLog
+from core.SelectorScripts import RESOLVE_SELECTOR_JS
+
+Expectation = namedtuple('Expectation', 'kind selector name expected message')
+AssertionResult = namedtuple('AssertionResult', 'kind selector expected actual passed error')
+
+# Reads the fact each expectation needs. Selectors: CSS, "css=", XPath ("//", "(//", "xpath=").
+# Anything else is returned as unsupported and read with Playwright calls instead.
+_BULK_ASSERT_JS = """
+checks => {""" + RESOLVE_SELECTOR_JS + """
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return !!(rect.width && rect.height) && getComputedStyle(el).visibility !== 'hidden';
+    };
+    return checks.map(([kind, sel, name]) => {
+        if (kind === 'url') return {found: true, value: location.href};
+        if (kind === 'title') return {found: true, value: document.title};
+        let el;
+        try { el = resolve(sel); } catch (e) { return {unsupported: true}; }
+        if (!el) return {found: false, value: null};
+        let value;
+        if (kind === 'visible') value = isVisible(el);
+        else if (kind === 'enabled') value = !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+        else if (kind === 'text') value = el.textContent;
+        else if (kind === 'attribute') value = el.getAttribute(name);
+        return {found: true, value};
+    });
+}
+"""
+
+
+class BulkAssertionReport:
+    """Outcome of one BulkAssertions.check(): one AssertionResult per expectation."""
+
+    def __init__(self, results):
+        self.results = results
+
+    @property
+    def passed(self):
+        return all(r.passed for r in self.results)
+
+    @property
+    def failures(self):
+        return [r for r in self.results if not r.passed]
+
+    @property
+    def errors(self):
+        """Failure messages, worded like the single BasePage assertions."""
+        return [r.error for r in self.failures]
+
+    def to_dict(self):
+        return {
+            'total': len(self.results),
+            'passed': len(self.results) - len(self.failures),
+            'failed': len(self.failures),
+            'results': [r._asdict() for r in self.results],
+        }
+
+    def format(self):
+        lines = [f"Bulk assertions: {len(self.results) - len(self.failures)}/{len(self.results)} passed"]
+        lines += [f"  ✗ {error}" for error in self.errors]
+        return "\n".join(lines)
+
+
+class BulkAssertions:
+    """
+    Builder for expectations on one page. Methods return self so they can be chained;
+    check() runs them all in one round trip and returns a BulkAssertionReport.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self._expectations = []
+
+    # ====================================
+    # Expectations
+    # ====================================
+    def _add(self, kind, selector, expected, name=None, message=""):
+        self._expectations.append(Expectation(kind, selector, name, expected, message))
+        return self
+
+    def visible(self, selector, message=""):
+        return self._add('visible', selector, True, message=message)
+
+    def not_visible(self, selector, message=""):
+        return self._add('visible', selector, False, message=message)
+
+    def enabled(self, selector, message=""):
+        return self._add('enabled', selector, True, message=message)
+
+    def disabled(self, selector, message=""):
+        return self._add('enabled', selector, False, message=message)
+
+    def text_equals(self, selector, expected_text, message=""):
+        return self._add('text', selector, ('equals', expected_text), message=message)
+
+    def text_contains(self, selector, expected_text, message=""):
+        return self._add('text', selector, ('contains', expected_text), message=message)
+
+    def attribute_equals(self, selector, name, expected_value, message=""):
+        return self._add('attribute', selector, ('equals', expected_value), name, message)
+
+    def attribute_contains(self, selector, name, expected_value, message=""):
+        return self._add('attribute', selector, ('contains', expected_value), name, message)
+
+    def url_contains(self, expected_substring, message=""):
+        return self._add('url', None, ('contains', expected_substring), message=message)
+
+    def url_equals(self, expected_url, message=""):
+        return self._add('url', None, ('equals', expected_url), message=message)
+
+    def title_equals(self, expected_title, message=""):
+        return self._add('title', None, ('equals', expected_title), message=message)
+
+    # ====================================
+    # Evaluation
+    # ====================================
+    def check(self):
+        """Evaluate every expectation in one page.evaluate. Returns BulkAssertionReport."""
+        if not self._expectations:
+            return BulkAssertionReport([])
+        facts = self.page.evaluate(_BULK_ASSERT_JS, [[e.kind, e.selector or '', e.name] for e in self._expectations])
+        results = []
+        for expectation, fact in zip(self._expectations, facts):
+            if fact.get('unsupported'):
+                fact = self._read_with_playwright(expectation)
+            results.append(self._compare(expectation, fact))
+        for r in results:
+            EventLog.emit('assertion', assertion=f"bulk_{r.kind}", selector=r.selector, passed=r.passed,
+                          expected=r.expected, actual=r.actual)
+        return BulkAssertionReport(results)
+
+    def assert_all(self):
+        """Check and raise one AssertionError listing every failed expectation."""
+        report = self.check()
+        if not report.passed:
+            raise AssertionError(report.format())
+        return report
+
+    def soft(self):
+        """Check and add failures to the current session's soft errors (see BasePage.assert_all_soft)."""
+        report = self.check()
+        BrowserSession.current().soft_errors.extend(report.errors)
+        return report
+
+    def _read_with_playwright(self, e):
+        """Fallback for selectors only Playwright resolves (text=, role=, >> chains)."""
+        locator = self.page.locator(e.selector).first
+        if e.kind == 'visible':
+            return {'found': True, 'value': locator.is_visible()}
+        if locator.count() == 0:
+            return {'found': False, 'value': None}
+        if e.kind == 'enabled':
+            return {'found': True, 'value': locator.is_enabled()}
+        if e.kind == 'text':
+            return {'found': True, 'value': locator.text_content()}
+        return {'found': True, 'value': locator.get_attribute(e.name)}
+
+    @staticmethod
+    def _compare(e, fact):
+        actual = fact.get('value')
+        prefix = f"{e.message}: " if e.message else ""
+        if e.kind == 'visible':
+            passed = bool(actual) == e.expected
+            error = (f"{prefix}Element not visible - {e.selector}" if e.expected
+                     else f"{prefix}Element should not be visible - {e.selector}")
+            return AssertionResult(e.kind, e.selector, e.expected, bool(actual), passed, None if passed else error)
+        if not fact.get('found'):
+            return AssertionResult(e.kind, e.selector, e.expected, None, False, f"{prefix}Element not found - {e.selector}")
+        if e.kind == 'enabled':
+            passed = bool(actual) == e.expected
+            error = (f"{prefix}Element not enabled - {e.selector}" if e.expected
+                     else f"{prefix}Element should be disabled - {e.selector}")
+            return AssertionResult(e.kind, e.selector, e.expected, actual, passed, None if passed else error)
+        mode, expected = e.expected
+        what = {'url': "URL", 'title': "title", 'attribute': f"attribute '{e.name}'", 'text': "text"}[e.kind]
+        target = f" of {e.selector}" if e.selector else ""
+        if mode == 'equals':
+            passed = actual == expected
+            error = f"{prefix}Expected {what}{target} '{expected}', got '{actual}'"
+        else:
+            passed = actual is not None and expected in actual
+            error = f"{prefix}{what}{target} '{actual}' does not contain '{expected}'"
+        return AssertionResult(e.kind, e.selector, expected, actual, passed, None if passed else error)
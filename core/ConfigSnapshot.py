@@ -0,0 +1,186 @@
+"""
+Config Snapshot - Resolve the Environment configuration once and share it
+The runners (bulk/parallel runner, build.py) resolve the Environment sheet into a
+versioned JSON snapshot; every Gauge worker then loads the snapshot instead of
+discovering and parsing Excel again.
+"""
+from core.WorkbookCache import WorkbookCache
+from pathlib import Path
+import hashlib
+import json
+import os
+
+
+class ConfigSnapshot:
+    """
+    Single source for Environment sheet parsing and config file discovery,
+    plus the JSON snapshot shared between the runner and all Gauge workers.
+    """
+    SNAPSHOT_VERSION = 1
+    DEFAULT_ENV_SHEET = 'Environment'
+    BASE_DIR = Path(__file__).parent.parent
+    DEFAULT_SNAPSHOT_PATH = BASE_DIR / '.cache' / 'config_snapshot.json'
+
+    # ========================================================================
+    # RESOLUTION (Excel)
+    # ========================================================================
+    @classmethod
+    def resolve_config_path(cls, test_data_file=None):
+        """
+        Find the Excel file holding the Environment sheet.
+        Priority: ENV_CONFIG_FILE env var, TEST_DATA_FILE (argument or env var) when it
+        has an Environment sheet, then the first data/*.xlsx with an Environment sheet.
+        Returns:
+            Path: Config workbook path
+        Raises:
+            FileNotFoundError: If no config workbook can be found
+        """
+        config_file_env = os.getenv('ENV_CONFIG_FILE')
+        if config_file_env:
+            config_path = cls.BASE_DIR / config_file_env
+            if not config_path.exists():
+                raise FileNotFoundError(f"Environment config file specified in env var not found: {config_path}")
+            return config_path
+
+        data_dir = cls.BASE_DIR / 'data'
+        test_data_file = test_data_file or os.getenv('TEST_DATA_FILE')
+        if data_dir.exists():
+            if test_data_file:
+                possible_path = data_dir / test_data_file
+                if possible_path.exists() and cls._has_environment_sheet(possible_path):
+                    return possible_path
+            for file_path in sorted(data_dir.glob('*.xlsx')):
+                if file_path.name.startswith('~$'):  # Skip temporary files
+                    continue
+                if cls._has_environment_sheet(file_path):
+                    return file_path
+        raise FileNotFoundError(f"Could not find a valid configuration Excel file in {cls.BASE_DIR}/data/ with an 'Environment' sheet.")
+
+    @classmethod
+    def read_environment_sheet(cls, config_path, sheet_name=None):
+        """
+        Parse the Environment sheet into a {property: value} dictionary.
+        Values are stripped strings; empty cells become "".
+        """
+        sheet_name = sheet_name or cls.get_config_sheet()
+        if sheet_name not in WorkbookCache.get_sheet_names(config_path):
+            raise ValueError(f"Sheet '{sheet_name}' not found in {config_path}")
+        table = WorkbookCache.get_table(config_path, sheet_name, data_only=True)
+        config = {}
+        for row in table.rows:  # Header row is already split off
+            if row and row[0]:  # If property name exists
+                value = row[1] if len(row) > 1 else None
+                config[str(row[0]).strip()] = str(value).strip() if value is not None else ""
+        return config
+
+    @classmethod
+    def resolve(cls, test_data_file=None, write_snapshot=True):
+        """
+        Resolve the configuration from Excel and (by default) publish it as the snapshot.
+        Args:
+            test_data_file: TEST_DATA_FILE to try first (e.g. from default.properties)
+            write_snapshot: Write the snapshot file for Gauge workers to load
+        Returns:
+            tuple: (config dict, config file Path)
+        """
+        config_path = cls.resolve_config_path(test_data_file)
+        config = cls.read_environment_sheet(config_path)
+        if write_snapshot:
+            try:
+                cls.write(config, config_path, test_data_file)
+            except Exception as e:
+                print(f"Warning: Could not write config snapshot: {e}")
+        return config, config_path
+
+    @staticmethod
+    def get_config_sheet():
+        return os.getenv('ENV_CONFIG_SHEET', ConfigSnapshot.DEFAULT_ENV_SHEET)
+
+    # ========================================================================
+    # SNAPSHOT (JSON)
+    # ========================================================================
+    @classmethod
+    def get_snapshot_path(cls):
+        return Path(os.getenv('CONFIG_SNAPSHOT_FILE') or cls.DEFAULT_SNAPSHOT_PATH)
+
+    @classmethod
+    def write(cls, config, config_path, test_data_file=None, snapshot_path=None):
+        """
+        Write a snapshot of a resolved configuration (atomic replace).
+        Args:
+            config: Resolved {property: value} dictionary
+            config_path: Workbook the config was read from
+            test_data_file: TEST_DATA_FILE used for resolution (defaults to the env var)
+            snapshot_path: Target file, defaults to CONFIG_SNAPSHOT_FILE or .cache/config_snapshot.json
+        Returns:
+            Path: Snapshot file path
+        """
+        snapshot_path = Path(snapshot_path or cls.get_snapshot_path())
+        stat = os.stat(config_path)
+        payload = {
+            'version': cls.SNAPSHOT_VERSION,
+            'source': str(Path(config_path).resolve()),
+            'sheet': cls.get_config_sheet(),
+            'env_config_file': os.getenv('ENV_CONFIG_FILE') or '',
+            'test_data_file': test_data_file or os.getenv('TEST_DATA_FILE') or '',
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'sha256': cls._hash_file(config_path),
+            'config': config,
+        }
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, snapshot_path)
+        return snapshot_path
+
+    @classmethod
+    def load(cls, snapshot_path=None):
+        """
+        Load the snapshot if it exists and still matches its source workbook.
+        Returns:
+            dict: Snapshot payload ('config', 'source', ...), or None if missing or stale
+        """
+        snapshot_path = Path(snapshot_path or cls.get_snapshot_path())
+        try:
+            with open(snapshot_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return payload if cls._is_fresh(payload) else None
+
+    @classmethod
+    def _is_fresh(cls, payload):
+        if payload.get('version') != cls.SNAPSHOT_VERSION:
+            return False
+        # Selection inputs must match what this process would resolve
+        if payload.get('sheet') != cls.get_config_sheet():
+            return False
+        if payload.get('env_config_file') != (os.getenv('ENV_CONFIG_FILE') or ''):
+            return False
+        test_data_file = os.getenv('TEST_DATA_FILE')
+        if test_data_file and test_data_file not in (payload.get('test_data_file'), Path(payload.get('source', '')).name):
+            return False
+        try:
+            stat = os.stat(payload['source'])
+        except (OSError, KeyError):
+            return False
+        if stat.st_mtime == payload.get('mtime') and stat.st_size == payload.get('size'):
+            return True
+        return stat.st_size == payload.get('size') and cls._hash_file(payload['source']) == payload.get('sha256')
+
+    @staticmethod
+    def _has_environment_sheet(file_path):
+        try:
+            return 'Environment' in WorkbookCache.get_sheet_names(file_path)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _hash_file(file_path):
+        sha = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
@@ -0,0 +1,111 @@
+"""
+Context Pool - Pre-warmed, isolated browser contexts
+Keeps N fresh contexts (each with a page already open) ready ahead of demand so
+before_scenario only has to take one, and records per-scenario setup latency.
+"""
+from collections import deque
+import time
+
+
+class ContextPool:
+    """
+    Pool of fresh browser contexts created by a factory.
+    Contexts are never reused: a scenario takes one, closes it when done and the pool
+    is topped up again (refill runs after the scenario, off its setup path).
+    Playwright's sync API is bound to the thread that created it, so refills happen on
+    that thread between scenarios rather than on a background thread.
+    With size 0 the pool is a pass-through that still records setup timings.
+    """
+
+    def __init__(self, factory, size=0, max_age=300):
+        """
+        Args:
+            factory: Callable returning a (context, page) tuple
+            size: Number of contexts to keep ready (0 disables pre-warming)
+            max_age: Seconds after which an idle context is discarded instead of used
+        """
+        self._factory = factory
+        self.size = max(int(size or 0), 0)
+        self.max_age = max_age
+        self._idle = deque()   # (created_at, context, page)
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'created': 0,
+                      'acquire_ms': [], 'refill_ms': []}
+
+    @property
+    def enabled(self):
+        return self.size > 0
+
+    def acquire(self):
+        """
+        Take a ready context, or create one if none is available.
+        Returns:
+            tuple: (context, page)
+        """
+        start = time.perf_counter()
+        self._discard_expired()
+        if self._idle:
+            _, context, page = self._idle.popleft()
+            self.stats['hits'] += 1
+        else:
+            context, page = self._create()
+            self.stats['misses'] += 1
+        self.stats['acquire_ms'].append((time.perf_counter() - start) * 1000)
+        return context, page
+
+    def refill(self):
+        """Top the pool up to its configured size."""
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        self._discard_expired()
+        created = 0
+        while len(self._idle) < self.size:
+            context, page = self._create()
+            self._idle.append((time.monotonic(), context, page))
+            created += 1
+        if created:
+            self.stats['refill_ms'].append((time.perf_counter() - start) * 1000)
+
+    def close(self):
+        """Close every idle context."""
+        while self._idle:
+            _, context, _ = self._idle.popleft()
+            self._safe_close(context)
+
+    def format_stats(self):
+        """Summary line of setup latency and pool usage for the suite timing output."""
+        acquire = self.stats['acquire_ms']
+        if not acquire:
+            return "Context setup: no scenarios"
+        avg = sum(acquire) / len(acquire)
+        p95 = sorted(acquire)[min(int(len(acquire) * 0.95), len(acquire) - 1)]
+        line = f"Context setup: {len(acquire)} scenarios, avg {avg:.1f} ms, p95 {p95:.1f} ms"
+        if self.enabled:
+            refill = self.stats['refill_ms']
+            refill_avg = sum(refill) / len(refill) if refill else 0.0
+            line += (f" (pool size {self.size}: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+                     f"{self.stats['expired']} expired, refill avg {refill_avg:.1f} ms)")
+        else:
+            line += " (context pool disabled)"
+        return line
+
+    def _create(self):
+        context, page = self._factory()
+        self.stats['created'] += 1
+        return context, page
+
+    def _discard_expired(self):
+        if self.max_age is None:
+            return
+        now = time.monotonic()
+        while self._idle and now - self._idle[0][0] > self.max_age:
+            _, context, _ = self._idle.popleft()
+            self.stats['expired'] += 1
+            self._safe_close(context)
+
+    @staticmethod
+    def _safe_close(context):
+        try:
+            context.close()
+        except Exception:
+            pass
@@ -0,0 +1,183 @@
+"""
+Event Log - Structured JSONL event stream written by a background thread
+Hooks and helpers emit scenario, step, action, assertion and artifact events onto an
+in-process queue; a writer thread drains it into one JSONL file per Gauge worker, so
+no hook blocks on disk I/O and parallel streams never interleave lines. At suite end
+the worker files of the run are merged into events.jsonl and the text error log is
+rendered from the step failure events.
+
+Layout:
+    logs/events/<run id>/events_<pid>.jsonl      one file per worker process
+    logs/events/<run id>/events.jsonl            merged, ordered by time
+    logs/events/<run id>/execution_errors.log    failed steps of the run
+The run id is EVENT_RUN_ID if set (yml/parallelgauge_runner.py sets one for all
+browsers), otherwise the parent (gauge) process id, which all parallel streams of one
+gauge run share. Only the newest EVENT_LOG_KEEP_RUNS run folders are kept.
+"""
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+
+
+class EventLog:
+    """
+    Process-wide event stream. emit() only enqueues; the writer thread batches lines and
+    flushes the file at most every FLUSH_INTERVAL seconds. Events emitted before start()
+    or after stop() are dropped.
+    """
+    BASE_DIR = Path(__file__).parent.parent / 'logs'
+    FLUSH_INTERVAL = 1.0
+    DEFAULT_KEEP_RUNS = 20
+    _STOP = object()
+    _queue = queue.Queue()
+    _thread = None
+    _path = None
+    _context = {}
+    _seq = 0
+    _seq_lock = threading.Lock()
+
+    @classmethod
+    def get_run_dir(cls):
+        run_id = os.environ.get('EVENT_RUN_ID') or f"gauge-{os.getppid()}"
+        return cls.BASE_DIR / 'events' / run_id
+
+    # ====================================
+    # Writer Lifecycle
+    # ====================================
+    @classmethod
+    def start(cls, keep_runs=DEFAULT_KEEP_RUNS):
+        """Open this worker's JSONL file, start the writer thread and prune old run folders."""
+        if cls._thread is not None:
+            return cls._path
+        run_dir = cls.get_run_dir()
+        run_dir.mkdir(parents=True, exist_ok=True)
+        cls.prune(keep_runs, current=run_dir)
+        cls._path = run_dir / f"events_{os.getpid()}.jsonl"
+        cls._thread = threading.Thread(target=cls._writer, args=(cls._path,), name="event-log-writer", daemon=True)
+        cls._thread.start()
+        return cls._path
+
+    @classmethod
+    def stop(cls):
+        """Write everything still queued and stop the writer thread."""
+        if cls._thread is None:
+            return
+        cls._queue.put(cls._STOP)
+        cls._thread.join()
+        cls._thread = None
+
+    @classmethod
+    def prune(cls, keep_runs, current=None):
+        """Delete all but the newest keep_runs run folders (the current run is always kept)."""
+        runs_dir = cls.BASE_DIR / 'events'
+        if not runs_dir.exists():
+            return
+        runs = sorted((d for d in runs_dir.iterdir() if d.is_dir() and d != current),
+                      key=lambda d: d.stat().st_mtime, reverse=True)
+        for old in runs[max(keep_runs - 1, 0):]:
+            shutil.rmtree(old, ignore_errors=True)  # Another worker may be pruning the same folder
+
+    @classmethod
+    def _writer(cls, path):
+        with open(path, 'a', encoding='utf-8') as f:
+            last_flush = time.monotonic()
+            while True:
+                try:
+                    event = cls._queue.get(timeout=cls.FLUSH_INTERVAL)
+                except queue.Empty:
+                    event = None
+                if event is cls._STOP:
+                    break
+                if event is not None:
+                    f.write(json.dumps(event, default=str) + "\n")
+                if time.monotonic() - last_flush >= cls.FLUSH_INTERVAL:
+                    f.flush()
+                    last_flush = time.monotonic()
+
+    # ====================================
+    # Emitting
+    # ====================================
+    @classmethod
+    def set_context(cls, **fields):
+        """Fields added to every following event (e.g. scenario, spec); None clears them."""
+        cls._context = {k: v for k, v in {**cls._context, **fields}.items() if v is not None}
+
+    @classmethod
+    def clear_context(cls):
+        cls._context = {}
+
+    @classmethod
+    def emit(cls, event_type, **fields):
+        """Queue one event (non-blocking)."""
+        if cls._thread is None:
+            return
+        with cls._seq_lock:
+            cls._seq += 1
+            seq = cls._seq
+        cls._queue.put({'ts': time.time(), 'type': event_type, 'worker': os.getpid(), 'seq': seq,
+                        **cls._context, **fields})
+
+    # ====================================
+    # Merge & Render
+    # ====================================
+    @classmethod
+    def merge(cls, run_dir=None):
+        """
+        Combine the worker files of a run into events.jsonl (ordered by time) and render the
+        run's execution_errors.log from it. Both files live in the run folder, so other runs
+        are never overwritten. Safe to call from every worker: each call rewrites both files
+        atomically, so the last worker of the run to finish leaves the complete result.
+        Returns:
+            Path: Merged events file, or None if the run has no events
+        """
+        run_dir = Path(run_dir) if run_dir else cls.get_run_dir()
+        events = []
+        for path in sorted(run_dir.glob('events_*.jsonl')):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        continue  # Partial last line of a worker that is still writing
+        if not events:
+            return None
+        events.sort(key=lambda e: (e.get('ts', 0), e.get('worker', 0), e.get('seq', 0)))
+        merged_path = run_dir / 'events.jsonl'
+        cls._atomic_write(merged_path, "".join(json.dumps(e, default=str) + "\n" for e in events))
+        cls._atomic_write(run_dir / 'execution_errors.log', cls.render_errors(events))
+        return merged_path
+
+    @staticmethod
+    def render_errors(events):
+        """Text error log (the former execution_errors.log format) from failed step events."""
+        blocks = []
+        for e in events:
+            if e.get('type') != 'step' or e.get('status') != 'failed':
+                continue
+            timestamp = datetime.fromtimestamp(e['ts']).strftime("%Y-%m-%d %H:%M:%S")
+            blocks.append(
+                "\n" + "=" * 70 + "\n"
+                f"EXECUTION ERROR - {timestamp}\n"
+                + "=" * 70 + "\n"
+                f"Step: {e.get('step', '')}\n"
+                f"Scenario: {e.get('scenario', '')}\n"
+                f"Spec: {e.get('spec', '')}\n"
+                f"Tags: {', '.join(e.get('tags') or [])}\n"
+                f"Error: {e.get('error', '')}\n"
+                + "-" * 70 + "\n"
+                f"Stack Trace:\n{e.get('stack_trace', '')}\n"
+                + "=" * 70 + "\n\n")
+        return "".join(blocks)
+
+    @staticmethod
+    def _atomic_write(path, text):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
@@ -0,0 +1,70 @@
+"""
+HAR Manager - Record and replay scenario network traffic
+HAR_MODE=record saves each scenario's traffic to <HAR_DIR>/<spec>/<scenario>.har;
+HAR_MODE=replay serves responses from that file with route_from_har, so UI regression
+runs offline and backend latency stays out of front-end timings.
+"""
+from pathlib import Path
+import re
+from core.EventLog import EventLog
+
+
+class HarManager:
+    """
+    Attaches HAR recording/replay to a scenario's context.
+    Applied after the context is taken from the pool (the HAR file depends on the
+    scenario), and registered after the network profile route so it is consulted first.
+    """
+    MODES = ('off', 'record', 'replay')
+    BASE_DIR = Path(__file__).parent.parent
+    _stats = {'recorded': 0, 'replayed': 0, 'missing': 0}
+
+    @classmethod
+    def get_har_path(cls, har_dir, spec_file, scenario_name):
+        """HAR file for a scenario: <HAR_DIR>/<spec file stem>/<scenario name>.har"""
+        har_dir = Path(har_dir)
+        if not har_dir.is_absolute():
+            har_dir = cls.BASE_DIR / har_dir
+        spec = Path(spec_file).stem if spec_file else 'default'
+        return har_dir / cls._slug(spec) / f"{cls._slug(scenario_name) or 'scenario'}.har"
+
+    @classmethod
+    def attach(cls, context, settings, spec_file, scenario_name):
+        """
+        Start recording into, or replaying from, the scenario's HAR file.
+        Returns:
+            Path: HAR file in use, or None (mode off, or missing HAR with HAR_NOT_FOUND=fallback)
+        Raises:
+            FileNotFoundError: Replay mode, no HAR for the scenario and HAR_NOT_FOUND=abort
+        """
+        mode = settings.har_mode
+        if mode == 'off':
+            return None
+        har_path = cls.get_har_path(settings.har_dir, spec_file, scenario_name)
+        url_filter = settings.har_url_filter or None
+        if mode == 'record':
+            har_path.parent.mkdir(parents=True, exist_ok=True)
+            # Written when the context closes; content embedded so one file holds the scenario
+            context.route_from_har(har_path, url=url_filter, update=True, update_content='embed')
+            cls._stats['recorded'] += 1
+            EventLog.emit('artifact', kind='har', path=str(har_path))
+            return har_path
+        if not har_path.exists():
+            cls._stats['missing'] += 1
+            if settings.har_not_found == 'abort':
+                raise FileNotFoundError(f"HAR_MODE=replay but no HAR recorded for this scenario: {har_path} "
+                                        f"(run once with HAR_MODE=record, or set HAR_NOT_FOUND=fallback)")
+            return None
+        # not_found: 'abort' fails unmatched requests fast, 'fallback' lets them reach the network
+        context.route_from_har(har_path, url=url_filter, not_found=settings.har_not_found)
+        cls._stats['replayed'] += 1
+        return har_path
+
+    @classmethod
+    def format_stats(cls):
+        s = cls._stats
+        return f"HAR: {s['recorded']} recorded, {s['replayed']} replayed, {s['missing']} missing"
+
+    @staticmethod
+    def _slug(name):
+        return re.sub(r'[^A-Za-z0-9_.-]+', '_', name or '').strip('_')[:80]
@@ -0,0 +1,174 @@
+"""
+Network Profiles - Block or stub resources the functional checks never look at
+A named profile (NETWORK_PROFILE in the Environment sheet) installs one context-level
+route that aborts unneeded resource types (images, media, fonts, ...) and answers
+analytics/telemetry requests with an empty stub, so pages reach 'load' sooner.
+
+Profiles:
+    off      - no routing, no listeners (default)
+    lean     - block images, media and fonts; stub analytics/telemetry
+    minimal  - lean + block stylesheets
+Extra URL regexes to block can be added with NETWORK_BLOCK_PATTERNS.
+NETWORK_LEARN_SIZES records response sizes for the bytes-avoided estimates (opt-in).
+"""
+from collections import namedtuple, defaultdict
+from pathlib import Path
+import json
+import os
+import re
+import threading
+
+NetworkProfile = namedtuple('NetworkProfile', 'name block_types block_patterns stub_patterns')
+
+# Third-party analytics, tag managers and error telemetry (stubbed, not aborted,
+# so page scripts that wait on them keep working)
+TELEMETRY_PATTERNS = (
+    r'google-analytics\.com', r'googletagmanager\.com', r'doubleclick\.net', r'connect\.facebook\.net',
+    r'hotjar\.com', r'segment\.(io|com)', r'mixpanel\.com', r'clarity\.ms', r'optimizely\.com',
+    r'nr-data\.net', r'newrelic\.com', r'backtrace\.io', r'sentry\.io',
+)
+
+PROFILES = {
+    'off': NetworkProfile('off', (), (), ()),
+    'lean': NetworkProfile('lean', ('image', 'media', 'font'), (), TELEMETRY_PATTERNS),
+    'minimal': NetworkProfile('minimal', ('image', 'media', 'font', 'stylesheet'), (), TELEMETRY_PATTERNS),
+}
+
+# Stub bodies per resource type (valid, empty responses)
+_STUBS = {
+    'script': ('application/javascript', ''),
+    'xhr': ('application/json', '{}'),
+    'fetch': ('application/json', '{}'),
+    'stylesheet': ('text/css', ''),
+}
+
+
+class NetworkProfiles:
+    """
+    Installs routing profiles on browser contexts and keeps per-profile counters.
+    Bytes avoided are estimated from response sizes (Content-Length) learned in runs
+    with NETWORK_LEARN_SIZES=true (typically with NETWORK_PROFILE=off, so every resource
+    loads); the sizes are kept in .cache/network/resource_sizes.json across runs.
+    """
+    SIZES_PATH = Path(__file__).parent.parent / '.cache' / 'network' / 'resource_sizes.json'
+    MAX_SIZES = 20000
+    _lock = threading.Lock()
+    _sizes = None
+    _sizes_dirty = False
+    _stats = defaultdict(lambda: {'requests': 0, 'blocked': 0, 'stubbed': 0, 'bytes_avoided': 0,
+                                  'sized': 0, 'by_type': defaultdict(int)})
+
+    @classmethod
+    def get_profile(cls, name, extra_block_patterns=()):
+        """
+        Resolve a profile by name, adding extra URL regexes to block.
+        Raises:
+            ValueError: If the profile name is unknown
+        """
+        name = (name or 'off').lower()
+        if name not in PROFILES:
+            raise ValueError(f"Unknown NETWORK_PROFILE '{name}'. Use one of: {', '.join(PROFILES)}")
+        profile = PROFILES[name]
+        if extra_block_patterns:
+            profile = profile._replace(block_patterns=profile.block_patterns + tuple(extra_block_patterns))
+        return profile
+
+    @classmethod
+    def apply(cls, context, profile, learn_sizes=False):
+        """
+        Install the profile's route handler on a context; with learn_sizes, also record
+        response sizes. A profile without rules and without learning touches nothing.
+        Unmatched requests fall back to handlers registered earlier (HAR, asset cache).
+        """
+        if learn_sizes:
+            cls._load_sizes()
+            context.on('response', cls._learn_size)
+        if not (profile.block_types or profile.block_patterns or profile.stub_patterns):
+            return
+        cls._load_sizes()
+        block_types = frozenset(profile.block_types)
+        block_re = re.compile('|'.join(profile.block_patterns)) if profile.block_patterns else None
+        stub_re = re.compile('|'.join(profile.stub_patterns)) if profile.stub_patterns else None
+        stats = cls._stats[profile.name]
+
+        def handle(route, request):
+            url = request.url
+            resource_type = request.resource_type
+            action = None
+            if stub_re and stub_re.search(url):
+                action = 'stubbed'
+            elif resource_type in block_types or (block_re and block_re.search(url)):
+                action = 'blocked'
+            with cls._lock:
+                stats['requests'] += 1
+                if action:
+                    stats[action] += 1
+                    stats['by_type'][resource_type] += 1
+                    size = cls._sizes.get(url)
+                    if size:
+                        stats['bytes_avoided'] += size
+                        stats['sized'] += 1
+            if action == 'stubbed':
+                content_type, body = _STUBS.get(resource_type, ('text/plain', ''))
+                route.fulfill(status=200, content_type=content_type, body=body)
+            elif action == 'blocked':
+                route.abort('blockedbyclient')
+            else:
+                route.fallback()
+
+        context.route('**/*', handle)
+
+    @classmethod
+    def _learn_size(cls, response):
+        length = response.headers.get('content-length')
+        if not length or not length.isdigit():
+            return
+        with cls._lock:
+            if len(cls._sizes) < cls.MAX_SIZES and cls._sizes.get(response.url) != int(length):
+                cls._sizes[response.url] = int(length)
+                cls._sizes_dirty = True
+
+    @classmethod
+    def _load_sizes(cls):
+        if cls._sizes is not None:
+            return
+        with cls._lock:
+            if cls._sizes is None:
+                try:
+                    with open(cls.SIZES_PATH, 'r', encoding='utf-8') as f:
+                        cls._sizes = json.load(f)
+                except (OSError, ValueError):
+                    cls._sizes = {}
+
+    @classmethod
+    def save_sizes(cls):
+        """Persist learned resource sizes (atomic replace)."""
+        with cls._lock:
+            if not cls._sizes_dirty:
+                return
+            cls.SIZES_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cls.SIZES_PATH.with_name(f"{cls.SIZES_PATH.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cls._sizes, f)
+            os.replace(tmp_path, cls.SIZES_PATH)
+            cls._sizes_dirty = False
+
+    @classmethod
+    def get_stats(cls):
+        with cls._lock:
+            return {name: dict(s, by_type=dict(s['by_type'])) for name, s in cls._stats.items()}
+
+    @classmethod
+    def format_stats(cls):
+        """One line per profile: requests seen, avoided by type and bytes avoided."""
+        lines = []
+        for name, s in cls.get_stats().items():
+            avoided = s['blocked'] + s['stubbed']
+            by_type = ", ".join(f"{t} {n}" for t, n in sorted(s['by_type'].items(), key=lambda kv: -kv[1]))
+            line = (f"Network profile '{name}': {avoided}/{s['requests']} requests avoided "
+                    f"({s['blocked']} blocked, {s['stubbed']} stubbed"
+                    f"{': ' + by_type if by_type else ''})")
+            if avoided:
+                line += f", ~{s['bytes_avoided'] / 1024:.0f} KB avoided (size known for {s['sized']}/{avoided})"
+            lines.append(line)
+        return "\n".join(lines) if lines else "Network profile: no requests routed"
@@ -0,0 +1,217 @@
+"""
+Page Metrics - Navigation Timing and paint metrics after BasePage.navigate_to (opt-in, PERF_METRICS)
+One page.evaluate reads TTFB, DOMContentLoaded and load from the navigation entry and
+FCP/LCP from the paint entries (LCP is Chromium-only; other browsers report None).
+Measurements are exported per worker to reports/page_metrics_<pid>.json and emitted as
+'page_metrics' events; at suite end they are collected from the merged event log into
+logs/events/<run id>/page_metrics.json, one file per run across all workers.
+
+Budgets come from a sheet of the test data workbook (PERF_BUDGET_SHEET):
+    URL          | TTFB | DCL  | LOAD | FCP  | LCP  | MODE
+    /dashboard   | 800  |      | 4000 | 1800 | 2500 | hard
+    *            | 1500 |      | 8000 |      |      |
+Limits are milliseconds; empty cells are not checked. URL matches as a substring of the
+navigated URL (the longest match wins, "*" matches everything). MODE overrides
+PERF_BUDGET_MODE for the row: hard fails the step, soft adds to the soft assertions.
+"""
+from collections import namedtuple
+from pathlib import Path
+import json
+import threading
+import time
+from core.EventLog import EventLog
+from core.ReportFiles import export_json, write_json
+
+METRICS = ('ttfb', 'dom_content_loaded', 'load', 'fcp', 'lcp')
+# Budget sheet headers accepted for each metric (upper-cased, spaces as underscores)
+_HEADERS = {
+    'TTFB': 'ttfb', 'DCL': 'dom_content_loaded', 'DOMCONTENTLOADED': 'dom_content_loaded',
+    'DOM_CONTENT_LOADED': 'dom_content_loaded', 'LOAD': 'load', 'FCP': 'fcp', 'LCP': 'lcp',
+}
+
+Budget = namedtuple('Budget', 'pattern limits mode')
+
+# Times are ms relative to navigation start; 0 means "not reached yet" and is returned as null.
+# LCP is only exposed through a buffered PerformanceObserver, which reports asynchronously.
+_PAGE_METRICS_JS = """
+() => new Promise(resolve => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = performance.getEntriesByName('first-contentful-paint')[0];
+    const ms = v => (v > 0 ? Math.round(v) : null);
+    const result = {
+        ttfb: nav ? ms(nav.responseStart) : null,
+        dom_content_loaded: nav ? ms(nav.domContentLoadedEventEnd) : null,
+        load: nav ? ms(nav.loadEventEnd) : null,
+        fcp: paint ? ms(paint.startTime) : null,
+        lcp: null,
+    };
+    if (!(PerformanceObserver.supportedEntryTypes || []).includes('largest-contentful-paint')) {
+        resolve(result);
+        return;
+    }
+    const observer = new PerformanceObserver(list => {
+        const entries = list.getEntries();
+        result.lcp = ms(entries[entries.length - 1].startTime);
+    });
+    observer.observe({type: 'largest-contentful-paint', buffered: true});
+    setTimeout(() => { observer.disconnect(); resolve(result); }, 50);
+})
+"""
+
+
+class PageMetrics:
+    """Collects per-navigation metrics and checks them against the budget sheet."""
+    _lock = threading.Lock()
+    _records = []
+    _budgets = None
+
+    # ====================================
+    # Collection
+    # ====================================
+    @classmethod
+    def collect(cls, page, url):
+        """
+        Read the metrics of the page just navigated to.
+        Args:
+            page: Playwright page
+            url: URL passed to navigate_to (recorded with the final page URL)
+        Returns:
+            dict: {metric: ms or None} for every name in METRICS
+        """
+        metrics = page.evaluate(_PAGE_METRICS_JS)
+        record = {'ts': time.time(), 'url': url, 'page_url': page.url, **metrics}
+        with cls._lock:
+            cls._records.append(record)
+        EventLog.emit('page_metrics', **{k: v for k, v in record.items() if k != 'ts'})
+        return metrics
+
+    @staticmethod
+    def format_metrics(metrics):
+        return ", ".join(f"{name} {metrics[name]} ms" if metrics.get(name) is not None else f"{name} n/a"
+                         for name in METRICS)
+
+    # ====================================
+    # Budgets
+    # ====================================
+    @classmethod
+    def load_budgets(cls, rows, default_mode='soft'):
+        """
+        Parse budget sheet rows (dicts keyed by header). Cached until clear_budgets().
+        Raises:
+            ValueError: If a limit is not a number or MODE is not hard/soft
+        """
+        budgets = []
+        for row in rows:
+            row = {str(k).strip().upper().replace(' ', '_'): v for k, v in row.items() if k is not None}
+            pattern = str(row.get('URL') or '').strip()
+            if not pattern:
+                continue
+            limits = {}
+            for header, metric in _HEADERS.items():
+                value = row.get(header)
+                if value is None or str(value).strip() == "":
+                    continue
+                try:
+                    limits[metric] = float(value)
+                except ValueError:
+                    raise ValueError(f"Performance budget for '{pattern}': {header} must be a number of ms, got '{value}'")
+            mode = str(row.get('MODE') or default_mode).strip().lower()
+            if mode not in ('hard', 'soft'):
+                raise ValueError(f"Performance budget for '{pattern}': MODE must be hard or soft, got '{mode}'")
+            budgets.append(Budget(pattern, limits, mode))
+        cls._budgets = budgets
+        return budgets
+
+    @classmethod
+    def has_budgets(cls):
+        return cls._budgets is not None
+
+    @classmethod
+    def clear_budgets(cls):
+        cls._budgets = None
+
+    @classmethod
+    def find_budget(cls, url):
+        """Most specific budget whose URL pattern occurs in url ("*" as the fallback), or None."""
+        best = None
+        for budget in cls._budgets or ():
+            if budget.pattern == '*' or budget.pattern in url:
+                specificity = -1 if budget.pattern == '*' else len(budget.pattern)
+                if best is None or specificity > best[0]:
+                    best = (specificity, budget)
+        return best[1] if best else None
+
+    @classmethod
+    def check_budget(cls, url, metrics):
+        """
+        Compare metrics with the budget for url.
+        Returns:
+            tuple: (Budget or None, list of violation messages)
+        """
+        budget = cls.find_budget(url)
+        if budget is None:
+            return None, []
+        violations = []
+        for metric, limit in budget.limits.items():
+            actual = metrics.get(metric)
+            if actual is not None and actual > limit:
+                violations.append(f"Performance budget exceeded on {url}: {metric} {actual:.0f} ms > {limit:.0f} ms "
+                                  f"(budget '{budget.pattern}')")
+        return budget, violations
+
+    # ====================================
+    # Report
+    # ====================================
+    @classmethod
+    def export(cls, path=None):
+        """
+        Write this worker's measurements to its report (see ReportFiles.export_json).
+        Returns the path, or None if nothing was measured.
+        """
+        with cls._lock:
+            records = list(cls._records)
+        return export_json('page_metrics', records, path)
+
+    @classmethod
+    def merge(cls, run_dir=None):
+        """
+        Write page_metrics.json into the run's event folder: the 'page_metrics' events of
+        every worker, taken from the merged events.jsonl (call after EventLog.merge).
+        Returns:
+            Path: Per-run metrics file, or None if the run measured no navigation
+        """
+        events_path = Path(run_dir or EventLog.get_run_dir()) / 'events.jsonl'
+        if not events_path.exists():
+            return None
+        records = []
+        with open(events_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                event = json.loads(line)
+                if event.get('type') == 'page_metrics':
+                    records.append({k: v for k, v in event.items() if k not in ('type', 'seq')})
+        if not records:
+            return None
+        return write_json(events_path.with_name('page_metrics.json'), records)
+
+    @classmethod
+    def format_stats(cls, top=5):
+        """Navigation count plus the URLs with the slowest average load."""
+        with cls._lock:
+            records = list(cls._records)
+        if not records:
+            return "Page metrics: none"
+        by_url = {}
+        for r in records:
+            by_url.setdefault(r['url'], []).append(r)
+        lines = [f"Page metrics: {len(records)} navigations, {len(by_url)} URLs"]
+
+        def average(rows, metric):
+            values = [r[metric] for r in rows if r.get(metric) is not None]
+            return sum(values) / len(values) if values else None
+
+        ranked = sorted(by_url.items(), key=lambda kv: -(average(kv[1], 'load') or 0))
+        for url, rows in ranked[:top]:
+            averages = {metric: average(rows, metric) for metric in METRICS}
+            values = ", ".join(f"{m} {v:.0f}" for m, v in averages.items() if v is not None)
+            lines.append(f"  {url}: {len(rows)}x, avg {values} ms")
+        return "\n".join(lines)
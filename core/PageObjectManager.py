@@ -2,12 +2,19 @@
 Page Object Manager - Centralized management for all page objects
 Provides a common pattern for creating and accessing page object instances
 """
+from core.BrowserSession import BrowserSession
+
+
 class PageObjectManager:
     """
     Singleton manager for all page objects in the framework.
-    Ensures only one instance of each page object exists during test execution.
+    Ensures only one instance of each page object exists per browser session
+    (page objects are stored on the current BrowserSession).
     """
-    _instances = {}
+
+    @classmethod
+    def _instances(cls):
+        return BrowserSession.current().page_objects
     
     @classmethod
     def get_page(cls, page_class):
@@ -22,9 +29,10 @@ class PageObjectManager:
             employee_page = PageObjectManager.get_page(EmployeeCreation)
         """
         class_name = page_class.__name__
-        if class_name not in cls._instances:
-            cls._instances[class_name] = page_class()
-        return cls._instances[class_name]
+        instances = cls._instances()
+        if class_name not in instances:
+            instances[class_name] = page_class()
+        return instances[class_name]
     
     @classmethod
     def reset_page(cls, page_class):
@@ -35,8 +43,7 @@ class PageObjectManager:
             page_class: The page object class to reset
         """
         class_name = page_class.__name__
-        if class_name in cls._instances:
-            del cls._instances[class_name]
+        cls._instances().pop(class_name, None)
     
     @classmethod
     def reset_all(cls):
@@ -44,4 +51,4 @@ class PageObjectManager:
         Reset all page object instances.
         Typically called in hooks (e.g., before_scenario or after_scenario).
         """
-        cls._instances.clear()
+        cls._instances().clear()
@@ -0,0 +1,227 @@
+"""
+Playwright Profiler - Call-level timing of Page/Locator calls (opt-in, PLAYWRIGHT_PROFILER)
+BasePage.get_page() and WebElementHelper wrap the page in a ProfiledPage; locators it
+creates are ProfiledLocators that remember their selector. Every browser call records
+method, selector, duration and outcome into a preallocated ring buffer per (method, selector),
+and the calling helper is counted so chatty helpers stand out.
+Explicit wait time is the duration of wait_* calls only. The actionability wait inside
+click/fill/... (visible, enabled, stable) happens in the driver and is not reported
+separately, so it stays part of those calls' durations.
+
+Report (suite end): calls, errors, total and p50/p95/p99 per (method, selector), and the
+helpers making the most browser calls; exported to reports/playwright_calls_<pid>.json.
+"""
+from array import array
+import sys
+import threading
+import time
+from core.ReportFiles import export_json
+
+# Page methods whose first argument is a selector (or the URL for navigation)
+_SELECTOR_METHODS = frozenset((
+    'click', 'dblclick', 'fill', 'type', 'press', 'check', 'uncheck', 'set_checked', 'select_option',
+    'is_visible', 'is_hidden', 'is_enabled', 'is_disabled', 'is_checked', 'is_editable',
+    'text_content', 'inner_text', 'inner_html', 'input_value', 'get_attribute', 'hover', 'focus', 'tap',
+    'wait_for_selector', 'query_selector', 'query_selector_all', 'eval_on_selector',
+    'eval_on_selector_all', 'set_input_files', 'dispatch_event', 'goto', 'wait_for_url',
+))
+# Calls that only wait: their whole duration counts as explicit wait time
+_WAIT_METHODS = frozenset(('wait_for', 'wait_for_selector', 'wait_for_timeout', 'wait_for_load_state',
+                           'wait_for_url', 'wait_for_function', 'wait_for_event'))
+# Locator builders: no browser call, return a new (profiled) locator
+_LOCATOR_BUILDERS = frozenset(('locator', 'nth', 'filter', 'get_by_role', 'get_by_text', 'get_by_label',
+                               'get_by_placeholder', 'get_by_test_id', 'get_by_title', 'get_by_alt_text',
+                               'frame_locator', 'and_', 'or_'))
+_LOCATOR_PROPERTIES = frozenset(('first', 'last'))
+
+
+class _CallStats:
+    """Ring buffer of the last N durations plus running totals for one (method, selector)."""
+    __slots__ = ('durations', 'index', 'count', 'errors', 'timeouts', 'total', 'explicit_wait')
+
+    def __init__(self, size):
+        self.durations = array('d', bytes(8 * size))
+        self.index = 0
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.explicit_wait = 0.0
+
+    def add(self, duration, outcome, explicit_wait):
+        self.durations[self.index] = duration
+        self.index = (self.index + 1) % len(self.durations)
+        self.count += 1
+        self.total += duration
+        self.explicit_wait += explicit_wait
+        if outcome != 'ok':
+            self.errors += 1
+            if outcome == 'timeout':
+                self.timeouts += 1
+
+    def samples(self):
+        return sorted(self.durations[:min(self.count, len(self.durations))])
+
+
+class PlaywrightProfiler:
+    """Collects call statistics; wrap() is a no-op while the profiler is disabled."""
+    BUFFER_SIZE = 1024
+    enabled = False
+    _lock = threading.Lock()
+    _calls = {}    # (method, selector) -> _CallStats
+    _callers = {}  # helper function name -> browser calls
+
+    @classmethod
+    def configure(cls, enabled, buffer_size=None):
+        cls.enabled = bool(enabled)
+        if buffer_size:
+            cls.BUFFER_SIZE = int(buffer_size)
+
+    @classmethod
+    def wrap(cls, page):
+        if not cls.enabled or page is None or isinstance(page, ProfiledPage):
+            return page
+        return ProfiledPage(page)
+
+    @classmethod
+    def record(cls, method, selector, duration, outcome, caller):
+        key = (method, selector)
+        with cls._lock:
+            stats = cls._calls.get(key)
+            if stats is None:
+                stats = cls._calls[key] = _CallStats(cls.BUFFER_SIZE)
+            stats.add(duration, outcome, duration if method in _WAIT_METHODS else 0.0)
+            cls._callers[caller] = cls._callers.get(caller, 0) + 1
+
+    # ====================================
+    # Report
+    # ====================================
+    @staticmethod
+    def _percentile(samples, p):
+        return samples[min(int(len(samples) * p), len(samples) - 1)] if samples else 0.0
+
+    @classmethod
+    def get_stats(cls):
+        """Rows per (method, selector), highest total time first. Percentiles over the ring buffer."""
+        with cls._lock:
+            items = list(cls._calls.items())
+        rows = []
+        for (method, selector), s in items:
+            samples = s.samples()
+            rows.append({
+                'method': method,
+                'selector': selector,
+                'count': s.count,
+                'errors': s.errors,
+                'timeouts': s.timeouts,
+                'total_ms': round(s.total * 1000, 2),
+                'explicit_wait_ms': round(s.explicit_wait * 1000, 2),
+                'p50_ms': round(cls._percentile(samples, 0.50) * 1000, 2),
+                'p95_ms': round(cls._percentile(samples, 0.95) * 1000, 2),
+                'p99_ms': round(cls._percentile(samples, 0.99) * 1000, 2),
+            })
+        rows.sort(key=lambda r: -r['total_ms'])
+        return rows
+
+    @classmethod
+    def export(cls, path=None):
+        """Write calls and per-helper counts as JSON. Returns the path, or None if nothing was recorded."""
+        rows = cls.get_stats()
+        if not rows:
+            return None
+        callers = dict(sorted(cls._callers.items(), key=lambda kv: -kv[1]))
+        return export_json('playwright_calls', {'calls': rows, 'callers': callers}, path)
+
+    @classmethod
+    def format_stats(cls, top=10):
+        rows = cls.get_stats()
+        if not rows:
+            return "Playwright calls: none recorded"
+        total = sum(r['count'] for r in rows)
+        waited = sum(r['explicit_wait_ms'] for r in rows) / 1000
+        lines = [f"Playwright calls: {total} calls, {sum(r['total_ms'] for r in rows) / 1000:.1f}s in browser calls "
+                 f"({waited:.1f}s in explicit wait_* calls)"]
+        for r in rows[:top]:
+            errors = f", {r['errors']} errors" if r['errors'] else ""
+            lines.append(f"  {r['method']}({r['selector'] or ''}): {r['count']}x, total {r['total_ms']:.0f} ms, "
+                         f"p50 {r['p50_ms']:.0f} / p95 {r['p95_ms']:.0f} / p99 {r['p99_ms']:.0f} ms{errors}")
+        chatty = sorted(cls._callers.items(), key=lambda kv: -kv[1])[:5]
+        lines.append("  Most calls from: " + ", ".join(f"{name} {n}" for name, n in chatty))
+        return "\n".join(lines)
+
+
+def _timed(method, selector, fn, args, kwargs):
+    caller = sys._getframe(2).f_code.co_name  # The helper that made the call
+    start = time.perf_counter()
+    outcome = 'ok'
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        outcome = 'timeout' if type(e).__name__ == 'TimeoutError' else 'error'
+        raise
+    finally:
+        PlaywrightProfiler.record(method, selector, time.perf_counter() - start, outcome, caller)
+
+
+class ProfiledLocator:
+    """Locator proxy: timed browser calls, selector kept through chaining."""
+    __slots__ = ('_locator', '_selector')
+
+    def __init__(self, locator, selector):
+        self._locator = locator
+        self._selector = selector
+
+    def __getattr__(self, name):
+        attr = getattr(self._locator, name)
+        if name in _LOCATOR_PROPERTIES:
+            return ProfiledLocator(attr, self._selector)  # Same element set: keep the stats key
+        if not callable(attr):
+            return attr
+        if name in _LOCATOR_BUILDERS:
+            def build(*args, **kwargs):
+                detail = args[0] if args and isinstance(args[0], (str, int)) else ''
+                return ProfiledLocator(attr(*args, **kwargs), f"{self._selector} >> {name}({detail})")
+            return build
+
+        def call(*args, **kwargs):
+            return _timed(name, self._selector, attr, args, kwargs)
+        return call
+
+    def __repr__(self):
+        return f"ProfiledLocator({self._locator!r})"
+
+
+class ProfiledPage:
+    """Page proxy: timed browser calls; locator() returns ProfiledLocators."""
+    __slots__ = ('_page',)
+
+    def __init__(self, page):
+        self._page = page
+
+    @property
+    def unwrapped(self):
+        return self._page
+
+    def __getattr__(self, name):
+        attr = getattr(self._page, name)
+        if not callable(attr):
+            return attr
+        if name in _LOCATOR_BUILDERS:
+            def build(*args, **kwargs):
+                selector = args[0] if args and isinstance(args[0], str) else f"{name}({args[0] if args else ''})"
+                return ProfiledLocator(attr(*args, **kwargs), selector)
+            return build
+
+        def call(*args, **kwargs):
+            selector = args[0] if name in _SELECTOR_METHODS and args and isinstance(args[0], str) else None
+            return _timed(name, selector, attr, args, kwargs)
+        return call
+
+    def __eq__(self, other):
+        return self._page == (other._page if isinstance(other, ProfiledPage) else other)
+
+    def __hash__(self):
+        return hash(self._page)
+
+    def __repr__(self):
+        return f"ProfiledPage({self._page!r})"
@@ -0,0 +1,129 @@
+"""
+Polling Assertions - Assertions that retry until a deadline instead of failing on the first read
+A slow render makes a single-read assertion fail and the whole scenario rerun. These
+assertions re-read the DOM with exponential backoff until the condition holds or the
+deadline (VISIBILITY_TIMEOUT by default) passes, then report the last observed value and
+the number of attempts. Wait times are kept per (assertion, selector) to find slow UI.
+"""
+from collections import defaultdict
+import threading
+import time
+from core.EventLog import EventLog
+from core.ReportFiles import export_json
+
+
+class PollingAssertions:
+    """
+    Deadline + exponential backoff polling (50 ms doubling up to 1 s between reads).
+    Waits use page.wait_for_timeout so Playwright keeps dispatching events (route
+    handlers, console) while the sync API is idle.
+    """
+    INITIAL_DELAY_MS = 50
+    MAX_DELAY_MS = 1000
+    BACKOFF = 2
+    _lock = threading.Lock()
+    _stats = defaultdict(lambda: {'count': 0, 'failed': 0, 'attempts': 0, 'wait_ms': []})
+
+    @classmethod
+    def poll(cls, page, name, selector, read, condition, describe, timeout_ms):
+        """
+        Read until condition(value) is true or the deadline passes.
+        Args:
+            page: Page used for the backoff waits
+            name: Assertion name (statistics key with selector)
+            selector: Selector being checked (for statistics and messages)
+            read: Callable returning the current value (exceptions count as a failed read)
+            condition: Callable(value) -> bool
+            describe: Callable(value) -> failure message
+            timeout_ms: Deadline in milliseconds
+        Returns:
+            The value that satisfied the condition
+        Raises:
+            AssertionError: With the last observed value and attempt count
+        """
+        start = time.monotonic()
+        deadline = start + timeout_ms / 1000
+        delay = cls.INITIAL_DELAY_MS
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                value, error = read(), None
+            except Exception as e:
+                value, error = None, e
+            if error is None and condition(value):
+                cls._record(name, selector, attempts, start, passed=True)
+                return value
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                waited = cls._record(name, selector, attempts, start, passed=False)
+                last = f"last value: {value!r}" if error is None else f"last error: {error}"
+                raise AssertionError(f"{describe(value)} (after {attempts} attempts in {waited / 1000:.2f}s; {last})")
+            page.wait_for_timeout(min(delay, remaining_ms))
+            delay = min(delay * cls.BACKOFF, cls.MAX_DELAY_MS)
+
+    # ====================================
+    # Statistics
+    # ====================================
+    @classmethod
+    def _record(cls, name, selector, attempts, start, passed):
+        waited_ms = (time.monotonic() - start) * 1000
+        with cls._lock:
+            stats = cls._stats[(name, selector)]
+            stats['count'] += 1
+            stats['attempts'] += attempts
+            stats['wait_ms'].append(waited_ms)
+            if not passed:
+                stats['failed'] += 1
+        EventLog.emit('assertion', assertion=name, selector=selector, passed=passed,
+                      attempts=attempts, wait_ms=round(waited_ms, 1))
+        return waited_ms
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Per (assertion, selector): count, failed, average attempts and wait time percentiles.
+        Returns:
+            list: dicts sorted by total wait time, slowest first
+        """
+        with cls._lock:
+            items = [(key, dict(s, wait_ms=list(s['wait_ms']))) for key, s in cls._stats.items()]
+        rows = []
+        for (name, selector), s in items:
+            waits = sorted(s['wait_ms'])
+            rows.append({
+                'assertion': name,
+                'selector': selector,
+                'count': s['count'],
+                'failed': s['failed'],
+                'avg_attempts': round(s['attempts'] / s['count'], 2),
+                'total_wait_ms': round(sum(waits), 1),
+                'avg_wait_ms': round(sum(waits) / len(waits), 1),
+                'p95_wait_ms': round(waits[min(int(len(waits) * 0.95), len(waits) - 1)], 1),
+                'max_wait_ms': round(waits[-1], 1),
+            })
+        rows.sort(key=lambda r: -r['total_wait_ms'])
+        return rows
+
+    @classmethod
+    def export(cls, path=None):
+        """
+        Write the wait statistics to this worker's report (see ReportFiles.export_json).
+        Returns the path, or None if nothing was polled.
+        """
+        return export_json('assertion_waits', cls.get_stats(), path)
+
+    @classmethod
+    def format_stats(cls, top=5):
+        """Summary line plus the slowest (assertion, selector) pairs."""
+        rows = cls.get_stats()
+        if not rows:
+            return "Polling assertions: none"
+        count = sum(r['count'] for r in rows)
+        failed = sum(r['failed'] for r in rows)
+        total = sum(r['total_wait_ms'] for r in rows)
+        lines = [f"Polling assertions: {count} checks, {failed} timed out, {total / 1000:.1f}s waited"]
+        for r in rows[:top]:
+            lines.append(f"  {r['assertion']} {r['selector']}: {r['count']}x, avg {r['avg_wait_ms']:.0f} ms, "
+                         f"p95 {r['p95_wait_ms']:.0f} ms, avg {r['avg_attempts']} attempts")
+        return "\n".join(lines)
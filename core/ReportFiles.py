@@ -0,0 +1,39 @@
+"""
+Report Files - JSON report files written by the suite-end exports
+Each Gauge worker writes its own file, <GAUGE_REPORTS_DIR or reports>/<name>_<pid>.json,
+so parallel streams never write the same file.
+"""
+from pathlib import Path
+import json
+import os
+
+
+def worker_report_path(name):
+    """Default export path of this worker: <reports>/<name>_<pid>.json"""
+    return Path(os.environ.get("GAUGE_REPORTS_DIR", "reports")) / f"{name}_{os.getpid()}.json"
+
+
+def write_json(path, data):
+    """Write data as indented JSON atomically (temp file + rename), creating the folder."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def export_json(name, data, path=None):
+    """
+    Write one worker's report.
+    Args:
+        name: Report name (file name prefix)
+        data: JSON-serializable rows or document; nothing is written when empty
+        path: Output file (default: worker_report_path(name))
+    Returns:
+        Path: The written file, or None if there was nothing to write
+    """
+    if not data:
+        return None
+    return write_json(path or worker_report_path(name), data)
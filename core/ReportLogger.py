@@ -1,25 +1,117 @@
 from getgauge.python import Messages, data_store
 from datetime import datetime
+import threading
+
+# Severity order for LOG_LEVEL filtering (WARN is accepted for WARNING)
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40}
 
 class ReportLogger:
     """
     Report Logger Class
     Handles all logging and reporting functionality for Gauge reports.
     formerly part of BasePage.
+
+    Lines are collected in a per-step buffer and written as one Gauge message when the
+    step ends (flush() from the after_step hook) or immediately when an ERROR line is
+    logged. Lines below LOG_LEVEL are dropped: LOG_LEVEL is either a minimum level
+    ("INFO") or the list of levels to keep ("INFO,WARNING,ERROR").
     """
+    _enabled_levels = frozenset(('INFO', 'WARNING', 'ERROR'))
+    _local = threading.local()
+    _stats_lock = threading.Lock()
+    _stats = {'lines': 0, 'messages': 0, 'bytes': 0, 'filtered': 0}
+
+    # ====================================
+    # Buffer & Level Filter
+    # ====================================
+    @classmethod
+    def configure(cls, log_level):
+        """
+        Set the levels to keep from LOG_LEVEL.
+        Raises:
+            ValueError: Unknown level name
+        """
+        names = [cls._level_name(name) for name in str(log_level or 'INFO').split(',') if name.strip()]
+        if len(names) == 1:
+            cls._enabled_levels = frozenset(n for n, v in LOG_LEVELS.items() if v >= LOG_LEVELS[names[0]])
+        else:
+            cls._enabled_levels = frozenset(names)
+
+    @staticmethod
+    def _level_name(name):
+        name = name.strip().upper()
+        name = 'WARNING' if name == 'WARN' else name
+        if name not in LOG_LEVELS:
+            raise ValueError(f"Unknown LOG_LEVEL '{name}'. Use DEBUG, INFO, WARNING or ERROR")
+        return name
+
+    @classmethod
+    def is_enabled(cls, level):
+        return level in cls._enabled_levels
+
+    @classmethod
+    def write(cls, message, level='INFO'):
+        """Add a line to the step buffer (dropped if level is filtered; ERROR flushes at once)."""
+        if level not in cls._enabled_levels:
+            with cls._stats_lock:
+                cls._stats['filtered'] += 1
+            return
+        buffer = cls._buffer()
+        buffer.append(message)
+        if level == 'ERROR':
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        """Write the buffered lines as one Gauge message."""
+        buffer = cls._buffer()
+        if not buffer:
+            return
+        text = "\n".join(buffer)
+        lines = len(buffer)
+        buffer.clear()
+        Messages.write_message(text)
+        with cls._stats_lock:
+            cls._stats['lines'] += lines
+            cls._stats['messages'] += 1
+            cls._stats['bytes'] += len(text.encode('utf-8'))
+
+    @classmethod
+    def _buffer(cls):
+        buffer = getattr(cls._local, 'buffer', None)
+        if buffer is None:
+            buffer = cls._local.buffer = []
+        return buffer
+
+    @classmethod
+    def get_stats(cls):
+        with cls._stats_lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def format_stats(cls):
+        s = cls.get_stats()
+        return (f"Report log: {s['lines']} lines in {s['messages']} messages ({s['bytes'] / 1024:.1f} KB), "
+                f"{s['filtered']} lines below LOG_LEVEL dropped")
+
+    # ====================================
+    # Report Lines
+    # ====================================
     @staticmethod
     def log_step_header(step_name, icon="📍"):
         """Log a step header with formatting"""
-        Messages.write_message("═" * 80)
-        Messages.write_message(f"{icon} EXECUTION STEP: {step_name}")
+        ReportLogger.write("═" * 80)
+        ReportLogger.write(f"{icon} EXECUTION STEP: {step_name}")
     
     @staticmethod
     def log_step_footer(success=True, message=None):
         """Log a step footer with status"""
+        lines = []
         if message:
             status_icon = "✅" if success else "❌"
-            Messages.write_message(f"   {status_icon} {message}")
-        Messages.write_message("═" * 80)
+            lines.append(f"   {status_icon} {message}")
+        lines.append("═" * 80)
+        ReportLogger.write("\n".join(lines), 'INFO' if success else 'ERROR')
     
     @staticmethod
     def log_info(key, value, mask_password=False):
@@ -28,116 +120,121 @@ class ReportLogger:
             display_value = '*' * len(str(value)) if value else 'N/A'
         else:
             display_value = value
-        Messages.write_message(f"   🔧 {key}: {display_value}")
+        ReportLogger.write(f"   🔧 {key}: {display_value}")
     
     @staticmethod
     def log_data_source(file_name, sheet_name, row_number=None, test_id=None):
         """Log data source information"""
-        Messages.write_message(f"   📄 Excel File: {file_name}")
-        Messages.write_message(f"   📑 Sheet Name: {sheet_name}")
+        ReportLogger.write(f"   📄 Excel File: {file_name}")
+        ReportLogger.write(f"   📑 Sheet Name: {sheet_name}")
         if row_number:
-            Messages.write_message(f"   📌 Row Number: {row_number}")
+            ReportLogger.write(f"   📌 Row Number: {row_number}")
         if test_id:
-            Messages.write_message(f"   🆔 Test ID: {test_id}")
+            ReportLogger.write(f"   🆔 Test ID: {test_id}")
     
     @staticmethod
     def log_test_data(test_data, mask_passwords=True):
         """Log test data dictionary"""
-        Messages.write_message("   📊 Test Data Retrieved:")
+        ReportLogger.write("   📊 Test Data Retrieved:")
         for key, value in test_data.items():
             if mask_passwords and key and 'password' in key.lower():
-                Messages.write_message(f"      • {key}: {'*' * len(str(value)) if value else 'N/A'}")
+                ReportLogger.write(f"      • {key}: {'*' * len(str(value)) if value else 'N/A'}")
             else:
-                Messages.write_message(f"      • {key}: {value}")
+                ReportLogger.write(f"      • {key}: {value}")
     
     @staticmethod
     def log_actions(actions_list):
         """Log a list of actions performed"""
-        Messages.write_message("   🎯 Actions performed:")
+        ReportLogger.write("   🎯 Actions performed:")
         for i, action in enumerate(actions_list, 1):
-            Messages.write_message(f"      {i}. {action}")
+            ReportLogger.write(f"      {i}. {action}")
     
     @staticmethod
     def log_verification(expected, actual, passed=None):
         """Log verification results"""
-        Messages.write_message(f"   🎯 Expected: {expected}")
-        Messages.write_message(f"   📋 Actual: {actual}")
+        ReportLogger.write(f"   🎯 Expected: {expected}")
+        ReportLogger.write(f"   📋 Actual: {actual}")
         
         if passed is not None:
             if passed:
-                Messages.write_message("   ✅ VERIFICATION PASSED")
+                ReportLogger.write("   ✅ VERIFICATION PASSED")
             else:
-                Messages.write_message(f"   ❌ VERIFICATION FAILED: Expected '{expected}' but got '{actual}'")
+                ReportLogger.write(f"   ❌ VERIFICATION FAILED: Expected '{expected}' but got '{actual}'", 'ERROR')
     
     @staticmethod
     def log_error(error_message):
         """Log an error message"""
-        Messages.write_message(f"   ❌ ERROR: {error_message}")
+        ReportLogger.write(f"   ❌ ERROR: {error_message}", 'ERROR')
     
     @staticmethod
     def log_warning(warning_message):
         """Log a warning message"""
-        Messages.write_message(f"   ⚠️ WARNING: {warning_message}")
+        ReportLogger.write(f"   ⚠️ WARNING: {warning_message}", 'WARNING')
     
     @staticmethod
     def log_success(success_message):
         """Log a success message"""
-        Messages.write_message(f"   ✅ {success_message}")
+        ReportLogger.write(f"   ✅ {success_message}")
     
     @staticmethod
     def log_separator():
         """Log a separator line"""
-        Messages.write_message("─" * 80)
+        ReportLogger.write("─" * 80)
     
     @staticmethod
     def log_section(title):
         """Log a section title"""
-        Messages.write_message(f"\n   📌 {title}")
+        ReportLogger.write(f"\n   📌 {title}")
     
     @staticmethod
     def log_url(url, label="Target URL"):
         """Log a URL"""
-        Messages.write_message(f"   🌐 {label}: {url}")
+        ReportLogger.write(f"   🌐 {label}: {url}")
     
     @staticmethod
     def log_browser_info(browser_type, headless):
         """Log browser configuration"""
-        Messages.write_message(f"   🔧 Browser: {browser_type}")
-        Messages.write_message(f"   👁️ Headless Mode: {headless}")
+        ReportLogger.write(f"   🔧 Browser: {browser_type}")
+        ReportLogger.write(f"   👁️ Headless Mode: {headless}")
     
     @staticmethod
     def log_credentials(username, password=None):
         """Log credentials (password is masked)"""
-        Messages.write_message(f"   👤 Username: {username}")
+        ReportLogger.write(f"   👤 Username: {username}")
         if password:
-            Messages.write_message(f"   🔑 Password: {'*' * len(password)}")
+            ReportLogger.write(f"   🔑 Password: {'*' * len(password)}")
     
     @staticmethod
-    def log_custom(message, icon="ℹ️"):
+    def log_custom(message, icon="ℹ️", level='INFO'):
         """Log a custom message with an icon"""
-        Messages.write_message(f"   {icon} {message}")
+        ReportLogger.write(f"   {icon} {message}", level)
+
+    @staticmethod
+    def log_debug(message):
+        """Log a diagnostic message (shown only when LOG_LEVEL includes DEBUG)"""
+        ReportLogger.write(f"   🐞 {message}", 'DEBUG')
     
     @staticmethod
     def log_timestamp(label="Timestamp"):
         """Log current timestamp"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        Messages.write_message(f"   🕐 {label}: {timestamp}")
+        ReportLogger.write(f"   🕐 {label}: {timestamp}")
 
     @staticmethod
     def log_test_context(url, browser, headless, file_name, sheet_name, test_id=None, mapping=None):
         """Log consolidated test context"""
-        Messages.write_message("═" * 80)
-        Messages.write_message("   📝 TEST CONTEXT")
-        Messages.write_message(f"   🌐 Target URL: {url}")
-        Messages.write_message(f"   🔧 Browser: {browser}")
-        Messages.write_message(f"   👁️ Headless Mode: {headless}")
+        ReportLogger.write("═" * 80)
+        ReportLogger.write("   📝 TEST CONTEXT")
+        ReportLogger.write(f"   🌐 Target URL: {url}")
+        ReportLogger.write(f"   🔧 Browser: {browser}")
+        ReportLogger.write(f"   👁️ Headless Mode: {headless}")
         if mapping:
-             Messages.write_message(f"   🗺️ Driver Mapping: {mapping}")
-        Messages.write_message(f"   📄 Excel File: {file_name}")
-        Messages.write_message(f"   📑 Sheet Name: {sheet_name}")
+             ReportLogger.write(f"   🗺️ Driver Mapping: {mapping}")
+        ReportLogger.write(f"   📄 Excel File: {file_name}")
+        ReportLogger.write(f"   📑 Sheet Name: {sheet_name}")
         if test_id:
-            Messages.write_message(f"   🆔 Test ID: {test_id}")
-        Messages.write_message("═" * 80)
+            ReportLogger.write(f"   🆔 Test ID: {test_id}")
+        ReportLogger.write("═" * 80)
 
 # Helper functions for cleaner imports in steps
 def log_step(step_name, icon="📍"):
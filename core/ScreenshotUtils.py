@@ -2,7 +2,7 @@
 Screenshot Utilities - Common screenshot capture functions
 Provides reusable screenshot functionality for all step implementations
 """
-from getgauge.python import Messages
+from core.ReportLogger import ReportLogger
 from core.Core_basePage import BasePage
 import os
 from datetime import datetime
@@ -28,9 +28,9 @@ def capture_step_screenshot(step_name):
             screenshot_path = os.path.join(screenshot_dir, f"{safe_name}_{timestamp}.png")            # Take screenshot and save to file
             screenshot_bytes = page.screenshot(path=screenshot_path)
             # Attach screenshot to report using HTML
-            Messages.write_message(f"   📷 Screenshot: {step_name}")
-            Messages.write_message(f"<img src='../screenshots/{os.path.basename(screenshot_path)}' width='600' />")
+            ReportLogger.write(f"   📷 Screenshot: {step_name}")
+            ReportLogger.write(f"<img src='../screenshots/{os.path.basename(screenshot_path)}' width='600' />")
             return screenshot_path
     except Exception as e:
-        Messages.write_message(f"   [Screenshot capture failed: {str(e)}]")
+        ReportLogger.write(f"   [Screenshot capture failed: {str(e)}]", 'WARNING')
     return None
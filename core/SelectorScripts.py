@@ -0,0 +1,17 @@
+"""
+Selector Scripts - JavaScript shared by the batched page.evaluate helpers
+(WebElementHelper.fill_form, BulkAssertions) so every helper resolves selectors the same way.
+"""
+
+# Declares `resolve(sel)`: the first element matching a CSS ("css=..." or bare) or
+# XPath ("//", "(//", "xpath=...") selector, or null. Other Playwright selector engines
+# (text=, role=, ">>" chains, ...) make querySelector throw; callers catch that and
+# fall back to Playwright locators.
+RESOLVE_SELECTOR_JS = """
+    const resolve = sel => {
+        if (sel.startsWith('css=')) return document.querySelector(sel.slice(4));
+        if (sel.startsWith('xpath=')) sel = sel.slice(6);
+        else if (!sel.startsWith('//') && !sel.startsWith('(//')) return document.querySelector(sel);
+        return document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    };
+"""
@@ -0,0 +1,182 @@
+"""
+Settings - Typed, validated, immutable framework configuration
+Built once from the Environment configuration (env vars take priority over Excel)
+so BasePage getters become plain attribute reads and misconfiguration fails at
+startup instead of in the middle of a run.
+"""
+from collections import namedtuple
+import os
+
+# attr: attribute name, key: config property, type: str/int/float/bool/list,
+# required: must be present, default: value when absent, choices: allowed values
+Setting = namedtuple('Setting', 'attr key type required default choices')
+Setting.__new__.__defaults__ = (False, None, None)
+
+SETTINGS_SCHEMA = (
+    # Application
+    Setting('app_url', 'APP_URL', 'str'),
+    Setting('app_name', 'APP_NAME', 'str'),
+    Setting('environment', 'ENVIRONMENT', 'str'),
+    # Browser
+    Setting('browser', 'BROWSER', 'str', True, None, ('chromium', 'chrome', 'firefox', 'webkit', 'edge')),
+    Setting('headless', 'HEADLESS', 'bool', True),
+    Setting('slow_mo', 'SLOW_MO', 'int', True),
+    Setting('viewport_width', 'VIEWPORT_WIDTH', 'int'),
+    Setting('viewport_height', 'VIEWPORT_HEIGHT', 'int'),
+    Setting('browser_ws_endpoint', 'BROWSER_WS_ENDPOINT', 'str'),
+    # Network routing
+    Setting('network_profile', 'NETWORK_PROFILE', 'str', False, 'off', ('off', 'lean', 'minimal')),
+    Setting('network_block_patterns', 'NETWORK_BLOCK_PATTERNS', 'list', False, ()),
+    Setting('network_learn_sizes', 'NETWORK_LEARN_SIZES', 'bool', False, False),
+    # Static asset disk cache (opt-in)
+    Setting('static_cache', 'STATIC_CACHE', 'bool', False, False),
+    Setting('static_cache_max_mb', 'STATIC_CACHE_MAX_MB', 'int', False, 200),
+    # HAR record/replay (HAR_NOT_FOUND: abort = fail fast, fallback = go to the network)
+    Setting('har_mode', 'HAR_MODE', 'str', False, 'off', ('off', 'record', 'replay')),
+    Setting('har_dir', 'HAR_DIR', 'str', False, 'har'),
+    Setting('har_not_found', 'HAR_NOT_FOUND', 'str', False, 'abort', ('abort', 'fallback')),
+    Setting('har_url_filter', 'HAR_URL_FILTER', 'str'),
+    # Timeouts (milliseconds)
+    Setting('default_timeout', 'DEFAULT_TIMEOUT', 'int', True),
+    Setting('navigation_timeout', 'NAVIGATION_TIMEOUT', 'int', True),
+    Setting('action_timeout', 'ACTION_TIMEOUT', 'int'),
+    Setting('visibility_timeout', 'VISIBILITY_TIMEOUT', 'int'),
+    # Action read-back verification (strict = always, sampled = VERIFY_SAMPLE_RATE of actions, off = trust Playwright)
+    Setting('verify_level', 'VERIFY_LEVEL', 'str', False, 'strict', ('strict', 'sampled', 'off')),
+    Setting('verify_sample_rate', 'VERIFY_SAMPLE_RATE', 'float', False, 0.1),
+    Setting('verify_seed', 'VERIFY_SEED', 'int', False, 0),
+    # Context pool (0 = disabled; max age in seconds)
+    Setting('context_pool_size', 'CONTEXT_POOL_SIZE', 'int', False, 0),
+    Setting('context_pool_max_age', 'CONTEXT_POOL_MAX_AGE', 'int', False, 300),
+    # Screenshots & tracing
+    Setting('screenshot_on_failure', 'SCREENSHOT_ON_FAILURE', 'bool', True),
+    Setting('enable_tracing', 'ENABLE_TRACING', 'bool', True),
+    Setting('trace_dir', 'TRACE_DIR', 'str'),
+    # Login session cache (opt-in; TTL in seconds)
+    Setting('auth_state_cache', 'AUTH_STATE_CACHE', 'bool', False, False),
+    Setting('auth_state_ttl', 'AUTH_STATE_TTL', 'int', False, 1800),
+    # Test data
+    Setting('test_data_file', 'TEST_DATA_FILE', 'str', True),
+    Setting('test_data_sheet', 'TEST_DATA_SHEET', 'str'),
+    Setting('test_id_columns', 'TEST_ID_COLUMNS', 'list', True),
+    Setting('test_data_backend', 'TEST_DATA_BACKEND', 'str', False, 'auto', ('auto', 'excel', 'sqlite', 'json', 'csv', 'parquet')),
+    Setting('workbook_cache_max_mb', 'WORKBOOK_CACHE_MAX_MB', 'int', False, 256),
+    Setting('env_config_sheet', 'ENV_CONFIG_SHEET', 'str'),
+    Setting('base_path', 'BASE_PATH', 'str'),
+    # Page performance metrics after navigate_to (opt-in; budgets from a test data workbook sheet)
+    Setting('perf_metrics', 'PERF_METRICS', 'bool', False, False),
+    Setting('perf_budget_sheet', 'PERF_BUDGET_SHEET', 'str'),
+    Setting('perf_budget_mode', 'PERF_BUDGET_MODE', 'str', False, 'soft', ('hard', 'soft')),
+    # Other
+    Setting('retry_count', 'RETRY_COUNT', 'int', False, 0),
+    Setting('log_level', 'LOG_LEVEL', 'str', False, 'INFO'),
+    Setting('event_log_keep_runs', 'EVENT_LOG_KEEP_RUNS', 'int', False, 20),
+    # Playwright call profiler (opt-in; durations kept per method+selector in a ring buffer of this size)
+    Setting('playwright_profiler', 'PLAYWRIGHT_PROFILER', 'bool', False, False),
+    Setting('playwright_profiler_buffer', 'PLAYWRIGHT_PROFILER_BUFFER', 'int', False, 1024),
+)
+
+TRUE_VALUES = ('true', 'yes', '1', 'on')
+FALSE_VALUES = ('false', 'no', '0', 'off')
+
+
+class SettingsError(ValueError):
+    """Raised when the configuration does not match the settings schema."""
+    pass
+
+
+class Settings:
+    """
+    Frozen settings object. Attributes are declared in SETTINGS_SCHEMA;
+    `raw` keeps the merged {property: string value} configuration.
+    """
+    __slots__ = tuple(s.attr for s in SETTINGS_SCHEMA) + ('raw',)
+
+    def __init__(self, values, raw):
+        for attr, value in values.items():
+            object.__setattr__(self, attr, value)
+        object.__setattr__(self, 'raw', raw)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Settings are read-only; use BasePage.reload_config() to apply changes")
+
+    def __delattr__(self, name):
+        raise AttributeError("Settings are read-only")
+
+    def __repr__(self):
+        return f"Settings({', '.join(f'{s.attr}={getattr(self, s.attr)!r}' for s in SETTINGS_SCHEMA)})"
+
+    def get(self, key, default=None):
+        """Raw configuration value for any property (not only schema keys)."""
+        value = self.raw.get(key)
+        return value if value not in (None, "") else default
+
+    @classmethod
+    def build(cls, config, environ=None):
+        """
+        Build and validate settings.
+        Args:
+            config: {property: value} from the Environment sheet
+            environ: Environment variables (default os.environ); they take priority over Excel
+        Returns:
+            Settings: Validated, immutable settings
+        Raises:
+            SettingsError: Listing every missing or invalid property
+        """
+        environ = os.environ if environ is None else environ
+        raw = dict(config)
+        for key in list(raw) + [s.key for s in SETTINGS_SCHEMA]:
+            if environ.get(key):
+                raw[key] = environ[key]
+        values = {}
+        errors = []
+        for setting in SETTINGS_SCHEMA:
+            raw_value = raw.get(setting.key)
+            if raw_value is None or str(raw_value).strip() == "":
+                if setting.required:
+                    errors.append(f"{setting.key} not configured in Environment properties")
+                values[setting.attr] = setting.default
+                continue
+            try:
+                values[setting.attr] = cls._parse(setting, str(raw_value).strip())
+            except ValueError as e:
+                errors.append(f"{setting.key}: {e}")
+        if not 0 <= values.get('verify_sample_rate', 0) <= 1:
+            errors.append("VERIFY_SAMPLE_RATE: expected a fraction between 0 and 1")
+        if values.get('event_log_keep_runs', 1) < 1:
+            errors.append("EVENT_LOG_KEEP_RUNS: expected at least 1")
+        if values.get('playwright_profiler_buffer', 1) < 1:
+            errors.append("PLAYWRIGHT_PROFILER_BUFFER: expected a positive number of samples")
+        if values.get('enable_tracing') and not values.get('trace_dir'):
+            errors.append("TRACE_DIR not configured (required when ENABLE_TRACING is true)")
+        if errors:
+            raise SettingsError("Invalid configuration:\n  - " + "\n  - ".join(errors))
+        return cls(values, raw)
+
+    @staticmethod
+    def _parse(setting, value):
+        if setting.type == 'int':
+            try:
+                return int(float(value)) if '.' in value else int(value)
+            except ValueError:
+                raise ValueError(f"expected an integer, got '{value}'")
+        if setting.type == 'float':
+            try:
+                return float(value)
+            except ValueError:
+                raise ValueError(f"expected a number, got '{value}'")
+        if setting.type == 'bool':
+            lowered = value.lower()
+            if lowered in TRUE_VALUES:
+                return True
+            if lowered in FALSE_VALUES:
+                return False
+            raise ValueError(f"expected true/false, got '{value}'")
+        if setting.type == 'list':
+            return tuple(v.strip() for v in value.split(',') if v.strip())
+        if setting.choices:
+            # Choices are matched case-insensitively and normalized, so callers compare lower-case
+            if value.lower() not in setting.choices:
+                raise ValueError(f"expected one of {', '.join(setting.choices)}, got '{value}'")
+            return value.lower()
+        return value
@@ -0,0 +1,264 @@
+"""
+Static Asset Cache - Disk cache for JS/CSS/images/fonts shared across contexts
+Every scenario gets a fresh BrowserContext with an empty HTTP cache, so the same
+bundles are downloaded again and again. This opt-in cache (STATIC_CACHE) sits in a
+context-level route: cacheable GET responses for static resource types are stored in
+.cache/static and served from disk to later contexts, Gauge workers and runs.
+
+Layout:
+    .cache/static/objects/<sha256 of body>    content-addressed bodies (deduplicated)
+    .cache/static/meta/<sha256 of url>.json   status, headers, freshness, body hash
+"""
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+
+class StaticAssetCache:
+    """
+    HTTP-aware asset cache used by a context route handler.
+    Freshness follows Cache-Control (max-age, no-store, no-cache, private, immutable),
+    Expires and, as a fallback, the Last-Modified heuristic (10% of the age, max 1 day).
+    Stale entries with an ETag/Last-Modified are revalidated with a conditional request.
+    Size is capped by STATIC_CACHE_MAX_MB with LRU eviction (meta file mtime = last use).
+    """
+    CACHE_DIR = Path(__file__).parent.parent / '.cache' / 'static'
+    RESOURCE_TYPES = frozenset(('script', 'stylesheet', 'image', 'font', 'media'))
+    HEURISTIC_MAX_AGE = 86400
+    # Hop-by-hop/encoding headers that no longer apply to the decoded body we serve
+    _DROP_HEADERS = frozenset(('content-encoding', 'content-length', 'transfer-encoding', 'connection'))
+    _lock = threading.Lock()
+    _stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'uncacheable': 0,
+              'bytes_served': 0, 'evictions': 0}
+
+    @classmethod
+    def apply(cls, context):
+        """Install the cache route on a context. Requests it does not handle fall back."""
+        context.route('**/*', cls._handle)
+
+    # ========================================================================
+    # ROUTE HANDLER
+    # ========================================================================
+    @classmethod
+    def _handle(cls, route, request):
+        if request.method != 'GET' or request.resource_type not in cls.RESOURCE_TYPES:
+            route.fallback()
+            return
+        url = request.url
+        entry = cls._load(url)
+        if entry and cls._is_fresh(entry):
+            body = cls._read_body(entry)
+            if body is not None:
+                cls._serve(route, entry, body)
+                return
+        conditional = cls._conditional_headers(entry) if entry else None
+        try:
+            response = route.fetch(headers={**request.headers, **conditional} if conditional else None)
+        except Exception:
+            route.fallback()
+            return
+        if response.status == 304 and entry:
+            body = cls._read_body(entry)
+            if body is not None:
+                entry['stored_at'] = time.time()
+                entry['max_age'] = cls._max_age(response.headers) or entry['max_age']
+                cls._write_meta(url, entry)
+                cls._count('revalidated')
+                cls._serve(route, entry, body)
+                return
+        body = response.body()
+        headers = response.headers
+        if response.status == 200 and cls._is_cacheable(headers):
+            cls._store(url, headers, body)
+        else:
+            cls._count('uncacheable')
+        cls._count('misses')
+        route.fulfill(response=response, body=body, headers=cls._served_headers(headers))
+
+    @classmethod
+    def _serve(cls, route, entry, body):
+        route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+        with cls._lock:
+            cls._stats['hits'] += 1
+            cls._stats['bytes_served'] += len(body)
+
+    # ========================================================================
+    # HTTP CACHING RULES
+    # ========================================================================
+    @classmethod
+    def _is_cacheable(cls, headers):
+        cache_control = headers.get('cache-control', '').lower()
+        if 'no-store' in cache_control or 'private' in cache_control:
+            return False
+        vary = headers.get('vary', '').lower()
+        if vary and any(v.strip() not in ('accept-encoding', '') for v in vary.split(',')):
+            return False
+        return cls._max_age(headers) > 0 or bool(headers.get('etag') or headers.get('last-modified'))
+
+    @classmethod
+    def _max_age(cls, headers):
+        """Freshness lifetime in seconds (0 = must revalidate)."""
+        cache_control = headers.get('cache-control', '').lower()
+        if 'no-cache' in cache_control:
+            return 0
+        match = re.search(r'max-age=(\d+)', cache_control)
+        if match:
+            return int(match.group(1))
+        try:
+            if headers.get('expires'):
+                date = parsedate_to_datetime(headers['date']).timestamp() if headers.get('date') else time.time()
+                return max(int(parsedate_to_datetime(headers['expires']).timestamp() - date), 0)
+            if headers.get('last-modified'):
+                age = time.time() - parsedate_to_datetime(headers['last-modified']).timestamp()
+                return int(min(max(age, 0) * 0.1, cls.HEURISTIC_MAX_AGE))
+        except (TypeError, ValueError):
+            pass
+        return 0
+
+    @staticmethod
+    def _is_fresh(entry):
+        return time.time() - entry['stored_at'] < entry['max_age']
+
+    @staticmethod
+    def _conditional_headers(entry):
+        headers = {}
+        if entry['headers'].get('etag'):
+            headers['if-none-match'] = entry['headers']['etag']
+        if entry['headers'].get('last-modified'):
+            headers['if-modified-since'] = entry['headers']['last-modified']
+        return headers or None
+
+    @classmethod
+    def _served_headers(cls, headers):
+        return {k: v for k, v in headers.items() if k.lower() not in cls._DROP_HEADERS}
+
+    # ========================================================================
+    # STORAGE
+    # ========================================================================
+    @classmethod
+    def _meta_path(cls, url):
+        return cls.CACHE_DIR / 'meta' / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    @classmethod
+    def _object_path(cls, digest):
+        return cls.CACHE_DIR / 'objects' / digest
+
+    @classmethod
+    def _load(cls, url):
+        path = cls._meta_path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    @classmethod
+    def _read_body(cls, entry):
+        try:
+            with open(cls._object_path(entry['sha256']), 'rb') as f:
+                body = f.read()
+            os.utime(cls._meta_path(entry['url']))  # LRU: last use
+            return body
+        except OSError:
+            return None
+
+    @classmethod
+    def _store(cls, url, headers, body):
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = cls._object_path(digest)
+        if not object_path.exists():
+            cls._atomic_write(object_path, body)
+        entry = {
+            'url': url,
+            'status': 200,
+            'headers': cls._served_headers(headers),
+            'sha256': digest,
+            'size': len(body),
+            'stored_at': time.time(),
+            'max_age': cls._max_age(headers),
+        }
+        cls._write_meta(url, entry)
+        cls._count('stored')
+
+    @classmethod
+    def _write_meta(cls, url, entry):
+        cls._atomic_write(cls._meta_path(url), json.dumps(entry).encode('utf-8'))
+
+    @staticmethod
+    def _atomic_write(path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def enforce_limit(cls, max_mb):
+        """
+        Evict least recently used entries until the bodies fit in max_mb, then delete
+        bodies no entry refers to any more.
+        """
+        meta_dir = cls.CACHE_DIR / 'meta'
+        if not meta_dir.exists():
+            return
+        entries = []
+        for path in meta_dir.glob('*.json'):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entries.append((path.stat().st_mtime, path, json.load(f)))
+            except (OSError, ValueError):
+                continue
+        entries.sort(key=lambda e: e[0])  # Oldest use first
+        sizes = {e['sha256']: e['size'] for _, _, e in entries}
+        total = sum(sizes.values())
+        limit = max_mb * 1024 * 1024
+        referenced = {}
+        for _, _, entry in entries:
+            referenced[entry['sha256']] = referenced.get(entry['sha256'], 0) + 1
+        for _, path, entry in entries:
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            cls._count('evictions')
+            referenced[entry['sha256']] -= 1
+            if referenced[entry['sha256']] == 0:
+                total -= sizes[entry['sha256']]
+        objects_dir = cls.CACHE_DIR / 'objects'
+        if objects_dir.exists():
+            for path in objects_dir.iterdir():
+                if not referenced.get(path.name) and not path.name.endswith('.tmp'):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    # ========================================================================
+    # STATISTICS
+    # ========================================================================
+    @classmethod
+    def _count(cls, key):
+        with cls._lock:
+            cls._stats[key] += 1
+
+    @classmethod
+    def get_stats(cls):
+        with cls._lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def format_stats(cls):
+        s = cls.get_stats()
+        requests = s['hits'] + s['misses']
+        hit_rate = (s['hits'] / requests * 100) if requests else 0.0
+        return (f"Static asset cache: {s['hits']}/{requests} hits ({hit_rate:.1f}%, "
+                f"{s['revalidated']} revalidated), {s['bytes_served'] / (1024 * 1024):.1f} MB served from disk, "
+                f"{s['stored']} stored, {s['uncacheable']} uncacheable, {s['evictions']} evicted")
@@ -0,0 +1,142 @@
+"""
+Table Snapshot - Whole-table text captured in one browser round trip
+WebElementHelper.table_snapshot(selector) reads headers and every cell of a <table>
+(or an ARIA grid: role=row / cell / gridcell / columnheader) with a single evaluate.
+Row, column, cell and search lookups are then answered from memory until the
+snapshot is invalidated (WebElementHelper.invalidate_table, any helper action that
+changes the page, or navigation to another URL). Rows and columns given as digit
+strings (Gauge step parameters) are treated as numbers.
+
+Example:
+    table = helper.table_snapshot(Objectlocators.EMPLOYEE_TABLE)
+    row = table.search("EMP-1042")                 # 1-indexed row number or None
+    salary = table.cell(row, "Salary")             # column by header text or 1-indexed number
+    finance_rows = table.find_rows("Finance", "Department")
+"""
+import time
+
+
+def _as_number(value):
+    """Digit strings (Gauge step parameters) as int; anything else unchanged."""
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return value
+
+# Returns {headers: [...], rows: [[...], ...]} for the element the locator resolved.
+# Body rows keep only <td> cells, like the "tbody tr td" locators used before.
+TABLE_SNAPSHOT_JS = """
+el => {
+    const text = cell => cell.innerText ?? cell.textContent;
+    if (el.tagName !== 'TABLE') {
+        const headers = Array.from(el.querySelectorAll('[role=columnheader]'), text);
+        const rows = Array.from(el.querySelectorAll('[role=row]'))
+            .map(row => Array.from(row.querySelectorAll('[role=cell], [role=gridcell]'), text))
+            .filter(cells => cells.length);
+        return {headers, rows};
+    }
+    let bodyRows = Array.from(el.tBodies).flatMap(body => Array.from(body.rows));
+    let headerRow = el.tHead ? el.tHead.rows[0] : null;
+    if (!headerRow && bodyRows.length && Array.from(bodyRows[0].cells).every(c => c.tagName === 'TH')) {
+        headerRow = bodyRows.shift();  // <th> row without <thead> (the parser puts it in <tbody>)
+    }
+    return {
+        headers: headerRow ? Array.from(headerRow.cells, text) : [],
+        rows: bodyRows.map(row => Array.from(row.cells).filter(c => c.tagName === 'TD').map(text)),
+    };
+}
+"""
+
+
+class TableSnapshot:
+    """
+    In-memory copy of a table's text. Rows and columns are 1-indexed like the
+    WebElementHelper table methods; columns can also be given by header text.
+    """
+
+    def __init__(self, selector, headers, rows, url=None):
+        self.selector = selector
+        self.url = url
+        self.headers = list(headers)
+        self.rows = [list(row) for row in rows]
+        self.taken_at = time.time()
+        self._header_index = {}
+        for i, header in enumerate(self.headers):
+            self._header_index.setdefault(header.strip(), i)
+        self._row_texts = None
+        self._cell_index = None
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    # ====================================
+    # Lookups
+    # ====================================
+    def column_index(self, col):
+        """
+        0-based position of a column given by 1-indexed number (int or digit string) or header text.
+        Raises:
+            KeyError: Unknown header
+            IndexError: Column number out of range
+        """
+        col = _as_number(col)
+        if isinstance(col, int):
+            if col < 1:
+                raise IndexError(f"Column {col} out of range (columns are 1-indexed)")
+            return col - 1
+        if col.strip() not in self._header_index:
+            raise KeyError(f"No column '{col}' in table '{self.selector}'. Headers: {self.headers}")
+        return self._header_index[col.strip()]
+
+    def row(self, row):
+        """Cells of a 1-indexed row."""
+        row = _as_number(row)
+        if not isinstance(row, int):
+            raise TypeError(f"Row must be a number, got '{row}'")
+        if not 1 <= row <= len(self.rows):
+            raise IndexError(f"Row {row} out of range (table '{self.selector}' has {len(self.rows)} rows)")
+        return self.rows[row - 1]
+
+    def row_dict(self, row):
+        """Row as {header: cell text}."""
+        return dict(zip((h.strip() for h in self.headers), self.row(row)))
+
+    def cell(self, row, col):
+        cells = self.row(row)
+        index = self.column_index(col)
+        if index >= len(cells):
+            raise IndexError(f"Column {col} out of range (row {row} has {len(cells)} cells)")
+        return cells[index]
+
+    def column(self, col):
+        """Column cells, skipping rows that are too short (as the nth-child locator did)."""
+        index = self.column_index(col)
+        return [cells[index] for cells in self.rows if index < len(cells)]
+
+    # ====================================
+    # Search
+    # ====================================
+    def search(self, text):
+        """First 1-indexed row whose text contains text, or None."""
+        if self._row_texts is None:
+            self._row_texts = ["\t".join(cells) for cells in self.rows]
+        for i, row_text in enumerate(self._row_texts, 1):
+            if text in row_text:
+                return i
+        return None
+
+    def find_rows(self, value, col=None):
+        """
+        1-indexed rows with a cell equal to value (whitespace-trimmed), optionally only
+        in one column. Answered from a value index built on first use.
+        """
+        if self._cell_index is None:
+            self._cell_index = {}
+            for r, cells in enumerate(self.rows, 1):
+                for c, cell in enumerate(cells):
+                    self._cell_index.setdefault(cell.strip(), []).append((r, c))
+        hits = self._cell_index.get(str(value).strip(), [])
+        if col is not None:
+            index = self.column_index(col)
+            hits = [(r, c) for r, c in hits if c == index]
+        return sorted({r for r, _ in hits})
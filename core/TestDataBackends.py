@@ -0,0 +1,641 @@
+"""
+Test Data Backends - Pluggable storage behind the TestDataManager API
+Excel stays the authoring format; workbooks can be compiled into a faster runtime
+format (SQLite, JSON, CSV or Parquet) under .cache/compiled/ and read from there.
+The compiler stores a type tag for every cell that is not text (per column when the
+column has one type), so bools, numbers, dates and times read back as the same Python
+types openpyxl returns, whatever the format stores natively.
+"""
+from collections import OrderedDict
+from datetime import date, datetime, time
+from openpyxl import load_workbook
+from core.WorkbookCache import WorkbookCache, SheetTable
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+COMPILED_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'compiled')
+FORMAT_VERSION = 2
+
+
+# ============================================================================
+# BACKEND INTERFACE
+# ============================================================================
+class TestDataBackend:
+    """
+    Read-only access to the sheets of one test data workbook.
+    Row numbers are sheet row numbers (1-indexed, row 1 is the header) and cell values
+    keep their Excel types (see _sheet_types), so every backend returns the same rows.
+    """
+    name = None
+
+    def __init__(self, source_path):
+        self.source_path = os.path.abspath(source_path)
+
+    def get_all_sheet_names(self):
+        raise NotImplementedError
+
+    def get_headers(self, sheet_name):
+        raise NotImplementedError
+
+    def get_row_data(self, sheet_name, row_number):
+        raise NotImplementedError
+
+    def get_test_data_by_id(self, sheet_name, test_id, test_id_columns):
+        raise NotImplementedError
+
+    def iter_rows(self, sheet_name, min_row=2, max_row=None):
+        raise NotImplementedError
+
+    def close(self):
+        """Release resources held by the backend (no-op by default)."""
+        pass
+
+
+class TableBackend(TestDataBackend):
+    """Backend that serves lookups from in-memory SheetTable objects."""
+
+    def _get_table(self, sheet_name):
+        raise NotImplementedError
+
+    def get_headers(self, sheet_name):
+        return list(self._get_table(sheet_name).headers)
+
+    def get_row_data(self, sheet_name, row_number):
+        return self._get_table(sheet_name).row_dict(row_number)
+
+    def get_test_data_by_id(self, sheet_name, test_id, test_id_columns):
+        table = self._get_table(sheet_name)
+        return _find_by_id(table.headers, table.rows, test_id, test_id_columns)
+
+    def iter_rows(self, sheet_name, min_row=2, max_row=None):
+        table = self._get_table(sheet_name)
+        if min_row <= 1:
+            yield tuple(table.headers)
+        start = max(min_row - 2, 0)
+        stop = None if max_row is None else max(max_row - 1, 0)
+        yield from table.rows[start:stop]
+
+
+def _find_by_id(headers, rows, test_id, test_id_columns):
+    """First row where any of test_id_columns equals test_id, as a dict (or None)."""
+    search_column_indices = [headers.index(c) for c in test_id_columns if c in headers]
+    if not search_column_indices:
+        return None
+    for row in rows:
+        for col_idx in search_column_indices:
+            if col_idx < len(row) and row[col_idx] == test_id:
+                return dict(zip(headers, row))
+    return None
+
+
+# ============================================================================
+# EXCEL (authoring format)
+# ============================================================================
+class ExcelBackend(TableBackend):
+    """
+    Reads the .xlsx directly.
+    Default mode serves sheets from the process-wide WorkbookCache; streaming mode
+    reads row by row through a read-only workbook for flat memory use.
+    """
+    name = 'excel'
+
+    def __init__(self, source_path, streaming=False):
+        super().__init__(source_path)
+        self.streaming = streaming
+
+    def _get_table(self, sheet_name):
+        return WorkbookCache.get_table(self.source_path, sheet_name)
+
+    def get_all_sheet_names(self):
+        return WorkbookCache.get_sheet_names(self.source_path)
+
+    def get_headers(self, sheet_name):
+        if not self.streaming:
+            return super().get_headers(sheet_name)
+        for row in self.iter_rows(sheet_name, min_row=1, max_row=1):
+            return list(row)
+        return []
+
+    def get_row_data(self, sheet_name, row_number):
+        if not self.streaming:
+            return super().get_row_data(sheet_name, row_number)
+        headers = self.get_headers(sheet_name)
+        for row in self.iter_rows(sheet_name, min_row=row_number, max_row=row_number):
+            return dict(zip(headers, row))
+        return dict.fromkeys(headers)
+
+    def get_test_data_by_id(self, sheet_name, test_id, test_id_columns):
+        if not self.streaming:
+            return super().get_test_data_by_id(sheet_name, test_id, test_id_columns)
+        rows = self.iter_rows(sheet_name)
+        try:
+            return _find_by_id(self.get_headers(sheet_name), rows, test_id, test_id_columns)
+        finally:
+            rows.close()
+
+    def iter_rows(self, sheet_name, min_row=2, max_row=None):
+        if not self.streaming:
+            yield from super().iter_rows(sheet_name, min_row, max_row)
+            return
+        workbook = load_workbook(self.source_path, read_only=True)
+        try:
+            yield from workbook[sheet_name].iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+        finally:
+            workbook.close()
+
+
+# ============================================================================
+# SQLITE (indexed runtime format)
+# ============================================================================
+class SqliteBackend(TestDataBackend):
+    """
+    One table per sheet with INTEGER PRIMARY KEY row numbers and indexes on the
+    TEST_ID_COLUMNS, so lookups by Test ID or row number are single index probes.
+    Dates and times are stored as ISO-8601 text and bools as 0/1; the type tags in
+    _sheets restore them on read.
+    """
+    name = 'sqlite'
+    extension = '.sqlite'
+
+    _connections = {}  # (compiled path, thread id) -> (mtime, connection)
+    _lock = threading.Lock()
+
+    def __init__(self, source_path, compiled_path=None):
+        super().__init__(source_path)
+        self.compiled_path = compiled_path or get_compiled_path(source_path, self.name)
+        self._sheets = None
+
+    @property
+    def connection(self):
+        """Read-only connection per thread; replaced (the old one closed) when the compiled file is."""
+        key = (self.compiled_path, threading.get_ident())
+        mtime = os.path.getmtime(self.compiled_path)
+        with self._lock:
+            entry = self._connections.get(key)
+            if entry is not None and entry[0] == mtime:
+                return entry[1]
+            if entry is not None:
+                entry[1].close()  # Same thread that opened it (the key includes the thread)
+                self._sheets = None
+            conn = sqlite3.connect(f"file:{self.compiled_path}?mode=ro", uri=True)
+            self._connections[key] = (mtime, conn)
+            return conn
+
+    @property
+    def sheets(self):
+        """Sheet name -> (table name, headers, type tags), in workbook order."""
+        if self._sheets is None:
+            rows = self.connection.execute("SELECT name, table_name, headers, types FROM _sheets ORDER BY ordinal")
+            self._sheets = OrderedDict((name, (table, json.loads(headers), _load_types(types)))
+                                       for name, table, headers, types in rows)
+        return self._sheets
+
+    def _sheet(self, sheet_name):
+        if sheet_name not in self.sheets:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return self.sheets[sheet_name]
+
+    def get_all_sheet_names(self):
+        return list(self.sheets)
+
+    def get_headers(self, sheet_name):
+        return list(self._sheet(sheet_name)[1])
+
+    def get_row_data(self, sheet_name, row_number):
+        table, headers, types = self._sheet(sheet_name)
+        if row_number == 1:
+            return dict(zip(headers, headers))
+        row = self.connection.execute(f"SELECT * FROM {table} WHERE row_number = ?", (row_number,)).fetchone()
+        if row is None:
+            return dict.fromkeys(headers)
+        return dict(zip(headers, _restore_row(row[1:], row[0], types)))
+
+    def get_test_data_by_id(self, sheet_name, test_id, test_id_columns):
+        table, headers, types = self._sheet(sheet_name)
+        indices = [headers.index(c) for c in test_id_columns if c in headers]
+        if not indices:
+            return None
+        where = " OR ".join(f"c{i} = ?" for i in indices)
+        row = self.connection.execute(
+            f"SELECT * FROM {table} WHERE {where} ORDER BY row_number LIMIT 1", [test_id] * len(indices)
+        ).fetchone()
+        return dict(zip(headers, _restore_row(row[1:], row[0], types))) if row else None
+
+    def iter_rows(self, sheet_name, min_row=2, max_row=None):
+        table, headers, types = self._sheet(sheet_name)
+        if min_row <= 1:
+            yield tuple(headers)
+        query = f"SELECT * FROM {table} WHERE row_number >= ?"
+        params = [max(min_row, 2)]
+        if max_row is not None:
+            query += " AND row_number <= ?"
+            params.append(max_row)
+        for row in self.connection.execute(query + " ORDER BY row_number", params):
+            yield _restore_row(row[1:], row[0], types)
+
+    @classmethod
+    def close_all(cls):
+        """Close every pooled connection (connections are shared, so close() keeps them open)."""
+        with cls._lock:
+            connections = [conn for _, conn in cls._connections.values()]
+            cls._connections.clear()
+        for conn in connections:
+            conn.close()
+
+    @classmethod
+    def write(cls, sheets, stamp, test_id_columns, output_path):
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("CREATE TABLE _meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE TABLE _sheets (ordinal INTEGER, name TEXT, table_name TEXT, headers TEXT, types TEXT)")
+            conn.executemany("INSERT INTO _meta VALUES (?, ?)", [(k, json.dumps(v)) for k, v in stamp.items()])
+            for ordinal, (sheet_name, headers, rows) in enumerate(sheets):
+                table = f"t{ordinal}"
+                # At least one column, so an empty sheet still gets a valid table
+                width = max([1, len(headers)] + [len(r) for r in rows])
+                columns = ", ".join(f"c{i}" for i in range(width))
+                conn.execute(f"CREATE TABLE {table} (row_number INTEGER PRIMARY KEY, {columns})")
+                placeholders = ", ".join("?" for _ in range(width + 1))
+                conn.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})",
+                    ([row_number] + [_to_portable(v) for v in row] + [None] * (width - len(row))
+                     for row_number, row in enumerate(rows, start=2))
+                )
+                for col_name in test_id_columns:
+                    if col_name in headers:
+                        i = headers.index(col_name)
+                        conn.execute(f"CREATE INDEX idx_{table}_c{i} ON {table} (c{i})")
+                conn.execute("INSERT INTO _sheets VALUES (?, ?, ?, ?, ?)",
+                             (ordinal, sheet_name, table, json.dumps([_to_portable(h) for h in headers]),
+                              json.dumps(_sheet_types(rows))))
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, output_path)
+
+    @classmethod
+    def read_stamp(cls, compiled_path):
+        conn = sqlite3.connect(f"file:{compiled_path}?mode=ro", uri=True)
+        try:
+            return {k: json.loads(v) for k, v in conn.execute("SELECT key, value FROM _meta")}
+        finally:
+            conn.close()
+
+
+# ============================================================================
+# IN-MEMORY FORMATS (JSON, CSV, PARQUET)
+# ============================================================================
+class _ManifestBackend(TableBackend):
+    """Base for formats that load every sheet into SheetTables on first use."""
+    _loaded = {}   # (compiled_path, mtime) -> OrderedDict(sheet_name -> SheetTable)
+
+    def __init__(self, source_path, compiled_path=None):
+        super().__init__(source_path)
+        self.compiled_path = compiled_path or get_compiled_path(source_path, self.name)
+
+    @property
+    def _stamp_file(self):
+        """File whose mtime identifies the compiled data version."""
+        return self.compiled_path
+
+    @property
+    def _tables(self):
+        key = (self.compiled_path, os.path.getmtime(self._stamp_file))
+        tables = self._loaded.get(key)
+        if tables is None:
+            tables = OrderedDict(
+                (name, SheetTable(headers, [_restore_row(row, row_number, types) for row_number, row in enumerate(rows, start=2)], 0))
+                for name, headers, rows, types in self._read())
+            self._loaded[key] = tables
+        return tables
+
+    def _get_table(self, sheet_name):
+        if sheet_name not in self._tables:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return self._tables[sheet_name]
+
+    def get_all_sheet_names(self):
+        return list(self._tables)
+
+    def _read(self):
+        raise NotImplementedError
+
+
+class JsonBackend(_ManifestBackend):
+    """Single JSON document holding every sheet (dates as ISO-8601 strings, restored from type tags)."""
+    name = 'json'
+    extension = '.json'
+
+    def _read(self):
+        with open(self.compiled_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        return [(s['name'], s['headers'], [tuple(r) for r in s['rows']], _load_types(s['types']))
+                for s in payload['sheets']]
+
+    @classmethod
+    def write(cls, sheets, stamp, test_id_columns, output_path):
+        payload = {
+            'meta': stamp,
+            'sheets': [{'name': name, 'headers': [_to_portable(h) for h in headers],
+                        'rows': [[_to_portable(v) for v in row] for row in rows], 'types': _sheet_types(rows)}
+                       for name, headers, rows in sheets],
+        }
+        _atomic_write_text(output_path, json.dumps(payload))
+
+    @classmethod
+    def read_stamp(cls, compiled_path):
+        with open(compiled_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['meta']
+
+
+class CsvBackend(_ManifestBackend):
+    """Directory with one CSV per sheet plus a manifest. Cells are text; the manifest's type tags restore them."""
+    name = 'csv'
+    extension = '.csv.d'
+
+    def _read(self):
+        manifest = self.read_stamp(self.compiled_path, full=True)
+        sheets = []
+        for sheet in manifest['sheets']:
+            with open(os.path.join(self.compiled_path, sheet['file']), 'r', encoding='utf-8', newline='') as f:
+                rows = [tuple(v if v != '' else None for v in row) for row in csv.reader(f)]
+            sheets.append((sheet['name'], sheet['headers'], rows, _load_types(sheet['types'])))
+        return sheets
+
+    @classmethod
+    def write(cls, sheets, stamp, test_id_columns, output_path):
+        os.makedirs(output_path, exist_ok=True)
+        manifest = {'meta': stamp, 'sheets': []}
+        for ordinal, (name, headers, rows) in enumerate(sheets):
+            file_name = f"{ordinal}.csv"
+            tmp_path = os.path.join(output_path, f"{file_name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerows([['' if v is None else _to_portable(v) for v in row] for row in rows])
+            os.replace(tmp_path, os.path.join(output_path, file_name))
+            manifest['sheets'].append({'name': name, 'file': file_name, 'headers': [_to_portable(h) for h in headers],
+                                       'types': _sheet_types(rows)})
+        _atomic_write_text(os.path.join(output_path, '_manifest.json'), json.dumps(manifest))
+
+    @classmethod
+    def read_stamp(cls, compiled_path, full=False):
+        with open(os.path.join(compiled_path, '_manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if full else manifest['meta']
+
+    @property
+    def _stamp_file(self):
+        # Directory mtime does not track file rewrites, key on the manifest instead
+        return os.path.join(self.compiled_path, '_manifest.json')
+
+
+class ParquetBackend(CsvBackend):
+    """Directory with one Parquet file per sheet (requires pyarrow). Mixed-type columns are stored as text
+    and restored from the manifest's type tags."""
+    name = 'parquet'
+    extension = '.parquet.d'
+
+    def _read(self):
+        import pyarrow.parquet as pq
+        manifest = self.read_stamp(self.compiled_path, full=True)
+        sheets = []
+        for sheet in manifest['sheets']:
+            table = pq.read_table(os.path.join(self.compiled_path, sheet['file']))
+            columns = [table.column(i).to_pylist() for i in range(table.num_columns)]
+            rows = list(zip(*columns)) if columns else []
+            sheets.append((sheet['name'], sheet['headers'], rows, _load_types(sheet['types'])))
+        return sheets
+
+    @classmethod
+    def write(cls, sheets, stamp, test_id_columns, output_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        os.makedirs(output_path, exist_ok=True)
+        manifest = {'meta': stamp, 'sheets': []}
+        for ordinal, (name, headers, rows) in enumerate(sheets):
+            width = max([len(headers)] + [len(r) for r in rows])
+            arrays = []
+            for i in range(width):
+                values = [_to_portable(row[i]) if i < len(row) else None for row in rows]
+                try:
+                    arrays.append(pa.array(values))
+                except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                    arrays.append(pa.array([None if v is None else str(v) for v in values]))
+            file_name = f"{ordinal}.parquet"
+            tmp_path = os.path.join(output_path, f"{file_name}.{os.getpid()}.tmp")
+            pq.write_table(pa.Table.from_arrays(arrays, names=[f"c{i}" for i in range(width)]), tmp_path)
+            os.replace(tmp_path, os.path.join(output_path, file_name))
+            manifest['sheets'].append({'name': name, 'file': file_name, 'headers': [_to_portable(h) for h in headers],
+                                       'types': _sheet_types(rows)})
+        _atomic_write_text(os.path.join(output_path, '_manifest.json'), json.dumps(manifest))
+
+
+BACKENDS = {
+    'excel': ExcelBackend,
+    'sqlite': SqliteBackend,
+    'json': JsonBackend,
+    'csv': CsvBackend,
+    'parquet': ParquetBackend,
+}
+
+
+# ============================================================================
+# COMPILER
+# ============================================================================
+def get_compiled_path(source_path, fmt):
+    """Location of the compiled runtime file for a workbook and format."""
+    return os.path.join(COMPILED_DIR, os.path.basename(source_path) + BACKENDS[fmt].extension)
+
+
+def compile_workbook(source_path, fmt='sqlite', test_id_columns=(), output_path=None):
+    """
+    Compile an Excel workbook into a runtime format.
+    Args:
+        source_path: Full path to the .xlsx file
+        fmt: Target format ('sqlite', 'json', 'csv' or 'parquet')
+        test_id_columns: Columns to index for Test ID lookups (SQLite)
+        output_path: Target path, defaults to .cache/compiled/<workbook><ext>
+    Returns:
+        str: Path of the compiled file
+    """
+    if fmt not in BACKENDS or fmt == 'excel':
+        raise ValueError(f"Unsupported test data format: {fmt}")
+    source_path = os.path.abspath(source_path)
+    output_path = output_path or get_compiled_path(source_path, fmt)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    sheets = []
+    workbook = load_workbook(source_path, read_only=True)
+    try:
+        for sheet_name in workbook.sheetnames:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            headers = list(next(rows, ()))
+            sheets.append((sheet_name, headers, list(rows)))
+    finally:
+        workbook.close()
+    stamp = _source_stamp(source_path)
+    stamp['format_version'] = FORMAT_VERSION
+    stamp['test_id_columns'] = list(test_id_columns)
+    BACKENDS[fmt].write(sheets, stamp, list(test_id_columns), output_path)
+    return output_path
+
+
+def is_compiled_fresh(source_path, fmt, test_id_columns=None):
+    """Check whether the compiled file exists and still matches the workbook."""
+    compiled_path = get_compiled_path(source_path, fmt)
+    if not os.path.exists(compiled_path):
+        return False
+    try:
+        stamp = BACKENDS[fmt].read_stamp(compiled_path)
+    except Exception:
+        return False
+    if stamp.get('format_version') != FORMAT_VERSION:
+        return False
+    if test_id_columns is not None and list(test_id_columns) != stamp.get('test_id_columns'):
+        return False
+    stat = os.stat(source_path)
+    if stat.st_mtime == stamp.get('mtime') and stat.st_size == stamp.get('size'):
+        return True
+    return stat.st_size == stamp.get('size') and _hash_file(source_path) == stamp.get('sha256')
+
+
+def open_backend(source_path, backend='auto', streaming=False, test_id_columns=()):
+    """
+    Open the test data backend for a workbook.
+    Args:
+        source_path: Full path to the .xlsx file
+        backend: 'excel', 'sqlite', 'json', 'csv', 'parquet', or 'auto' (compiled
+            SQLite when it is up to date, otherwise Excel)
+        streaming: Read Excel row by row (Excel backend only)
+        test_id_columns: Columns to index when (re)compiling
+    Returns:
+        TestDataBackend: Backend instance
+    """
+    backend = (backend or 'auto').lower()
+    if backend == 'auto':
+        if not streaming and is_compiled_fresh(source_path, 'sqlite'):
+            return _announce(SqliteBackend(source_path), 'auto')
+        return _announce(ExcelBackend(source_path, streaming=streaming), 'auto')
+    if backend == 'excel':
+        return _announce(ExcelBackend(source_path, streaming=streaming), backend)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown TEST_DATA_BACKEND '{backend}'. Use one of: auto, {', '.join(BACKENDS)}")
+    if not is_compiled_fresh(source_path, backend):
+        compile_workbook(source_path, backend, test_id_columns)
+    return _announce(BACKENDS[backend](source_path), backend)
+
+
+_announced = set()
+
+
+def _announce(backend, requested):
+    """Print which backend serves a workbook, once per process and workbook/backend pair."""
+    key = (backend.source_path, backend.name)
+    if key not in _announced:
+        _announced.add(key)
+        print(f"Test data: {os.path.basename(backend.source_path)} served by {backend.name} backend "
+              f"(TEST_DATA_BACKEND={requested})")
+    return backend
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+def _to_portable(value):
+    """Convert Excel cell values to types every runtime format can store."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+# Type tag -> decoder from the stored value (native or text) back to the openpyxl type.
+# datetime is checked before date (a datetime is a date), bool before int.
+_DECODERS = {
+    'bool': lambda v: v if isinstance(v, bool) else v in (1, '1', 'True', 'true'),
+    'int': int,
+    'float': float,
+    'datetime': lambda v: v if isinstance(v, datetime) else datetime.fromisoformat(v),
+    'date': lambda v: v if isinstance(v, date) else date.fromisoformat(v),
+    'time': lambda v: v if isinstance(v, time) else time.fromisoformat(v),
+}
+_TAGGED_TYPES = ((bool, 'bool'), (int, 'int'), (float, 'float'), (datetime, 'datetime'), (date, 'date'), (time, 'time'))
+
+
+def _type_tag(value):
+    for value_type, tag in _TAGGED_TYPES:
+        if isinstance(value, value_type):
+            return tag
+    return None  # Text (and empty cells) are stored as they are
+
+
+def _sheet_types(rows):
+    """
+    Type tags of a sheet's non-text cells, for JSON storage next to the compiled data.
+    Returns:
+        dict: {column index: tag} when every non-empty cell of the column has that type, or
+              {column index: {row number: tag}} for mixed columns (text cells are untagged)
+    """
+    columns = {}
+    for row_number, row in enumerate(rows, start=2):
+        for col, value in enumerate(row):
+            if value is not None:
+                columns.setdefault(col, {})[row_number] = _type_tag(value)
+    types = {}
+    for col, tags in columns.items():
+        distinct = set(tags.values())
+        if distinct == {None}:
+            continue
+        if len(distinct) == 1:
+            types[str(col)] = distinct.pop()
+        else:
+            types[str(col)] = {str(r): tag for r, tag in tags.items() if tag}
+    return types
+
+
+def _load_types(payload):
+    """Parse stored type tags into {column: tag or {row number: tag}} with integer keys."""
+    types = json.loads(payload) if isinstance(payload, str) else (payload or {})
+    return {int(col): tag if isinstance(tag, str) else {int(r): t for r, t in tag.items()}
+            for col, tag in types.items()}
+
+
+def _restore_row(row, row_number, types):
+    """Row tuple with tagged cells decoded to their original types."""
+    if not types:
+        return tuple(row)
+    values = list(row)
+    for col, tag in types.items():
+        if col >= len(values) or values[col] is None:
+            continue
+        if not isinstance(tag, str):
+            tag = tag.get(row_number)
+            if tag is None:
+                continue
+        values[col] = _DECODERS[tag](values[col])
+    return tuple(values)
+
+
+def _source_stamp(source_path):
+    stat = os.stat(source_path)
+    return {'source': source_path, 'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': _hash_file(source_path)}
+
+
+def _hash_file(file_path):
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _atomic_write_text(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
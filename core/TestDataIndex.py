@@ -0,0 +1,185 @@
+"""
+Test Data Index - Compiled Test ID lookup for Excel test data
+Builds a Test ID -> (sheet, row, row data) index once per workbook and keeps it
+in a sidecar cache file so scenarios resolve their data without opening Excel.
+"""
+from openpyxl import load_workbook
+import hashlib
+import os
+import pickle
+
+# Sheets that hold configuration rather than test data
+NON_DATA_SHEETS = ['environment', 'config', 'settings']
+
+
+class TestDataIndex:
+    """
+    Compiled index of all Test IDs in a workbook.
+    The index is stored in .cache/testdata/ next to the project and is keyed by the
+    workbook's mtime, size and content hash, so it rebuilds automatically when the
+    workbook changes.
+    """
+    INDEX_VERSION = 1
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'testdata')
+
+    # In-process cache: file path -> TestDataIndex
+    _instances = {}
+
+    def __init__(self, file_path, test_id_columns, entries, sheet_names, source_stamp):
+        self.file_path = file_path
+        self.test_id_columns = tuple(test_id_columns)
+        self.entries = entries            # test_id -> (sheet_name, row_number, row_dict)
+        self.sheet_names = sheet_names    # all sheet names in workbook order
+        self.source_stamp = source_stamp  # (mtime, size, sha256)
+
+    # ========================================================================
+    # LOOKUPS
+    # ========================================================================
+    def lookup(self, test_id):
+        """
+        Resolve a Test ID.
+        Returns:
+            tuple: (sheet_name, row_number, row_dict), or None if not found
+        """
+        return self.entries.get(test_id)
+
+    def get_sheet(self, test_id):
+        """Get the sheet name containing the Test ID, or None."""
+        entry = self.entries.get(test_id)
+        return entry[0] if entry else None
+
+    def get_row(self, test_id):
+        """Get a copy of the row data for the Test ID, or None."""
+        entry = self.entries.get(test_id)
+        return dict(entry[2]) if entry else None
+
+    def get_test_id_mapping(self):
+        """Get a {test_id: sheet_name} mapping for all indexed Test IDs."""
+        return {test_id: entry[0] for test_id, entry in self.entries.items()}
+
+    # ========================================================================
+    # BUILD / LOAD
+    # ========================================================================
+    @classmethod
+    def get(cls, file_path, test_id_columns):
+        """
+        Get the index for a workbook, loading the sidecar cache or rebuilding as needed.
+        Args:
+            file_path: Full path to the Excel workbook
+            test_id_columns: List of column names holding Test IDs (e.g., ['Tags'])
+        Returns:
+            TestDataIndex: Up-to-date index for the workbook
+        """
+        file_path = os.path.abspath(file_path)
+        columns = tuple(test_id_columns)
+        stat = os.stat(file_path)
+        index = cls._instances.get(file_path)
+        if index is None or index.test_id_columns != columns or not index._is_fresh(stat):
+            index = cls._load_sidecar(file_path, columns, stat)
+            if index is None:
+                index = cls.build(file_path, columns, stat)
+                index._save_sidecar()
+            cls._instances[file_path] = index
+        return index
+
+    @classmethod
+    def build(cls, file_path, test_id_columns, stat=None):
+        """Build the index by scanning every data sheet of the workbook once."""
+        stat = stat or os.stat(file_path)
+        source_stamp = (stat.st_mtime, stat.st_size, cls._hash_file(file_path))
+        entries = {}
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            sheet_names = list(workbook.sheetnames)
+            for sheet_name in sheet_names:
+                if sheet_name.lower() in NON_DATA_SHEETS:
+                    continue
+                rows = workbook[sheet_name].iter_rows(values_only=True)
+                headers = list(next(rows, ()))
+                search_column_indices = [headers.index(c) for c in test_id_columns if c in headers]
+                if not search_column_indices:
+                    continue
+                for row_number, row in enumerate(rows, start=2):
+                    for col_idx in search_column_indices:
+                        if col_idx < len(row) and row[col_idx] and row[col_idx] not in entries:
+                            # First occurrence wins, matching the sheet-by-sheet search order
+                            entries[row[col_idx]] = (sheet_name, row_number, dict(zip(headers, row)))
+        finally:
+            workbook.close()
+        return cls(file_path, test_id_columns, entries, sheet_names, source_stamp)
+
+    @classmethod
+    def invalidate(cls, file_path=None):
+        """Drop the in-process index for one workbook, or for all workbooks."""
+        if file_path is None:
+            cls._instances.clear()
+        else:
+            cls._instances.pop(os.path.abspath(file_path), None)
+
+    # ========================================================================
+    # SIDECAR CACHE
+    # ========================================================================
+    @classmethod
+    def _sidecar_path(cls, file_path):
+        return os.path.join(cls.CACHE_DIR, f"{os.path.basename(file_path)}.index.pkl")
+
+    @classmethod
+    def _load_sidecar(cls, file_path, test_id_columns, stat):
+        """Load the sidecar index if it matches the workbook, else return None."""
+        sidecar = cls._sidecar_path(file_path)
+        if not os.path.exists(sidecar):
+            return None
+        try:
+            with open(sidecar, 'rb') as f:
+                payload = pickle.load(f)
+            if payload.get('version') != cls.INDEX_VERSION or payload.get('file_path') != file_path:
+                return None
+            if tuple(payload.get('test_id_columns', ())) != test_id_columns:
+                return None
+            index = cls(file_path, test_id_columns, payload['entries'], payload['sheet_names'], payload['source_stamp'])
+            return index if index._is_fresh(stat) else None
+        except Exception:
+            # Corrupt or incompatible sidecar - rebuild from the workbook
+            return None
+
+    def _save_sidecar(self):
+        """Persist the index atomically so parallel workers never read a partial file."""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            sidecar = self._sidecar_path(self.file_path)
+            tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+            payload = {
+                'version': self.INDEX_VERSION,
+                'file_path': self.file_path,
+                'test_id_columns': list(self.test_id_columns),
+                'entries': self.entries,
+                'sheet_names': self.sheet_names,
+                'source_stamp': self.source_stamp,
+            }
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, sidecar)
+        except Exception as e:
+            print(f"Warning: Could not write test data index for {self.file_path}: {e}")
+
+    def _is_fresh(self, stat):
+        """Check the index against the workbook: mtime/size first, content hash only if they moved."""
+        mtime, size, digest = self.source_stamp
+        if stat.st_mtime == mtime and stat.st_size == size:
+            return True
+        if stat.st_size != size:
+            return False
+        if self._hash_file(self.file_path) == digest:
+            # Touched but unchanged - refresh the stamp so the hash is not recomputed again
+            self.source_stamp = (stat.st_mtime, size, digest)
+            self._save_sidecar()
+            return True
+        return False
+
+    @staticmethod
+    def _hash_file(file_path):
+        sha = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
@@ -3,7 +3,10 @@ Test Data Manager - Unified test data management
 Handles both Excel reading and automatic data loading based on scenario tags
 """
 from openpyxl import load_workbook
-from core.Core_basePage import BasePage, get_sheet_for_test_id
+from core.Core_basePage import BasePage
+from core.TestDataIndex import TestDataIndex
+from core.TestDataBackends import open_backend
+from core.TestDataQuery import ColumnarSheet, TestDataQuery
 from getgauge.python import data_store
 import os
 
@@ -15,13 +18,57 @@ class TestDataManager:
     # ========================================================================
     # EXCEL READING METHODS (Low-level operations)
     # ========================================================================
-    def __init__(self, file_name): 
+    # Workbooks at or above this size are read in streaming mode by default
+    STREAMING_THRESHOLD_MB = int(os.getenv('STREAMING_THRESHOLD_MB', 20))
+
+    def __init__(self, file_name, streaming=None, backend=None): 
         """ Initialize Excel reader with file name.
         Args:file_name: Name of the Excel file (will be looked up in data/ folder)
+            streaming: True to read rows lazily in read-only mode (flat memory), False to use
+                the WorkbookCache, None to decide from the file size (STREAMING_THRESHOLD_MB)
+            backend: Runtime data format ('auto', 'excel', 'sqlite', 'json', 'csv', 'parquet'),
+                defaults to TEST_DATA_BACKEND from configuration
+        Lookups are served by the selected backend, so creating a reader is cheap.
         """
+        self.file_path = self.resolve_data_path(file_name)
+        self._workbook = None
+        if streaming is None:
+            try:
+                streaming = os.path.getsize(self.file_path) >= self.STREAMING_THRESHOLD_MB * 1024 * 1024
+            except OSError:
+                streaming = False
+        self.streaming = streaming
+        self.backend = open_backend(self.file_path, backend or self.get_backend_name(),
+                                    streaming=streaming, test_id_columns=self._get_index_columns())
+
+    @staticmethod
+    def resolve_data_path(file_name):
+        """Get the full path of a file in the data/ folder."""
         data_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)),'data')
-        self.file_path = os.path.join(data_folder, file_name)
-        self.workbook = load_workbook(self.file_path)
+        return os.path.join(data_folder, file_name)
+
+    @staticmethod
+    def get_backend_name():
+        """Get the configured TEST_DATA_BACKEND ('auto' when not configured)."""
+        try:
+            return BasePage.get_settings().test_data_backend
+        except Exception:
+            # No Environment workbook available (e.g. standalone tools)
+            return os.getenv('TEST_DATA_BACKEND') or 'auto'
+
+    @staticmethod
+    def _get_index_columns():
+        try:
+            return BasePage.get_test_id_columns()
+        except Exception:
+            return []
+
+    @property
+    def workbook(self):
+        """Full openpyxl workbook, loaded on first access (for callers that need cell objects)."""
+        if self._workbook is None:
+            self._workbook = load_workbook(self.file_path)
+        return self._workbook
     
     def get_row_data(self, sheet_name, row_number):
         """Get data from a specific row in the Excel sheet.
@@ -29,10 +76,7 @@ class TestDataManager:
             row_number: Row number to read (1-indexed)       
         Returns: dict: Dictionary with column headers as keys and row values as values
         """
-        sheet = self.workbook[sheet_name]
-        headers = [cell.value for cell in sheet[1]]
-        row_data = [cell.value for cell in sheet[row_number]]
-        return dict(zip(headers, row_data))
+        return self.backend.get_row_data(sheet_name, row_number)
     
     def get_test_data_by_id(self, sheet_name, test_id, test_id_columns):
         """
@@ -44,23 +88,56 @@ class TestDataManager:
         Returns:
             dict: Dictionary with test data, or None if not found
         """
-        sheet = self.workbook[sheet_name]
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
-        # Find which columns to search in
-        search_column_indices = []
-        for col_name in test_id_columns:
-            if col_name in headers:
-                search_column_indices.append(headers.index(col_name))
-        if not search_column_indices:
-            return None
-        # Search for test_id in the specified columns
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            for col_idx in search_column_indices:
-                if col_idx < len(row) and row[col_idx] == test_id:
-                    # Found the test ID, return the row data as dictionary
-                    return dict(zip(headers, row))
-        return None
+        return self.backend.get_test_data_by_id(sheet_name, test_id, test_id_columns)
+
+    # ========================================================================
+    # STREAMING ACCESS (bounded memory, for large data sheets)
+    # ========================================================================
+    def iter_rows(self, sheet_name, min_row=2, max_row=None):
+        """
+        Lazily yield rows as tuples of values.
+        In streaming mode only the current row is held in memory, regardless of sheet size.
+        Args:
+            sheet_name: Name of the sheet
+            min_row: First row to yield (1-indexed, default skips the header)
+            max_row: Last row to yield, or None for the end of the sheet
+        Yields:
+            tuple: Cell values of each row
+        """
+        return self.backend.iter_rows(sheet_name, min_row=min_row, max_row=max_row)
+
+    def iter_row_dicts(self, sheet_name, min_row=2, max_row=None):
+        """
+        Lazily yield rows as dictionaries keyed by the header row.
+        Args:
+            sheet_name: Name of the sheet
+            min_row: First row to yield (1-indexed, default skips the header)
+            max_row: Last row to yield, or None for the end of the sheet
+        Yields:
+            dict: Column headers mapped to row values
+        """
+        headers = self.get_headers(sheet_name)
+        for row in self.iter_rows(sheet_name, min_row=min_row, max_row=max_row):
+            yield dict(zip(headers, row))
+
+    def get_headers(self, sheet_name):
+        """Get the header row (row 1) of a sheet as a list."""
+        return self.backend.get_headers(sheet_name)
+    
+    # ========================================================================
+    # COLUMNAR QUERIES (data-driven row selection)
+    # ========================================================================
+    def query(self, sheet_name):
+        """
+        Start a vectorized query over a sheet.
+        Args:
+            sheet_name: Name of the sheet
+        Returns:
+            TestDataQuery: Chainable query (where/filter/select/order_by/limit/sample/group_by)
+        Example:
+            excel.query('EmployeeCreation').where('Salary', '>', 50000).rows()
+        """
+        return TestDataQuery(ColumnarSheet.get(self.backend, sheet_name))
     
     def get_all_sheet_names(self):
         """
@@ -68,11 +145,14 @@ class TestDataManager:
         Returns:
             list: List of sheet names
         """
-        return self.workbook.sheetnames
+        return self.backend.get_all_sheet_names()
     
     def close(self):
-        """Close the workbook."""
-        self.workbook.close()
+        """Close the workbook (cached sheet tables stay available to other readers)."""
+        self.backend.close()
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
     
     # ========================================================================
     # AUTOMATIC TEST DATA MANAGEMENT (High-level Gauge integration)
@@ -91,16 +171,12 @@ class TestDataManager:
         if not test_id:
             # No test ID found in tags, return None
             return None
-        # Get test data file and sheet
-        test_data_file = BasePage.get_test_data_file()
-        test_data_sheet = get_sheet_for_test_id(test_id)
-        if not test_data_sheet:
+        # Resolve sheet and row from the compiled index (no workbook parsing on a warm cache)
+        entry = cls.get_test_data_index().lookup(test_id)
+        if not entry:
             return None
-        # Fetch test data from Excel using instance methods
-        excel = cls(test_data_file)
-        test_id_columns = BasePage.get_test_id_columns()
-        test_data = excel.get_test_data_by_id(test_data_sheet, test_id, test_id_columns)
-        excel.close()
+        test_data_sheet, _, _ = entry
+        test_data = dict(entry[2])
         # Store in data_store for access across steps
         if test_data:
             data_store.scenario['test_data'] = test_data
@@ -108,6 +184,16 @@ class TestDataManager:
             data_store.scenario['test_sheet'] = test_data_sheet
         return test_data
     
+    @classmethod
+    def get_test_data_index(cls):
+        """
+        Get the compiled Test ID index for the configured test data file.
+        Returns:
+            TestDataIndex: Index that rebuilds itself when the workbook changes
+        """
+        file_path = cls.resolve_data_path(BasePage.get_test_data_file())
+        return TestDataIndex.get(file_path, BasePage.get_test_id_columns())
+
     @classmethod
     def get_test_data(cls):
         """
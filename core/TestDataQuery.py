@@ -0,0 +1,312 @@
+"""
+Test Data Query - Columnar, vectorized selection over test data sheets
+Loads a sheet once into column arrays (NumPy when installed, plain lists otherwise)
+and offers a small chainable query API: where/filter, select, order_by, limit,
+sample and group_by.
+
+Example:
+    employees = TestDataManager(file).query('EmployeeCreation')
+    rows = (employees.where('Department', '==', 'Finance')
+                     .where('Salary', '>', 50000)
+                     .order_by('Salary', descending=True)
+                     .select('Username', 'Salary')
+                     .limit(10)
+                     .rows())
+"""
+from collections import OrderedDict
+import math
+import numbers
+import os
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - fall back to pure Python columns
+    np = None
+
+
+class ColumnarSheet:
+    """
+    Column-oriented copy of one sheet.
+    Each column keeps the original cell values (object array) plus a lazily built
+    float64 view used for numeric comparisons and sorting (NaN for non-numbers).
+    """
+    MAX_CACHED_SHEETS = 8
+    _cache = OrderedDict()   # (backend, source path, mtime, sheet) -> ColumnarSheet
+
+    def __init__(self, headers, rows):
+        self.headers = [h for h in headers]
+        self.size = len(rows)
+        self._values = {}
+        self._numeric = {}
+        for col_idx, header in enumerate(self.headers):
+            column = [row[col_idx] if col_idx < len(row) else None for row in rows]
+            if np is not None:
+                array = np.empty(self.size, dtype=object)
+                array[:] = column
+                column = array
+            self._values[header] = column
+
+    @classmethod
+    def get(cls, backend, sheet_name):
+        """
+        Get the columnar form of a sheet, converting it once per workbook version.
+        Args:
+            backend: TestDataBackend serving the workbook
+            sheet_name: Name of the sheet
+        """
+        key = (backend.name, backend.source_path, os.path.getmtime(backend.source_path), sheet_name)
+        sheet = cls._cache.get(key)
+        if sheet is None:
+            sheet = cls(backend.get_headers(sheet_name), list(backend.iter_rows(sheet_name)))
+            cls._cache[key] = sheet
+            while len(cls._cache) > cls.MAX_CACHED_SHEETS:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return sheet
+
+    def __len__(self):
+        return self.size
+
+    def values(self, column):
+        """Original values of a column."""
+        if column not in self._values:
+            raise KeyError(f"Column '{column}' not found. Available columns: {self.headers}")
+        return self._values[column]
+
+    def numeric(self, column):
+        """Float view of a column (NaN where the value is not a number)."""
+        if column not in self._numeric:
+            converted = [_to_float(v) for v in self.values(column)]
+            self._numeric[column] = np.array(converted, dtype=np.float64) if np is not None else converted
+        return self._numeric[column]
+
+
+class TestDataQuery:
+    """
+    Immutable, chainable query over a ColumnarSheet.
+    Each call returns a new query; nothing touches the rows until rows()/first()/
+    count()/column() is called.
+    """
+    OPERATORS = ('==', '!=', '>', '>=', '<', '<=', 'in', 'not in', 'contains', 'startswith')
+
+    def __init__(self, sheet, indices=None, columns=None):
+        self.sheet = sheet
+        if indices is None:
+            indices = np.arange(sheet.size, dtype=np.int64) if np is not None else list(range(sheet.size))
+        self._indices = indices
+        self._columns = columns
+
+    # ========================================================================
+    # SELECTION
+    # ========================================================================
+    def where(self, column, op, value):
+        """
+        Keep rows where `column op value` holds.
+        Args:
+            column: Column header
+            op: One of ==, !=, >, >=, <, <=, in, not in, contains, startswith
+            value: Value to compare against (a collection for 'in'/'not in')
+        Returns:
+            TestDataQuery: Filtered query
+        """
+        if op not in self.OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}'. Use one of: {', '.join(self.OPERATORS)}")
+        if op in ('>', '>=', '<', '<=') and _is_number(value):
+            mask = self._numeric_mask(column, op, float(value))
+        else:
+            mask = self._object_mask(column, op, value)
+        return self._with(self._apply_mask(mask))
+
+    def filter(self, predicate=None, **equals):
+        """
+        Keep rows matching all column=value pairs and, optionally, a row predicate.
+        Args:
+            predicate: Callable receiving the row dict (evaluated per row, not vectorized)
+            **equals: Column equality conditions, e.g. filter(ModuleName='Login')
+        """
+        query = self
+        for column, value in equals.items():
+            query = query.where(column, '==', value)
+        if predicate is not None:
+            keep = [i for i in query._indices if predicate(query._row(i, self.sheet.headers))]
+            query = query._with(np.array(keep, dtype=np.int64) if np is not None else keep)
+        return query
+
+    def select(self, *columns):
+        """Project the result onto the given columns."""
+        for column in columns:
+            self.sheet.values(column)  # Validate early
+        return TestDataQuery(self.sheet, self._indices, list(columns))
+
+    def order_by(self, column, descending=False):
+        """Sort by a column (numbers numerically, then everything else as text; empty cells last)."""
+        numeric = self.sheet.numeric(column)
+        values = self.sheet.values(column)
+        if np is not None:
+            keys = numeric[self._indices]
+            if not np.isnan(keys).any():
+                order = np.argsort(-keys if descending else keys, kind='stable')
+                return self._with(self._indices[order])
+        indices = list(self._indices)
+        present = [i for i in indices if values[i] is not None]
+        missing = [i for i in indices if values[i] is None]
+        # Mixed columns: numbers keep their numeric order and text sorts after them
+        present.sort(key=lambda i: (True, 0.0, str(values[i])) if math.isnan(numeric[i]) else (False, numeric[i], ""),
+                     reverse=descending)
+        ordered = present + missing
+        return self._with(np.array(ordered, dtype=np.int64) if np is not None else ordered)
+
+    def limit(self, n):
+        """Keep the first n rows."""
+        return self._with(self._indices[:n])
+
+    def sample(self, n, seed=None):
+        """Pick n random rows (all rows if fewer are available), keeping sheet order."""
+        n = min(n, len(self._indices))
+        if np is not None:
+            picked = np.random.default_rng(seed).choice(self._indices, size=n, replace=False)
+            return self._with(np.sort(picked))
+        return self._with(sorted(random.Random(seed).sample(list(self._indices), n)))
+
+    def group_by(self, column):
+        """
+        Split the result by the values of a column.
+        Returns:
+            OrderedDict: value -> TestDataQuery, in first-seen order
+        """
+        values = self.sheet.values(column)
+        groups = OrderedDict()
+        for i in self._indices:
+            groups.setdefault(values[i], []).append(i)
+        return OrderedDict(
+            (key, self._with(np.array(idx, dtype=np.int64) if np is not None else idx))
+            for key, idx in groups.items()
+        )
+
+    # ========================================================================
+    # RESULTS
+    # ========================================================================
+    def rows(self):
+        """Materialize the result as a list of row dictionaries."""
+        columns = self._columns or self.sheet.headers
+        return [self._row(i, columns) for i in self._indices]
+
+    def first(self):
+        """First matching row as a dictionary, or None."""
+        if len(self._indices) == 0:
+            return None
+        return self._row(self._indices[0], self._columns or self.sheet.headers)
+
+    def count(self):
+        """Number of matching rows."""
+        return len(self._indices)
+
+    def column(self, name):
+        """Values of one column for the matching rows."""
+        values = self.sheet.values(name)
+        if np is not None:
+            return values[self._indices].tolist()
+        return [values[i] for i in self._indices]
+
+    def row_numbers(self):
+        """Sheet row numbers (1-indexed, header is row 1) of the matching rows."""
+        return [int(i) + 2 for i in self._indices]
+
+    def sum(self, column):
+        """Sum of the numeric values of a column (non-numbers ignored)."""
+        numeric = self.sheet.numeric(column)
+        if np is not None:
+            return float(np.nansum(numeric[self._indices]))
+        return float(sum(numeric[i] for i in self._indices if not math.isnan(numeric[i])))
+
+    def mean(self, column):
+        """Mean of the numeric values of a column, or None if there are none."""
+        numeric = self.sheet.numeric(column)
+        if np is not None:
+            selected = numeric[self._indices]
+            selected = selected[~np.isnan(selected)]
+            return float(selected.mean()) if selected.size else None
+        selected = [numeric[i] for i in self._indices if not math.isnan(numeric[i])]
+        return sum(selected) / len(selected) if selected else None
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        return iter(self.rows())
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+    def _with(self, indices):
+        return TestDataQuery(self.sheet, indices, self._columns)
+
+    def _row(self, i, columns):
+        return {column: self.sheet.values(column)[i] for column in columns}
+
+    def _apply_mask(self, mask):
+        if np is not None:
+            return self._indices[mask[self._indices]]
+        return [i for i in self._indices if mask[i]]
+
+    def _numeric_mask(self, column, op, value):
+        numeric = self.sheet.numeric(column)
+        if np is not None:
+            with np.errstate(invalid='ignore'):
+                return _COMPARE[op](numeric, value)
+        return [not math.isnan(v) and _COMPARE[op](v, value) for v in numeric]
+
+    def _object_mask(self, column, op, value):
+        values = self.sheet.values(column)
+        if op in ('in', 'not in'):
+            allowed = set(value)
+            test = (lambda v: v in allowed) if op == 'in' else (lambda v: v not in allowed)
+        elif op == 'contains':
+            test = lambda v: v is not None and str(value) in str(v)
+        elif op == 'startswith':
+            test = lambda v: v is not None and str(v).startswith(str(value))
+        elif op in ('==', '!='):
+            if np is not None:
+                return (values == value) if op == '==' else (values != value)
+            test = (lambda v: v == value) if op == '==' else (lambda v: v != value)
+        else:
+            compare = _COMPARE[op]
+            test = lambda v: v is not None and _safe_compare(compare, v, value)
+        if np is not None:
+            return np.frompyfunc(test, 1, 1)(values).astype(bool)
+        return [test(v) for v in values]
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+_COMPARE = {
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+}
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _to_float(value):
+    if _is_number(value):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return math.nan
+    return math.nan
+
+
+def _safe_compare(compare, a, b):
+    try:
+        return compare(a, b)
+    except TypeError:
+        return compare(str(a), str(b))
@@ -0,0 +1,206 @@
+"""
+Timings - Monotonic timing of Gauge hooks, steps and named spans
+Frames are nested: suite > spec > scenario > step, with every hook and span inside the
+frame it runs in. Each frame records total and self (exclusive) time, aggregated per
+path, so the same step in two scenarios is kept apart.
+
+At suite end the profile is exported per worker as
+    reports/timings/timings_<pid>.json        per-path count/total/self/max + per-kind summaries
+    reports/timings/timings_<pid>.collapsed   "suite;spec:..;scenario:..;step:.. <self µs>" lines
+The collapsed file feeds flamegraph.pl / speedscope directly.
+
+Example:
+    @before_scenario
+    @Timings.hook('before_scenario', opens=lambda context: f"scenario:{context.scenario.name}")
+    def init_context(context): ...
+
+    with Timings.span('create_context'):
+        BasePage.create_context()
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+import inspect
+import json
+import os
+import time
+
+
+class _Frame:
+    __slots__ = ('name', 'start', 'child')
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.child = 0.0
+
+
+class Timings:
+    """
+    Process-wide frame stack. Gauge runs hooks and steps on one thread per worker, so
+    the stack is not thread-safe by design; spans must not be used from other threads.
+    """
+    _stack = []
+    _stats = defaultdict(lambda: {'count': 0, 'total': 0.0, 'self': 0.0, 'max': 0.0})
+
+    # ====================================
+    # Frames
+    # ====================================
+    @classmethod
+    def begin(cls, name):
+        """Open a frame. Returns it for end()."""
+        frame = _Frame(name)
+        cls._stack.append(frame)
+        return frame
+
+    @classmethod
+    def end(cls, frame=None):
+        """
+        Close frame (default: the innermost), closing any frames still open inside it.
+        Closing a frame that is no longer open is a no-op.
+        """
+        if not cls._stack or (frame is not None and frame not in cls._stack):
+            return
+        target = frame or cls._stack[-1]
+        while cls._stack:
+            current = cls._stack[-1]
+            cls._close(current)
+            if current is target:
+                break
+
+    @classmethod
+    def _close(cls, frame):
+        elapsed = time.perf_counter() - frame.start
+        path = tuple(f.name for f in cls._stack)
+        cls._stack.pop()
+        stats = cls._stats[path]
+        stats['count'] += 1
+        stats['total'] += elapsed
+        stats['self'] += max(elapsed - frame.child, 0.0)
+        stats['max'] = max(stats['max'], elapsed)
+        if cls._stack:
+            cls._stack[-1].child += elapsed
+
+    @classmethod
+    @contextmanager
+    def span(cls, name):
+        """Time a block as a child frame of whatever is running."""
+        frame = cls.begin(f"span:{name}")
+        try:
+            yield
+        finally:
+            cls.end(frame)
+
+    @classmethod
+    def hook(cls, name, opens=None, closes=False):
+        """
+        Decorator timing a Gauge hook as a "hook:<name>" frame.
+        Args:
+            name: Hook name in the profile
+            opens: Optional callable(*hook args) returning an enclosing frame name opened
+                   before the hook (suite, spec, scenario, step)
+            closes: Close the enclosing frame after the hook (the matching after_* hook)
+        The wrapper keeps the hook's parameter count, which Gauge uses to decide whether to
+        pass the ExecutionContext.
+        """
+        def decorator(fn):
+            def run(*args):
+                if opens:
+                    cls.begin(opens(*args))
+                frame = cls.begin(f"hook:{name}")
+                try:
+                    return fn(*args)
+                finally:
+                    cls.end(frame)
+                    if closes:
+                        cls.end()
+
+            if inspect.signature(fn).parameters:
+                def wrapper(context):
+                    return run(context)
+            else:
+                def wrapper():
+                    return run()
+            wrapper.__name__ = fn.__name__
+            wrapper.__doc__ = fn.__doc__
+            return wrapper
+        return decorator
+
+    @classmethod
+    def finish(cls):
+        """Close every open frame (call at the end of after_suite, before export)."""
+        if cls._stack:
+            cls.end(cls._stack[0])
+
+    # ====================================
+    # Reporting
+    # ====================================
+    @classmethod
+    def get_stats(cls):
+        """List of {path, kind, name, count, total_ms, self_ms, max_ms}, slowest total first."""
+        rows = []
+        for path, s in cls._stats.items():
+            kind, _, name = path[-1].partition(':')
+            rows.append({
+                'path': list(path),
+                'kind': kind if name else 'frame',
+                'name': name or path[-1],
+                'count': s['count'],
+                'total_ms': round(s['total'] * 1000, 2),
+                'self_ms': round(s['self'] * 1000, 2),
+                'max_ms': round(s['max'] * 1000, 2),
+            })
+        rows.sort(key=lambda r: -r['total_ms'])
+        return rows
+
+    @classmethod
+    def summarize(cls, rows=None):
+        """Totals per kind and name (e.g. every 'hook:before_scenario' across scenarios)."""
+        by_name = defaultdict(lambda: {'count': 0, 'total_ms': 0.0, 'self_ms': 0.0})
+        for r in rows if rows is not None else cls.get_stats():
+            entry = by_name[(r['kind'], r['name'])]
+            entry['count'] += r['count']
+            entry['total_ms'] += r['total_ms']
+            entry['self_ms'] += r['self_ms']
+        summary = defaultdict(dict)
+        for (kind, name), entry in sorted(by_name.items(), key=lambda kv: -kv[1]['total_ms']):
+            summary[kind][name] = {k: round(v, 2) for k, v in entry.items()}
+        return dict(summary)
+
+    @classmethod
+    def export(cls, out_dir=None):
+        """
+        Write the JSON profile and the collapsed-stack file for this worker.
+        Returns:
+            tuple: (json path, collapsed path), or None if nothing was timed
+        """
+        rows = cls.get_stats()
+        if not rows:
+            return None
+        out_dir = Path(out_dir or Path(os.environ.get("GAUGE_REPORTS_DIR", "reports")) / 'timings')
+        out_dir.mkdir(parents=True, exist_ok=True)
+        json_path = out_dir / f"timings_{os.getpid()}.json"
+        collapsed_path = out_dir / f"timings_{os.getpid()}.collapsed"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'frames': rows, 'summary': cls.summarize(rows)}, f, indent=2)
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for r in rows:
+                self_us = int(r['self_ms'] * 1000)
+                if self_us > 0:
+                    # ';' separates frames in the collapsed format
+                    f.write(";".join(p.replace(';', ',') for p in r['path']) + f" {self_us}\n")
+        return json_path, collapsed_path
+
+    @classmethod
+    def format_top(cls, top=10):
+        """The slowest steps, hooks and spans (total time per path)."""
+        rows = [r for r in cls.get_stats() if r['kind'] in ('step', 'hook', 'span')]
+        if not rows:
+            return "Timings: nothing recorded"
+        lines = [f"Slowest {min(top, len(rows))} steps/hooks/spans:"]
+        for r in rows[:top]:
+            where = " > ".join(p.partition(':')[2] or p for p in r['path'][1:-1])
+            count = f" ({r['count']}x)" if r['count'] > 1 else ""
+            context = f"  [{where}]" if where else ""
+            lines.append(f"  {r['total_ms'] / 1000:8.2f}s  {r['kind']} {r['name']}{count}{context}")
+        return "\n".join(lines)
@@ -1,27 +1,203 @@
 from playwright.sync_api import Page
+from datetime import date, datetime, time as dt_time
 import time
 import os
-from getgauge.python import Messages, data_store
+import random
+import threading
+from getgauge.python import data_store
+from core.ReportLogger import ReportLogger
+from core.EventLog import EventLog
+from core.BrowserSession import BrowserSession
+from core.TableSnapshot import TableSnapshot, TABLE_SNAPSHOT_JS
+from core.SelectorScripts import RESOLVE_SELECTOR_JS
+from core.PlaywrightProfiler import PlaywrightProfiler
+
+# First data row of a <table> or ARIA grid (what TABLE_SNAPSHOT_JS reads as body rows)
+_TABLE_BODY_ROW = "tbody tr:has(td), [role=row]:has([role=cell], [role=gridcell])"
+# Fills every field of a form and reads the values back in one page.evaluate call.
+# Selectors: CSS, "css=...", XPath ("//", "(//", "xpath=..."). Anything else (text=, role=,
+# ">>" chains, ...) is reported as 'unsupported' and filled with Playwright locators instead.
+_FILL_FORM_JS = """
+fields => {""" + RESOLVE_SELECTOR_JS + """
+    const truthy = v => v === true || ['true', 'yes', 'y', '1', 'on', 'checked'].includes(String(v).trim().toLowerCase());
+    const kindOf = el => {
+        if (el.tagName === 'SELECT') return 'select';
+        if (el.tagName === 'TEXTAREA') return 'text';
+        if (el.tagName === 'INPUT') {
+            const type = (el.type || 'text').toLowerCase();
+            if (type === 'checkbox' || type === 'radio') return 'check';
+            if (['file', 'button', 'submit', 'reset', 'image'].includes(type)) return null;
+            return 'text';
+        }
+        return el.isContentEditable ? 'editable' : null;
+    };
+    const setValue = (el, value) => {
+        // Native setter so framework-controlled inputs (React, Vue) see the change
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    };
+    const fire = el => {
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+    const readBack = (el, kind) => {
+        if (kind === 'check') return el.checked;
+        if (kind === 'select') {
+            const values = Array.from(el.selectedOptions).map(o => o.value);
+            return el.multiple ? values : (values[0] ?? '');
+        }
+        return kind === 'editable' ? el.textContent : el.value;
+    };
+    // Pass 1: set every field
+    const filled = fields.map(([sel, value]) => {
+        let el;
+        try { el = resolve(sel); } catch (e) { return {status: 'unsupported'}; }
+        if (!el) return {status: 'missing'};
+        if (el.tagName === 'LABEL' && el.control) el = el.control;
+        const kind = kindOf(el);
+        if (!kind) return {status: 'unsupported'};
+        const rect = el.getBoundingClientRect();
+        if (!rect.width || !rect.height || getComputedStyle(el).visibility === 'hidden') return {status: 'hidden'};
+        if (el.disabled || el.readOnly) return {status: 'not-editable'};
+        let expected;
+        if (kind === 'check') {
+            expected = truthy(value);
+            // A click never unchecks a radio - it is cleared by selecting another option of its group
+            if (el.type === 'radio' && !expected && el.checked) return {el, kind, expected, status: 'radio-uncheck'};
+            if (el.checked !== expected) el.click();
+        } else if (kind === 'select') {
+            const wanted = (Array.isArray(value) ? value : [value]).map(String);
+            const matched = [];
+            for (const option of el.options) {
+                const hit = wanted.includes(option.value) || wanted.includes(option.label.trim());
+                if (hit && (el.multiple || !matched.length)) matched.push(option.value);
+                option.selected = matched.includes(option.value) && hit;
+            }
+            if (matched.length < wanted.length) return {el, kind, expected: wanted, status: 'mismatch'};
+            expected = el.multiple ? matched : matched[0];
+            fire(el);
+        } else {
+            expected = String(value);
+            // Workbook dates arrive as datetimes at midnight; a date input takes the date part only
+            if (el.type === 'date' && /^\d{4}-\d{2}-\d{2}T/.test(expected)) expected = expected.slice(0, 10);
+            el.focus();
+            if (kind === 'editable') el.textContent = expected; else setValue(el, expected);
+            fire(el);
+            el.blur();
+        }
+        return {el, kind, expected, status: 'ok'};
+    });
+    // Pass 2: verify after all change handlers have run
+    return filled.map(r => {
+        if (!r.el) return {status: r.status, actual: null};
+        const actual = readBack(r.el, r.kind);
+        const same = JSON.stringify(actual) === JSON.stringify(r.expected);
+        return {status: r.status === 'ok' && !same ? 'mismatch' : r.status, actual};
+    });
+}
+"""
+
 # ============================================================================
 # WEB ELEMENT HELPER CLASS
 # ============================================================================
 class WebElementHelper:
-    """Unified helper for all web elements"""
-    
-    def __init__(self, page: Page):
-        self.page = page
-    
-    def _log_pass(self, action, selector, details=""):
-        """Log pass message"""
-        Messages.write_message(f"✓ PASS: {action} on '{selector}' {details}")
+    """
+    Unified helper for all web elements.
+    Actions that read their result back (input_value after fill, is_checked after check, ...)
+    follow VERIFY_LEVEL: strict = always, sampled = VERIFY_SAMPLE_RATE of actions,
+    off = rely on Playwright's actionability checks. Skipped read-backs are counted.
+    Sampling is deterministic: each decision comes from a random.Random seeded with
+    VERIFY_SEED, the scenario name and the action's position in the scenario, so a
+    rerun reads back the same actions.
+    """
+    VERIFY_LEVELS = ('strict', 'sampled', 'off')
+    _verify_lock = threading.Lock()
+    _verify_stats = {'verified': 0, 'skipped': 0}
+
+    def __init__(self, page: Page, verify_level=None, sample_rate=None, seed=None):
+        """
+        Args:
+            page: Playwright page
+            verify_level: strict/sampled/off (default: VERIFY_LEVEL of the current session's settings)
+            sample_rate: Fraction of actions verified when sampled (default: VERIFY_SAMPLE_RATE)
+            seed: Sampling seed (default: VERIFY_SEED)
+        """
+        self.page = PlaywrightProfiler.wrap(page)
+        self._tables = {}  # selector -> TableSnapshot
+        settings = BrowserSession.current().settings
+        self.verify_level = (verify_level or (settings.verify_level if settings else 'strict')).lower()
+        if self.verify_level not in self.VERIFY_LEVELS:
+            raise ValueError(f"Unknown verify level '{verify_level}'. Use one of: {', '.join(self.VERIFY_LEVELS)}")
+        self.sample_rate = sample_rate if sample_rate is not None else (settings.verify_sample_rate if settings else 0.1)
+        self.seed = seed if seed is not None else (settings.verify_seed if settings else 0)
+
+    def _log_pass(self, action, selector, details="", verify=None):
+        """Log pass message (verify: verification mode that applied, shown in the report)"""
+        if verify:
+            details = f"{details} [verify: {verify}]"
+        ReportLogger.write(f"✓ PASS: {action} on '{selector}' {details}")
+        EventLog.emit('action', action=action, selector=selector, status='passed', verify=verify)
         if not hasattr(data_store.scenario, 'passed_steps'):
             data_store.scenario.passed_steps = []
         data_store.scenario.passed_steps.append(f"{action}: {selector}")
     
     def _log_fail(self, action, selector, error):
         """Log fail message with screenshot"""
-        Messages.write_message(f"✗ FAIL: {action} on '{selector}'")
-        Messages.write_message(f"✗ Error: {str(error)}")
+        self._record_fail(action, selector, error)
+        self._capture_error_screenshot(action)
+        raise AssertionError(f"{action} failed: {str(error)}")
+
+    def _record_fail(self, action, selector, error):
+        """Log fail message without raising (used by bulk actions that report every field)"""
+        ReportLogger.write(f"✗ FAIL: {action} on '{selector}'\n✗ Error: {str(error)}", 'ERROR')
+        EventLog.emit('action', action=action, selector=selector, status='failed', error=str(error))
+        if not hasattr(data_store.scenario, 'failed_steps'):
+            data_store.scenario.failed_steps = []
+        data_store.scenario.failed_steps.append(f"{action}: {selector}")
+
+    # ========== VERIFICATION ==========
+    def _verify(self):
+        """
+        Decide whether the current action reads its result back.
+        Returns:
+            tuple: (verify, mode label for the log)
+        """
+        if self.verify_level == 'strict':
+            verify, label = True, "strict"
+        elif self.verify_level == 'sampled':
+            # n-th sampled action of the scenario (shared by every helper instance)
+            sequence = data_store.scenario.get('verify_sequence', 0) + 1
+            data_store.scenario['verify_sequence'] = sequence
+            scenario = data_store.scenario.get('name', '')
+            verify = random.Random(f"{self.seed}|{scenario}|{sequence}").random() < self.sample_rate
+            label = "sampled" if verify else "sampled, skipped"
+        else:
+            verify, label = False, "off"
+        key = 'verified' if verify else 'skipped'
+        with self._verify_lock:
+            self._verify_stats[key] += 1
+        scenario_stats = data_store.scenario.get('verify_stats')
+        if scenario_stats is None:
+            scenario_stats = data_store.scenario['verify_stats'] = {'verified': 0, 'skipped': 0}
+        scenario_stats[key] += 1
+        return verify, label
+
+    @staticmethod
+    def get_scenario_verify_stats():
+        """{'verified': n, 'skipped': n} read-backs for the running scenario."""
+        return dict(data_store.scenario.get('verify_stats') or {'verified': 0, 'skipped': 0})
+
+    @classmethod
+    def format_verify_stats(cls, stats=None, level=""):
+        """One line: read-backs done vs skipped (each skip is one browser round trip saved)."""
+        with cls._verify_lock:
+            s = dict(stats or cls._verify_stats)
+        total = s['verified'] + s['skipped']
+        saved = (s['skipped'] / total * 100) if total else 0.0
+        return (f"Verification{f' ({level})' if level else ''}: {s['verified']}/{total} actions read back, "
+                f"{s['skipped']} round trips saved ({saved:.1f}%)")
+
+    def _capture_error_screenshot(self, action):
         try:
             # Use GAUGE_REPORTS_DIR if set, otherwise default to 'reports'
             base_report_dir = os.environ.get("GAUGE_REPORTS_DIR", "reports")
@@ -29,13 +205,10 @@ class WebElementHelper:
             os.makedirs(screenshot_dir, exist_ok=True)
             screenshot_path = os.path.join(screenshot_dir, f"error_{action}_{int(time.time())}.png")
             self.page.screenshot(path=screenshot_path)
-            Messages.write_message(f"✗ Screenshot: {screenshot_path}")
+            ReportLogger.write(f"✗ Screenshot: {screenshot_path}", 'ERROR')
+            EventLog.emit('artifact', kind='screenshot', path=screenshot_path)
         except:
             pass
-        if not hasattr(data_store.scenario, 'failed_steps'):
-            data_store.scenario.failed_steps = []
-        data_store.scenario.failed_steps.append(f"{action}: {selector}")
-        raise AssertionError(f"{action} failed: {str(error)}")
     
     # ========== EDIT BOX ==========
     def editbox_enter_text(self, selector, text, clear=True):
@@ -46,11 +219,13 @@ class WebElementHelper:
             if clear:
                 element.clear()
             element.fill(text)
-            actual = element.input_value()
-            if actual == text:
-                self._log_pass("editbox_enter_text", selector, f"- Text: '{text}'")
-            else:
-                self._log_fail("editbox_enter_text", selector, f"Expected '{text}', got '{actual}'")
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify:
+                actual = element.input_value()
+                if actual != text:
+                    self._log_fail("editbox_enter_text", selector, f"Expected '{text}', got '{actual}'")
+            self._log_pass("editbox_enter_text", selector, f"- Text: '{text}'", verify=mode)
             return True
         except Exception as e:
             self._log_fail("editbox_enter_text", selector, e)
@@ -71,11 +246,11 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.check()
-            is_checked = element.is_checked()
-            if is_checked:
-                self._log_pass("checkbox_check", selector, "- Checked successfully")
-            else:
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify and not element.is_checked():
                 self._log_fail("checkbox_check", selector, "Checkbox not checked")
+            self._log_pass("checkbox_check", selector, "- Checked successfully", verify=mode)
             return True
         except Exception as e:
             self._log_fail("checkbox_check", selector, e)
@@ -85,11 +260,11 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.uncheck()
-            is_checked = element.is_checked()
-            if not is_checked:
-                self._log_pass("checkbox_uncheck", selector, "- Unchecked successfully")
-            else:
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify and element.is_checked():
                 self._log_fail("checkbox_uncheck", selector, "Checkbox still checked")
+            self._log_pass("checkbox_uncheck", selector, "- Unchecked successfully", verify=mode)
             return True
         except Exception as e:
             self._log_fail("checkbox_uncheck", selector, e)
@@ -114,8 +289,10 @@ class WebElementHelper:
                 element.uncheck()
             else:
                 element.check()
-            new_state = element.is_checked()
-            self._log_pass("checkbox_toggle", selector, f"- {current_state} → {new_state}")
+            self.invalidate_table()
+            verify, mode = self._verify()
+            new_state = element.is_checked() if verify else not current_state
+            self._log_pass("checkbox_toggle", selector, f"- {current_state} → {new_state}", verify=mode)
             return True
         except Exception as e:
             self._log_fail("checkbox_toggle", selector, e)
@@ -126,11 +303,11 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.check()
-            is_checked = element.is_checked()
-            if is_checked:
-                self._log_pass("radio_select", selector, "- Selected successfully")
-            else:
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify and not element.is_checked():
                 self._log_fail("radio_select", selector, "Radio not selected")
+            self._log_pass("radio_select", selector, "- Selected successfully", verify=mode)
             return True
         except Exception as e:
             self._log_fail("radio_select", selector, e)
@@ -162,11 +339,13 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.select_option(value=value)
-            selected = element.input_value()
-            if selected == value:
-                self._log_pass("dropdown_select_by_value", selector, f"- Value: '{value}'")
-            else:
-                self._log_fail("dropdown_select_by_value", selector, f"Expected '{value}', got '{selected}'")
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify:
+                selected = element.input_value()
+                if selected != value:
+                    self._log_fail("dropdown_select_by_value", selector, f"Expected '{value}', got '{selected}'")
+            self._log_pass("dropdown_select_by_value", selector, f"- Value: '{value}'", verify=mode)
             return True
         except Exception as e:
             self._log_fail("dropdown_select_by_value", selector, e)
@@ -176,6 +355,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.select_option(label=label)
+            self.invalidate_table()
             self._log_pass("dropdown_select_by_label", selector, f"- Label: '{label}'")
             return True
         except Exception as e:
@@ -186,6 +366,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.select_option(index=index)
+            self.invalidate_table()
             self._log_pass("dropdown_select_by_index", selector, f"- Index: {index}")
             return True
         except Exception as e:
@@ -218,11 +399,13 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.fill(date)
-            actual = element.input_value()
-            if actual == date:
-                self._log_pass("datepicker_set_date", selector, f"- Date: {date}")
-            else:
-                self._log_fail("datepicker_set_date", selector, f"Expected '{date}', got '{actual}'")
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify:
+                actual = element.input_value()
+                if actual != date:
+                    self._log_fail("datepicker_set_date", selector, f"Expected '{date}', got '{actual}'")
+            self._log_pass("datepicker_set_date", selector, f"- Date: {date}", verify=mode)
             return True
         except Exception as e:
             self._log_fail("datepicker_set_date", selector, e)
@@ -232,11 +415,13 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.fill(time_value)
-            actual = element.input_value()
-            if actual == time_value:
-                self._log_pass("timepicker_set_time", selector, f"- Time: {time_value}")
-            else:
-                self._log_fail("timepicker_set_time", selector, f"Expected '{time_value}', got '{actual}'")
+            self.invalidate_table()
+            verify, mode = self._verify()
+            if verify:
+                actual = element.input_value()
+                if actual != time_value:
+                    self._log_fail("timepicker_set_time", selector, f"Expected '{time_value}', got '{actual}'")
+            self._log_pass("timepicker_set_time", selector, f"- Time: {time_value}", verify=mode)
             return True
         except Exception as e:
             self._log_fail("timepicker_set_time", selector, e)
@@ -246,8 +431,10 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.fill(datetime_value)
-            actual = element.input_value()
-            self._log_pass("datetimepicker_set", selector, f"- DateTime: {datetime_value}")
+            self.invalidate_table()
+            verify, mode = self._verify()
+            actual = element.input_value() if verify else datetime_value
+            self._log_pass("datetimepicker_set", selector, f"- DateTime: {actual}", verify=mode)
             return True
         except Exception as e:
             self._log_fail("datetimepicker_set", selector, e)
@@ -258,6 +445,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.set_input_files(file_path)
+            self.invalidate_table()
             self._log_pass("file_upload_single", selector, f"- File: {file_path}")
             return True
         except Exception as e:
@@ -268,6 +456,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.set_input_files(file_paths)
+            self.invalidate_table()
             self._log_pass("file_upload_multiple", selector, f"- Files: {len(file_paths)}")
             return True
         except Exception as e:
@@ -278,26 +467,67 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.set_input_files([])
+            self.invalidate_table()
             self._log_pass("file_clear_upload", selector, "- Cleared")
             return True
         except Exception as e:
             self._log_fail("file_clear_upload", selector, e)
     
     # ========== TABLE ==========
+    def table_snapshot(self, selector, refresh=False, timeout=5000):
+        """
+        Read the whole table (headers and cells) in one evaluate and cache it.
+        If the table is not in the page yet, waits up to timeout ms for its first body row, so
+        a table that is still rendering is not captured empty; a table that is already there is
+        read at once, even when it has no rows. The other table_* methods answer from this snapshot until
+        invalidate_table() is called; every action through this helper that can change the
+        page invalidates automatically, and a snapshot is dropped once the page URL changes.
+        Keyboard input or clicks made on the page directly need invalidate_table() (or refresh).
+        Args:
+            selector: Table (or role=grid element) selector
+            refresh: Take a new snapshot even if one is cached
+            timeout: Milliseconds to wait for the first body row of a table not rendered yet
+        Returns:
+            TableSnapshot
+        """
+        snapshot = self._tables.get(selector)
+        if snapshot is not None and not refresh and snapshot.url == self.page.url:
+            return snapshot
+        try:
+            table = self.page.locator(selector)
+            if not table.count():
+                try:
+                    table.locator(_TABLE_BODY_ROW).first.wait_for(state='attached', timeout=timeout)
+                except Exception:
+                    pass  # Still no rows: an empty table, or the evaluate below reports it missing
+            data = table.evaluate(TABLE_SNAPSHOT_JS)
+            snapshot = TableSnapshot(selector, data['headers'], data['rows'], url=self.page.url)
+            self._tables[selector] = snapshot
+            self._log_pass("table_snapshot", selector, f"- Rows:{snapshot.row_count}, Headers:{len(snapshot.headers)}")
+            return snapshot
+        except Exception as e:
+            self._log_fail("table_snapshot", selector, e)
+
+    def invalidate_table(self, selector=None):
+        """Drop the cached snapshot of one table (or all) after an action changed the page."""
+        if selector is None:
+            self._tables.clear()
+        else:
+            self._tables.pop(selector, None)
+
     def table_get_row_count(self, selector):
         """Get table row count"""
         try:
-            rows = self.page.locator(f"{selector} tbody tr").count()
+            rows = self.table_snapshot(selector).row_count
             self._log_pass("table_get_row_count", selector, f"- Rows: {rows}")
             return rows
         except Exception as e:
             self._log_fail("table_get_row_count", selector, e)
     
     def table_get_cell_text(self, selector, row, col):
-        """Get table cell text (1-indexed)"""
+        """Get table cell text (1-indexed; col can also be a header)"""
         try:
-            cell = self.page.locator(f"{selector} tbody tr:nth-child({row}) td:nth-child({col})")
-            text = cell.inner_text()
+            text = self.table_snapshot(selector).cell(row, col)
             self._log_pass("table_get_cell_text", selector, f"- Row:{row}, Col:{col}, Text:'{text}'")
             return text
         except Exception as e:
@@ -306,16 +536,16 @@ class WebElementHelper:
     def table_get_row_data(self, selector, row):
         """Get entire row data as list"""
         try:
-            cells = self.page.locator(f"{selector} tbody tr:nth-child({row}) td").all_inner_texts()
+            cells = self.table_snapshot(selector).row(row)
             self._log_pass("table_get_row_data", selector, f"- Row:{row}, Cells:{len(cells)}")
             return cells
         except Exception as e:
             self._log_fail("table_get_row_data", selector, e)
     
     def table_get_column_data(self, selector, col):
-        """Get entire column data as list"""
+        """Get entire column data as list (col is 1-indexed or a header)"""
         try:
-            cells = self.page.locator(f"{selector} tbody tr td:nth-child({col})").all_inner_texts()
+            cells = self.table_snapshot(selector).column(col)
             self._log_pass("table_get_column_data", selector, f"- Col:{col}, Cells:{len(cells)}")
             return cells
         except Exception as e:
@@ -326,6 +556,7 @@ class WebElementHelper:
         try:
             cell = self.page.locator(f"{selector} tbody tr:nth-child({row}) td:nth-child({col})")
             cell.click()
+            self.invalidate_table()
             self._log_pass("table_click_cell", selector, f"- Row:{row}, Col:{col}")
             return True
         except Exception as e:
@@ -334,15 +565,22 @@ class WebElementHelper:
     def table_search_text(self, selector, search_text):
         """Search for text in table and return row number"""
         try:
-            rows = self.page.locator(f"{selector} tbody tr").count()
-            for i in range(1, rows + 1):
-                row_text = " ".join(self.page.locator(f"{selector} tbody tr:nth-child({i})").all_inner_texts())
-                if search_text in row_text:
-                    self._log_pass("table_search_text", selector, f"- Found at row:{i}")
-                    return i
-            self._log_fail("table_search_text", selector, f"Text '{search_text}' not found")
+            row = self.table_snapshot(selector).search(search_text)
         except Exception as e:
             self._log_fail("table_search_text", selector, e)
+        if row is None:
+            self._log_fail("table_search_text", selector, f"Text '{search_text}' not found")
+        self._log_pass("table_search_text", selector, f"- Found at row:{row}")
+        return row
+
+    def table_find_rows(self, selector, value, col=None):
+        """Rows (1-indexed) with a cell equal to value, optionally in one column"""
+        try:
+            rows = self.table_snapshot(selector).find_rows(value, col)
+            self._log_pass("table_find_rows", selector, f"- '{value}' in rows: {rows}")
+            return rows
+        except Exception as e:
+            self._log_fail("table_find_rows", selector, e)
     
     # ========== IMAGE ==========
     def image_is_visible(self, selector):
@@ -381,6 +619,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.click()
+            self.invalidate_table()
             self._log_pass("image_click", selector, "- Clicked")
             return True
         except Exception as e:
@@ -392,6 +631,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.click()
+            self.invalidate_table()
             self._log_pass("link_click", selector, "- Clicked")
             return True
         except Exception as e:
@@ -434,6 +674,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.click()
+            self.invalidate_table()
             self._log_pass("button_click", selector, "- Clicked")
             return True
         except Exception as e:
@@ -444,6 +685,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.dblclick()
+            self.invalidate_table()
             self._log_pass("button_double_click", selector, "- Double clicked")
             return True
         except Exception as e:
@@ -454,6 +696,7 @@ class WebElementHelper:
         try:
             element = self.page.locator(selector)
             element.click(button='right')
+            self.invalidate_table()
             self._log_pass("button_right_click", selector, "- Right clicked")
             return True
         except Exception as e:
@@ -486,7 +729,122 @@ class WebElementHelper:
             element = self.page.locator(selector)
             element.wait_for(state='visible', timeout=timeout)
             element.click()
+            self.invalidate_table()
             self._log_pass("button_wait_and_click", selector, f"- Clicked after wait")
             return True
         except Exception as e:
             self._log_fail("button_wait_and_click", selector, e)
+
+    # ========== FORM ==========
+    _FILL_ERRORS = {
+        'missing': "Element not found",
+        'hidden': "Element is not visible",
+        'not-editable': "Element is disabled or read-only",
+        'radio-uncheck': "A checked radio button cannot be unchecked; set True on another option of its group",
+    }
+
+    def fill_form(self, fields, mask=(), timeout=10000):
+        """
+        Fill a form in one browser round trip (text, textarea, select, checkbox, radio,
+        date/time inputs) and verify every value in the same call.
+        Fields not yet in the DOM or not yet visible are waited for (together at most timeout)
+        and filled in one more round trip.
+        Read-back is part of the same call, so it runs whatever VERIFY_LEVEL is.
+        Each field is logged as PASS/FAIL like the single-element methods; if any field
+        fails, one screenshot is taken and an AssertionError lists all failed fields.
+        Args:
+            fields: dict {selector: value}. Checkbox/radio take True/False ('true'/'false');
+                    radios are set-only (False passes only if the radio is already unchecked),
+                    selects take a value or label (a list for multi-selects); date/datetime/time
+                    values (e.g. from the workbook) are sent as ISO strings for date/time inputs
+            mask: Selectors whose values are not written to the report (password fields always masked)
+            timeout: Milliseconds to wait for fields that are not rendered yet
+        Returns:
+            dict: {selector: value read back from the page}
+        """
+        action = "fill_form"
+        if not fields:
+            return {}
+        fields = {sel: self._form_value(value) for sel, value in fields.items()}
+        try:
+            results = self._fill_fields(fields)
+            pending = [sel for sel, r in results.items() if r['status'] in ('missing', 'hidden')]
+            if pending:
+                deadline = time.time() + timeout / 1000
+                for sel in pending:
+                    remaining = (deadline - time.time()) * 1000
+                    if remaining < 1:
+                        break  # Timeout used up: the rest is re-checked once and reported as is
+                    try:
+                        self.page.locator(sel).first.wait_for(state='visible', timeout=remaining)
+                    except Exception:
+                        pass
+                results.update(self._fill_fields({sel: fields[sel] for sel in pending}))
+            for sel, r in results.items():
+                if r['status'] == 'unsupported':
+                    results[sel] = self._fill_field_with_locator(sel, fields[sel], timeout)
+        except Exception as e:
+            self._log_fail(action, ", ".join(fields), e)
+        self.invalidate_table()
+
+        failed = []
+        for sel, value in fields.items():
+            r = results[sel]
+            masked = sel in mask or 'password' in sel.lower()
+            expected, actual = ('********', '********') if masked else (value, r['actual'])
+            if r['status'] == 'ok':
+                self._log_pass(action, sel, f"- Value: '{actual}'", verify="batched")
+                continue
+            if r['status'] == 'mismatch':
+                error = f"Expected '{expected}', got '{actual}'"
+            else:
+                error = r.get('error') or self._FILL_ERRORS.get(r['status'], r['status'])
+            self._record_fail(action, sel, error)
+            failed.append(sel)
+        if failed:
+            self._capture_error_screenshot(action)
+            raise AssertionError(f"{action} failed for {len(failed)}/{len(fields)} field(s): {', '.join(failed)}")
+        return {sel: r['actual'] for sel, r in results.items()}
+
+    @staticmethod
+    def _form_value(value):
+        """Dates/times as the ISO strings date, datetime-local and time inputs accept."""
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%dT%H:%M:%S" if value.second else "%Y-%m-%dT%H:%M")
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, dt_time):
+            return value.strftime("%H:%M:%S" if value.second else "%H:%M")
+        return value
+
+    def _fill_fields(self, fields):
+        """One page.evaluate: fill and read back. Returns {selector: {'status', 'actual'}}"""
+        results = self.page.evaluate(_FILL_FORM_JS, [[sel, value] for sel, value in fields.items()])
+        return dict(zip(fields, results))
+
+    def _fill_field_with_locator(self, selector, value, timeout):
+        """Fallback for selectors only Playwright can resolve (text=, role=, >> chains)."""
+        try:
+            element = self.page.locator(selector)
+            element.wait_for(state='visible', timeout=timeout)
+            kind = element.evaluate("el => el.tagName === 'SELECT' ? 'select' : (el.type || '').toLowerCase()")
+            if kind in ('checkbox', 'radio'):
+                expected = value is True or str(value).strip().lower() in ('true', 'yes', 'y', '1', 'on', 'checked')
+                if kind == 'radio' and not expected and element.is_checked():
+                    return {'status': 'radio-uncheck', 'actual': True}
+                element.set_checked(expected)
+                actual = element.is_checked()
+            elif kind == 'select':
+                expected = element.select_option(value)
+                actual = element.evaluate("el => Array.from(el.selectedOptions).map(o => o.value)")
+                if not isinstance(value, (list, tuple)):
+                    expected, actual = expected[:1], actual[:1]
+            else:
+                expected = str(value)
+                if kind == 'date' and 'T' in expected:
+                    expected = expected[:10]  # Workbook dates arrive as datetimes at midnight
+                element.fill(expected)
+                actual = element.input_value()
+            return {'status': 'ok' if actual == expected else 'mismatch', 'actual': actual}
+        except Exception as e:
+            return {'status': 'error', 'actual': None, 'error': str(e)}
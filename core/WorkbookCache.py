@@ -0,0 +1,181 @@
+"""
+Workbook Cache - Process-wide cache of parsed Excel sheets
+Keeps header and row tables keyed by (path, mtime, sheet) so repeated lookups in one
+Gauge worker cost a dict lookup instead of an openpyxl parse.
+"""
+from collections import OrderedDict
+from openpyxl import load_workbook
+import os
+import sys
+import threading
+
+
+class SheetTable:
+    """Parsed sheet: header row plus data rows as tuples of cell values."""
+    __slots__ = ('headers', 'rows', 'size_bytes')
+
+    def __init__(self, headers, rows, size_bytes):
+        self.headers = headers
+        self.rows = rows
+        self.size_bytes = size_bytes
+
+    def row_dict(self, row_number):
+        """
+        Get a row as a dictionary.
+        Args:
+            row_number: Sheet row number (1-indexed, row 1 is the header)
+        Returns:
+            dict: Column headers mapped to the row's values (None beyond the last row)
+        """
+        if row_number == 1:
+            return dict(zip(self.headers, self.headers))
+        index = row_number - 2
+        if 0 <= index < len(self.rows):
+            return dict(zip(self.headers, self.rows[index]))
+        return dict.fromkeys(self.headers)
+
+
+class WorkbookCache:
+    """
+    LRU cache of parsed sheet tables shared by every TestDataManager in the process.
+    Entries are keyed by path, mtime and sheet, so an edited workbook is re-read
+    automatically. Memory is capped by WORKBOOK_CACHE_MAX_MB (default 256).
+    """
+    DEFAULT_MAX_MB = 256
+    _max_bytes = int(os.getenv('WORKBOOK_CACHE_MAX_MB', DEFAULT_MAX_MB)) * 1024 * 1024
+    _tables = OrderedDict()   # (path, mtime, sheet, data_only) -> SheetTable
+    _sheet_names = {}         # (path, mtime) -> [sheet names]
+    _current_bytes = 0
+    _lock = threading.RLock()
+    _stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    @classmethod
+    def configure(cls, max_mb=None):
+        """Set the memory cap (in MB) and evict down to it."""
+        with cls._lock:
+            if max_mb is not None:
+                cls._max_bytes = int(max_mb) * 1024 * 1024
+            cls._evict()
+
+    # ========================================================================
+    # LOOKUPS
+    # ========================================================================
+    @classmethod
+    def get_table(cls, file_path, sheet_name, data_only=False):
+        """
+        Get the parsed table for a sheet, reading the workbook only on a miss.
+        Args:
+            file_path: Full path to the Excel workbook
+            sheet_name: Name of the sheet
+            data_only: Read cached formula results instead of formulas
+        Returns:
+            SheetTable: Parsed header and rows
+        Raises:
+            KeyError: If the sheet does not exist in the workbook
+        """
+        file_path = os.path.abspath(file_path)
+        mtime = os.path.getmtime(file_path)
+        key = (file_path, mtime, sheet_name, data_only)
+        with cls._lock:
+            table = cls._tables.get(key)
+            if table is not None:
+                cls._tables.move_to_end(key)
+                cls._stats['hits'] += 1
+                return table
+            cls._stats['misses'] += 1
+            cls._drop_stale(file_path, mtime)
+            table = cls._read_table(file_path, mtime, sheet_name, data_only)
+            cls._tables[key] = table
+            cls._current_bytes += table.size_bytes
+            cls._evict()
+            return table
+
+    @classmethod
+    def get_sheet_names(cls, file_path):
+        """Get the sheet names of a workbook (cached per path and mtime)."""
+        file_path = os.path.abspath(file_path)
+        mtime = os.path.getmtime(file_path)
+        with cls._lock:
+            names = cls._sheet_names.get((file_path, mtime))
+            if names is not None:
+                cls._stats['hits'] += 1
+                return list(names)
+            cls._stats['misses'] += 1
+            cls._drop_stale(file_path, mtime)
+            workbook = load_workbook(file_path, read_only=True)
+            try:
+                names = list(workbook.sheetnames)
+            finally:
+                workbook.close()
+            cls._sheet_names[(file_path, mtime)] = names
+            return list(names)
+
+    @classmethod
+    def invalidate(cls, file_path=None):
+        """Drop cached tables for one workbook, or everything."""
+        with cls._lock:
+            if file_path is None:
+                cls._tables.clear()
+                cls._sheet_names.clear()
+                cls._current_bytes = 0
+            else:
+                cls._drop_stale(os.path.abspath(file_path), None)
+            cls._stats['invalidations'] += 1
+
+    # ========================================================================
+    # STATISTICS
+    # ========================================================================
+    @classmethod
+    def get_stats(cls):
+        """Get hit/miss counters and current memory usage."""
+        with cls._lock:
+            stats = dict(cls._stats)
+            stats['tables'] = len(cls._tables)
+            stats['bytes'] = cls._current_bytes
+            stats['max_bytes'] = cls._max_bytes
+            return stats
+
+    @classmethod
+    def format_stats(cls):
+        """Format the cache statistics as a single summary line."""
+        stats = cls.get_stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / lookups * 100) if lookups else 0.0
+        return (f"Workbook cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.1f}% hit rate), "
+                f"{stats['evictions']} evictions, {stats['tables']} tables, "
+                f"{stats['bytes'] / (1024 * 1024):.1f}/{stats['max_bytes'] / (1024 * 1024):.0f} MB")
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+    @classmethod
+    def _read_table(cls, file_path, mtime, sheet_name, data_only):
+        workbook = load_workbook(file_path, read_only=True, data_only=data_only)
+        try:
+            cls._sheet_names[(file_path, mtime)] = list(workbook.sheetnames)
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            headers = list(next(rows, ()))
+            data_rows = []
+            size_bytes = sys.getsizeof(headers)
+            for row in rows:
+                data_rows.append(row)
+                size_bytes += sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row if v is not None)
+        finally:
+            workbook.close()
+        return SheetTable(headers, data_rows, size_bytes)
+
+    @classmethod
+    def _drop_stale(cls, file_path, current_mtime):
+        """Remove entries for file_path whose mtime differs from current_mtime."""
+        for key in [k for k in cls._tables if k[0] == file_path and k[1] != current_mtime]:
+            cls._current_bytes -= cls._tables.pop(key).size_bytes
+        for key in [k for k in cls._sheet_names if k[0] == file_path and k[1] != current_mtime]:
+            del cls._sheet_names[key]
+
+    @classmethod
+    def _evict(cls):
+        """Evict least recently used tables until under the memory cap (always keep the newest)."""
+        while cls._current_bytes > cls._max_bytes and len(cls._tables) > 1:
+            _, table = cls._tables.popitem(last=False)
+            cls._current_bytes -= table.size_bytes
+            cls._stats['evictions'] += 1
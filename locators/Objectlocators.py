@@ -19,6 +19,11 @@ class Objectlocators:
     # XPath: //input[@name='login-button']
     LOGIN_BUTTON = "input[name='login-button']"
 
+    # Login Error Message (invalid or locked-out credentials)
+    # CSS: h3[data-test='error']
+    # XPath: //h3[@data-test='error']
+    LOGIN_ERROR_MESSAGE = "h3[data-test='error']"
+
     # Application Logo/Title (for verification)
     APP_LOGO = ".app_logo"
     TITLE = ".title"
@@ -1,12 +1,30 @@
-from getgauge.python import before_suite, after_suite, before_scenario, after_scenario, after_step, screenshot, ExecutionContext, data_store
+from getgauge.python import before_suite, after_suite, before_spec, after_spec, before_scenario, after_scenario, before_step, after_step, screenshot, ExecutionContext, data_store
 from core.Core_basePage import BasePage
 from core.TestDataManager import TestDataManager
 from core.ReportLogger import ReportLogger
+from core.WorkbookCache import WorkbookCache
+from core.AuthStateCache import AuthStateCache
+from core.NetworkProfiles import NetworkProfiles
+from core.HarManager import HarManager
+from core.StaticAssetCache import StaticAssetCache
+from core.WebElementHelper import WebElementHelper
+from core.PollingAssertions import PollingAssertions
+from core.EventLog import EventLog
+from core.Timings import Timings
+from core.PlaywrightProfiler import PlaywrightProfiler
+from core.PageMetrics import PageMetrics
 import os
 import zipfile
 import shutil
 from datetime import datetime
 
+def _verify_level_label():
+    """VERIFY_LEVEL for the verification summaries, with the seed when sampling (to reproduce a run)."""
+    settings = BasePage.get_settings()
+    if settings.verify_level == 'sampled':
+        return f"sampled, seed {settings.verify_seed}"
+    return settings.verify_level
+
 def archive_reports():
     """Archive existing reports before new test execution"""
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -74,16 +92,75 @@ def archive_reports():
         print(f"Warning: Could not archive reports: {e}")
 
 @before_suite
+@Timings.hook('before_suite', opens=lambda: "suite")
 def init_driver():
     # Archive existing reports before running new tests
-    archive_reports()
-    BasePage.initialize()
+    with Timings.span('archive_reports'):
+        archive_reports()
+    # Build and validate typed settings once - misconfiguration fails here, not mid-run
+    settings = BasePage.load_settings()
+    WorkbookCache.configure(max_mb=settings.workbook_cache_max_mb)
+    ReportLogger.configure(settings.log_level)
+    EventLog.start(settings.event_log_keep_runs)
+    PlaywrightProfiler.configure(settings.playwright_profiler, settings.playwright_profiler_buffer)
+    with Timings.span('browser_launch'):
+        BasePage.initialize()
 
 @after_suite
+@Timings.hook('after_suite')
 def close_driver():
-    BasePage.close()
+    print(BasePage.get_context_pool_stats())
+    if BasePage.get_settings().auth_state_cache:
+        print(AuthStateCache.format_stats())
+    if BasePage.get_settings().network_profile != 'off':
+        print(NetworkProfiles.format_stats())
+    if BasePage.get_settings().network_learn_sizes:
+        NetworkProfiles.save_sizes()
+    print(WebElementHelper.format_verify_stats(level=_verify_level_label()))
+    if PollingAssertions.export():
+        print(PollingAssertions.format_stats())
+    if PageMetrics.export():
+        print(PageMetrics.format_stats())
+    if PlaywrightProfiler.enabled:
+        exported = PlaywrightProfiler.export()
+        print(PlaywrightProfiler.format_stats())
+        if exported:
+            print(f"Playwright call profile: {exported}")
+    if BasePage.get_settings().har_mode != 'off':
+        print(HarManager.format_stats())
+    if BasePage.get_settings().static_cache:
+        print(StaticAssetCache.format_stats())
+        StaticAssetCache.enforce_limit(BasePage.get_settings().static_cache_max_mb)
+    with Timings.span('browser_close'):
+        BasePage.close()
+    print(WorkbookCache.format_stats())
+    print(ReportLogger.format_stats())
+    EventLog.stop()
+    merged_events = EventLog.merge()
+    if merged_events:
+        print(f"Event log: {merged_events} (errors: {merged_events.parent / 'execution_errors.log'})")
+        merged_metrics = PageMetrics.merge(merged_events.parent)
+        if merged_metrics:
+            print(f"Page metrics of the run: {merged_metrics}")
+    # Close the suite frame, then export the profile (JSON + collapsed stacks) and the slowest items
+    Timings.finish()
+    exported = Timings.export()
+    if exported:
+        print(Timings.format_top())
+        print(f"Timing profile: {exported[0]} (flamegraph: {exported[1]})")
+
+@before_spec
+@Timings.hook('before_spec', opens=lambda context: f"spec:{context.specification.name}")
+def open_spec_timing(context: ExecutionContext):
+    pass
+
+@after_spec
+@Timings.hook('after_spec', closes=True)
+def close_spec_timing(context: ExecutionContext):
+    pass
 
 @before_scenario
+@Timings.hook('before_scenario', opens=lambda context: f"scenario:{context.scenario.name}")
 def init_context(context: ExecutionContext):
     # Store scenario tags in data_store for access in steps
     data_store.scenario['tags'] = context.scenario.tags
@@ -91,58 +168,44 @@ def init_context(context: ExecutionContext):
     # Store specification file name (e.g., sp_login.spec)
     spec_file_name = context.specification.file_name if hasattr(context.specification, 'file_name') else ''
     data_store.scenario['spec_file'] = spec_file_name
+    EventLog.set_context(scenario=context.scenario.name, spec=context.specification.name)
+    EventLog.emit('scenario_start', tags=list(context.scenario.tags), spec_file=spec_file_name)
     
     # Create browser context
-    BasePage.create_context()
-    BasePage.start_tracing()
+    with Timings.span('create_context'):
+        BasePage.create_context()
+    with Timings.span('start_tracing'):
+        BasePage.start_tracing()
     
     # Automatically load test data based on scenario tags
-    test_data = TestDataManager.load_test_data()
+    with Timings.span('load_test_data'):
+        test_data = TestDataManager.load_test_data()
     if test_data:
         test_id = TestDataManager.get_test_id()
         test_sheet = TestDataManager.get_test_sheet()
         ReportLogger.log_custom(f"📋 Test Data Auto-Loaded: {test_id} from {test_sheet} sheet")
         ReportLogger.log_custom(f"   Available data keys: {', '.join(test_data.keys())}")
+    ReportLogger.flush()
+
+@before_step
+@Timings.hook('before_step', opens=lambda context: f"step:{context.step.text}")
+def open_step_timing(context: ExecutionContext):
+    pass
 
 @after_step
+@Timings.hook('after_step', closes=True)
 def capture_on_step_failure(context: ExecutionContext):
-    """Capture screenshot and error details immediately when a step fails"""
+    """Record the step event; on failure capture a screenshot immediately"""
+    step_event = {'step': context.step.text, 'status': 'failed' if context.step.is_failing else 'passed'}
     if context.step.is_failing:
-        from getgauge.python import Messages
         import traceback
-        # Log error details
-        error_info = {
-            'step': context.step.text,
-            'scenario': context.scenario.name,
-            'spec': context.specification.name,
-            'tags': context.scenario.tags,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        # Get error message if available
+        # Error details go to the event stream; the text error log is rendered from it at suite end
         try:
-            error_msg = str(context.step.error_message) if hasattr(context.step, 'error_message') else "Unknown error"
-            error_info['error'] = error_msg
+            step_event['error'] = str(context.step.error_message) if hasattr(context.step, 'error_message') else "Unknown error"
         except:
-            error_info['error'] = "Error details not available"
-        try:
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            logs_dir = os.path.join(project_root, "logs")
-            os.makedirs(logs_dir, exist_ok=True)
-            error_log_path = os.path.join(logs_dir, "execution_errors.log")
-            with open(error_log_path, 'a', encoding='utf-8') as f:
-                f.write("\n" + "=" * 70 + "\n")
-                f.write(f"EXECUTION ERROR - {error_info['timestamp']}\n")
-                f.write("=" * 70 + "\n")
-                f.write(f"Step: {error_info['step']}\n")
-                f.write(f"Scenario: {error_info['scenario']}\n")
-                f.write(f"Spec: {error_info['spec']}\n")
-                f.write(f"Tags: {', '.join(error_info['tags'])}\n")
-                f.write(f"Error: {error_info['error']}\n")
-                f.write("-" * 70 + "\n")
-                f.write(f"Stack Trace:\n{traceback.format_exc()}\n")
-                f.write("=" * 70 + "\n\n")
-        except Exception as log_error:
-            Messages.write_message(f"   ⚠️ Failed to write error log: {str(log_error)}")
+            step_event['error'] = "Error details not available"
+        step_event['stack_trace'] = getattr(context.step, 'stack_trace', None) or traceback.format_exc()
+        step_event['tags'] = list(context.scenario.tags)
         try:
             page = BasePage.get_page()
             if page and BasePage.screenshot_on_failure():
@@ -150,36 +213,59 @@ def capture_on_step_failure(context: ExecutionContext):
                 scenario_name = context.scenario.name.replace(" ", "_")[:30]
                 screenshot_path = BasePage.take_screenshot(f"failed_step_{scenario_name}_{step_name}")
                 relative_path = f"../screenshots/{os.path.basename(screenshot_path)}"
-                Messages.write_message(f"📸 Screenshot captured: ![{step_name}]({relative_path})")
+                ReportLogger.write(f"📸 Screenshot captured: ![{step_name}]({relative_path})", 'ERROR')
         except Exception as e:
-            Messages.write_message(f"   ⚠️ Failed to capture step screenshot: {str(e)}")
+            ReportLogger.write(f"   ⚠️ Failed to capture step screenshot: {str(e)}", 'WARNING')
+    EventLog.emit('step', **step_event)
+    # One consolidated report message per step
+    ReportLogger.flush()
 
 
 @after_scenario
+@Timings.hook('after_scenario', closes=True)
 def close_context(context: ExecutionContext):
     # Take screenshot on failure and attach to report
     if context.scenario.is_failing:
         try:
             if BasePage.get_page() and BasePage.screenshot_on_failure():
                 scenario_name = context.scenario.name.replace(" ", "_")
-                screenshot_path = BasePage.take_screenshot(f"failed_{scenario_name}")
-                # Also capture screenshot bytes for Gauge report
-                screenshot_bytes = BasePage.get_page().screenshot()
+                with Timings.span('failure_screenshot'):
+                    screenshot_path = BasePage.take_screenshot(f"failed_{scenario_name}")
+                    # Also capture screenshot bytes for Gauge report
+                    screenshot_bytes = BasePage.get_page().screenshot()
                 # Write to Gauge messages with Markdown link
                 relative_path = f"../screenshots/{os.path.basename(screenshot_path)}"
-                from getgauge.python import Messages
-                Messages.write_message(f"❌ Scenario Failed - Screenshot: ![{scenario_name}]({relative_path})")
+                ReportLogger.write(f"❌ Scenario Failed - Screenshot: ![{scenario_name}]({relative_path})", 'ERROR')
         except Exception as e:
-            from getgauge.python import Messages
-            Messages.write_message(f"⚠️ Failed to capture screenshot: {str(e)}")
+            ReportLogger.write(f"⚠️ Failed to capture screenshot: {str(e)}", 'WARNING')
+    # Soft assertion failures the scenario never asserted (e.g. soft perf budgets) fail it at the end
+    unasserted = list(BasePage.session().soft_errors)
+    if unasserted:
+        BasePage.clear_soft_errors()
+        for error in unasserted:
+            ReportLogger.log_error(f"Soft assertion not asserted: {error}")
+        EventLog.emit('soft_assertions', errors=unasserted)
+    # Read-backs done/skipped under VERIFY_LEVEL in this scenario
+    verify_stats = WebElementHelper.get_scenario_verify_stats()
+    if verify_stats['verified'] or verify_stats['skipped']:
+        ReportLogger.log_custom(WebElementHelper.format_verify_stats(verify_stats, _verify_level_label()))
+    ReportLogger.flush()
     # Stop tracing if enabled
     if BasePage.is_tracing_enabled():
         scenario_name = context.scenario.name.replace(" ", "_")
-        BasePage.stop_tracing(scenario_name)
-    # Close browser context
-    BasePage.close_context()
+        with Timings.span('stop_tracing'):
+            BasePage.stop_tracing(scenario_name)
+    # Close browser context and pre-warm the next one(s) while no scenario is waiting
+    with Timings.span('close_context'):
+        BasePage.close_context()
+    with Timings.span('refill_context_pool'):
+        BasePage.refill_context_pool()
     # Clear test data for next scenario
     TestDataManager.clear()
+    EventLog.emit('scenario_end', status='failed' if context.scenario.is_failing or unasserted else 'passed')
+    EventLog.clear_context()
+    if unasserted:
+        raise AssertionError("Soft assertion failures:\n" + "\n".join(unasserted))
 
 @screenshot
 def take_screenshot_on_failure():
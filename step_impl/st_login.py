@@ -35,7 +35,13 @@ def login_with_excel_data(row_number):
     test_data = excel.get_row_data(test_data_sheet, int(row_number))
     excel.close()
     ReportLogger.log_test_data(test_data)
-    PageObjectManager.get_page(LoginPage).login(test_data['Username'], test_data['Password'])
+    page = PageObjectManager.get_page(LoginPage)
+    expected_error = test_data.get('ExpectedError')
+    # A row with an ExpectedError asserts the login outcome, so it never uses the session cache
+    page.login(test_data['Username'], test_data['Password'], use_cache=not expected_error)
+    if expected_error:
+        page.poll_assert_text_contains(page.get_page(), Objectlocators.LOGIN_ERROR_MESSAGE, expected_error, "Login error")
+        log_complete(f"Login rejected as expected: {expected_error}")
 
 @step("Login with Swag Labs")
 def login_with_swag_labs():
@@ -65,7 +71,8 @@ def login_with_swag_labs():
         if not username or not password:
             raise ValueError(f"Username or Password missing in test data for {test_id}")
         page = PageObjectManager.get_page(LoginPage)
-        page.login(username, password)
+        # A login expected to fail must see the login form, never a restored session
+        page.login(username, password, use_cache=not TestDataManager.get_value('ExpectedError'))
         log_complete(f"Login completed for {test_id}")
         capture_step_screenshot("Login_Success")
     except Exception as e:
@@ -0,0 +1,80 @@
+"""
+Run data-driven login checks concurrently with the async engine (one process, one browser).
+
+Every row of the login sheet becomes an independent flow: open the app, log in with the
+row's Username/Password and check that the application logo appears. Rows with an
+ExpectedError (e.g. a locked-out user) pass when that login error message is shown instead.
+
+Usage:
+    python yml/async_login_runner.py                               # LoginData, 10 sessions at a time
+    python yml/async_login_runner.py --concurrency 30 --repeat 5   # load-style run
+    python yml/async_login_runner.py --sheet EmployeeCreation --tags TC004
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path before importing core modules
+yml_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(yml_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from env_loader import load_env_context
+from core.AsyncBasePage import AsyncFlowRunner
+from core.Core_basePage import BasePage
+from core.TestDataManager import TestDataManager
+from locators.Objectlocators import Objectlocators
+
+
+def build_login_flow(row):
+    async def login_flow(session):
+        await session.navigate_to(row.get('Url') or session.get_app_url())
+        await session.login(row['Username'], row['Password'])
+        expected_error = row.get('ExpectedError')
+        if expected_error:
+            message = f"Login error for {row['Username']}"
+            await session.assert_element_visible(Objectlocators.LOGIN_ERROR_MESSAGE, message)
+            await session.assert_text_contains(Objectlocators.LOGIN_ERROR_MESSAGE, str(expected_error), message)
+        else:
+            await session.assert_element_visible(Objectlocators.APP_LOGO, f"Login as {row['Username']}")
+    return login_flow
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent data-driven login checks (async engine)')
+    parser.add_argument('--sheet', default='LoginData', help='Sheet with Username/Password rows')
+    parser.add_argument('--tags', help='Comma-separated Test IDs to run (default: all rows)')
+    parser.add_argument('--concurrency', type=int, default=10, help='Sessions open at the same time')
+    parser.add_argument('--repeat', type=int, default=1, help='Run every row this many times')
+    args = parser.parse_args()
+
+    os.environ.update(load_env_context())
+    settings = BasePage.load_settings()
+
+    query = TestDataManager(settings.test_data_file).query(args.sheet)
+    if args.tags:
+        query = query.where(settings.test_id_columns[0], 'in', [t.strip() for t in args.tags.split(',')])
+    rows = [row for row in query.rows() if row.get('Username') and row.get('Password')]
+    if not rows:
+        print(f"No login rows found in '{args.sheet}'")
+        sys.exit(1)
+
+    id_column = settings.test_id_columns[0]
+    flows = []
+    for run in range(args.repeat):
+        for row in rows:
+            name = str(row.get(id_column) or row['Username'])
+            flows.append((f"{name}#{run + 1}" if args.repeat > 1 else name, build_login_flow(row)))
+
+    print(f"Running {len(flows)} login flows on {settings.browser}, {args.concurrency} at a time...")
+    start = time.perf_counter()
+    results = AsyncFlowRunner(concurrency=args.concurrency, settings=settings).run(flows)
+    print(AsyncFlowRunner.format_summary(results, time.perf_counter() - start))
+    if not all(r.passed for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import subprocess
 import os
 from yaml_reader import load_execution_config
 from env_loader import load_env_context
+from core.BrowserServer import BrowserServer
+from core.Settings import TRUE_VALUES
 
 # Resolve config path relative to this script
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -65,13 +67,26 @@ def run_gauge_with_tags():
     # Specs folder
     cmd.append("specs/")
 
+    # Optionally share one browser between all parallel streams
+    server = None
+    run_env = os.environ.copy()
+    if execution.get("shared_browser_server"):
+        browser = os.environ.get("BROWSER", "chromium")
+        headless = str(os.environ.get("HEADLESS", "true")).lower() in TRUE_VALUES
+        server = BrowserServer(browser, headless=headless)
+        run_env["BROWSER_WS_ENDPOINT"] = server.start()
+        print(f"Shared {browser} browser server listening on {server.ws_endpoint}")
+
     print("Executing:", " ".join(cmd))
     try:
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, env=run_env)
     except subprocess.CalledProcessError as e:
         print(f"\n[!] Gauge execution failed with exit code {e.returncode}")
         # We exit gracefully so it doesn't look like the runner script crashed
         exit(e.returncode)
+    finally:
+        if server:
+            server.stop()
 
 if __name__ == "__main__":
     run_gauge_with_tags()
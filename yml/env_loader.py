@@ -1,6 +1,4 @@
 import os
-import openpyxl
-from pathlib import Path
 import sys
 
 # Add project root to path before importing core modules
@@ -9,7 +7,7 @@ project_root = os.path.dirname(yml_dir)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from core.TestDataManager import TestDataManager
+from core.ConfigSnapshot import ConfigSnapshot
 def load_env_context():
     """
     Reads configuration from the configured Excel file (defined in default.properties)
@@ -21,7 +19,7 @@ def load_env_context():
     # 1. Read default.properties to find TEST_DATA_FILE
     props_path = os.path.join(project_root, 'env', 'default', 'default.properties')
     # test_data_file = 'td_FrameworkData.xlsx' # Default
-    test_data_file = TestDataManager.get_test_data_file()
+    test_data_file = os.getenv('TEST_DATA_FILE')
     
     if os.path.exists(props_path):
         try:
@@ -37,26 +35,15 @@ def load_env_context():
         except Exception as e:
             print(f"Warning: Failed to read default.properties: {e}")
 
-    # 2. Read the Excel File
-    excel_path = os.path.join(project_root, 'data', test_data_file)
+    # 2. Resolve the Environment sheet once and publish the snapshot that every
+    #    Gauge worker loads instead of re-discovering and re-parsing Excel
     env_vars = {}
-    
-    if os.path.exists(excel_path):
-        try:
-            # Use data_only=True to get values instead of formulas
-            wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
-            if 'Environment' in wb.sheetnames:
-                ws = wb['Environment']
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if row[0]:
-                        key = str(row[0]).strip()
-                        value = str(row[1]).strip() if row[1] is not None else ""
-                        env_vars[key] = value
-            wb.close()
-            print(f"Loaded {len(env_vars)} environment variables from {test_data_file}")
-        except Exception as e:
-            print(f"Warning: Failed to read Excel config {test_data_file}: {e}")
-    else:
-        print(f"Warning: Test data file not found: {excel_path}")
+    try:
+        config, config_path = ConfigSnapshot.resolve(test_data_file)
+        env_vars.update(config)
+        env_vars['CONFIG_SNAPSHOT_FILE'] = str(ConfigSnapshot.get_snapshot_path())
+        print(f"Loaded {len(config)} environment variables from {config_path.name}")
+    except Exception as e:
+        print(f"Warning: Failed to read Excel config {test_data_file}: {e}")
         
     return env_vars
@@ -2,6 +2,7 @@ import yaml
 import subprocess
 import os
 import sys
+from datetime import datetime
 
 # Resolve config path relative to this script
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,6 +11,8 @@ project_root = os.path.dirname(script_dir)
 sys.path.insert(0, project_root)
 
 from core.report_merger import GaugeReportMerger
+from core.BrowserServer import BrowserServer
+from core.Settings import TRUE_VALUES
 from env_loader import load_env_context
 
 config_path = os.path.join(script_dir, "yl_parallelexecution.yml")
@@ -21,6 +24,9 @@ os.environ.update(excel_env)
 with open(config_path) as f:
     config = yaml.safe_load(f)["execution"]
 
+# One event log run folder for every browser run started here (see core/EventLog.py)
+os.environ.setdefault("EVENT_RUN_ID", f"run-{datetime.now().strftime('%Y%m%d_%H%M%S')}-{os.getpid()}")
+
 base_cmd = ["gauge", "run"]
 
 if config.get("parallel"):
@@ -48,30 +54,50 @@ if config.get("exclude_tags"):
 base_cmd += [f"--env={config['env']}", "specs/"]
 
 browsers = config.get("browsers", [])
-if not browsers:
-    # No browsers specified, run once with default/env config
-    subprocess.run(base_cmd, check=True)
-else:
-    # Run for each browser concurrently
-    processes = []
-    print(f"Starting execution for browsers: {browsers}")
-    
-    for browser in browsers:
-        env = os.environ.copy()
-        env["BROWSER"] = browser
-        env["GAUGE_REPORTS_DIR"] = f"reports/{browser}"
-        print(f"Launching run for BROWSER={browser} with command: {' '.join(base_cmd)}")
-        p = subprocess.Popen(base_cmd, env=env)
-        processes.append(p)
-    
-    # Wait for all to complete
-    exit_codes = [p.wait() for p in processes]
-    
-    # Generate Consolidated Report
-    print("\ngenerating Consolidated Report...")
-    merger = GaugeReportMerger(browsers)
-    merger.merge_reports()
-    
-    if any(code != 0 for code in exit_codes):
-        sys.exit(1)
 
+# Optionally start one shared browser server per browser type; every Gauge stream
+# connects to it (BROWSER_WS_ENDPOINT) instead of launching its own browser
+servers = {}
+if config.get("shared_browser_server"):
+    headless = str(os.environ.get("HEADLESS", "true")).lower() in TRUE_VALUES
+    for browser in browsers or [os.environ.get("BROWSER", "chromium")]:
+        server = BrowserServer(browser, headless=headless)
+        print(f"Starting shared browser server for {browser}...")
+        print(f"  {browser} server listening on {server.start()}")
+        servers[browser] = server
+
+try:
+    if not browsers:
+        # No browsers specified, run once with default/env config
+        env = os.environ.copy()
+        if servers:
+            env["BROWSER_WS_ENDPOINT"] = next(iter(servers.values())).ws_endpoint
+        subprocess.run(base_cmd, check=True, env=env)
+    else:
+        # Run for each browser concurrently
+        processes = []
+        print(f"Starting execution for browsers: {browsers}")
+        
+        for browser in browsers:
+            env = os.environ.copy()
+            env["BROWSER"] = browser
+            env["GAUGE_REPORTS_DIR"] = f"reports/{browser}"
+            if browser in servers:
+                env["BROWSER_WS_ENDPOINT"] = servers[browser].ws_endpoint
+            print(f"Launching run for BROWSER={browser} with command: {' '.join(base_cmd)}")
+            p = subprocess.Popen(base_cmd, env=env)
+            processes.append(p)
+        
+        # Wait for all to complete
+        exit_codes = [p.wait() for p in processes]
+        
+        # Generate Consolidated Report
+        print("\ngenerating Consolidated Report...")
+        merger = GaugeReportMerger(browsers)
+        merger.merge_reports()
+        
+        if any(code != 0 for code in exit_codes):
+            sys.exit(1)
+finally:
+    for server in servers.values():
+        server.stop()
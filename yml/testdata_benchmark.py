@@ -0,0 +1,132 @@
+"""
+Benchmark Test ID / row lookups: plain openpyxl vs the TestDataManager backends.
+
+Usage:
+    python yml/testdata_benchmark.py                        # synthetic 20k-row workbook
+    python yml/testdata_benchmark.py --rows 100000
+    python yml/testdata_benchmark.py --file data/td_EmployeeCreationData.xlsx --sheet LoginData
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to path before importing core modules
+yml_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(yml_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from core.TestDataBackends import BACKENDS, compile_workbook, open_backend
+
+TEST_ID_COLUMNS = ['Tags']
+
+
+def create_synthetic_workbook(path, rows):
+    """Write a workbook with a LoginData-style sheet of the given size."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Employees')
+    sheet.append(['Tags', 'Username', 'Password', 'Department', 'Salary', 'Url'])
+    for i in range(rows):
+        sheet.append([f"EMP{i:06d}", f"user_{i}", f"pwd_{i}", f"Dept{i % 25}", 30000 + (i * 37) % 90000,
+                      "https://example.com/"])
+    workbook.save(path)
+
+
+def openpyxl_lookup(path, sheet_name, test_id):
+    """The original per-lookup path: full workbook load plus linear scan."""
+    workbook = load_workbook(path)
+    sheet = workbook[sheet_name]
+    headers = [cell.value for cell in sheet[1]]
+    indices = [headers.index(c) for c in TEST_ID_COLUMNS if c in headers]
+    try:
+        for row in sheet.iter_rows(min_row=2, values_only=True):
+            for idx in indices:
+                if row[idx] == test_id:
+                    return dict(zip(headers, row))
+    finally:
+        workbook.close()
+    return None
+
+
+def time_lookups(backend, sheet_name, test_ids, row_numbers):
+    start = time.perf_counter()
+    for test_id in test_ids:
+        backend.get_test_data_by_id(sheet_name, test_id, TEST_ID_COLUMNS)
+    by_id = (time.perf_counter() - start) / len(test_ids)
+    start = time.perf_counter()
+    for row_number in row_numbers:
+        backend.get_row_data(sheet_name, row_number)
+    by_row = (time.perf_counter() - start) / len(row_numbers)
+    return by_id, by_row
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark test data lookups per backend')
+    parser.add_argument('--file', help='Workbook to benchmark (default: synthetic workbook)')
+    parser.add_argument('--sheet', default='Employees', help='Sheet to query')
+    parser.add_argument('--rows', type=int, default=20000, help='Rows in the synthetic workbook')
+    parser.add_argument('--lookups', type=int, default=200, help='Lookups per backend')
+    parser.add_argument('--baseline-lookups', type=int, default=3, help='Lookups for the slow openpyxl baseline')
+    parser.add_argument('--formats', default='sqlite,json,csv,parquet', help='Compiled formats to compare')
+    args = parser.parse_args()
+
+    # Synthetic workbook and compiled files live in a temp directory removed at exit
+    with tempfile.TemporaryDirectory(prefix='td_bench_') as temp_dir:
+        try:
+            run_benchmark(args, temp_dir)
+        finally:
+            BACKENDS['sqlite'].close_all()  # Release the compiled file before the directory is removed
+
+
+def run_benchmark(args, temp_dir):
+    """Time the openpyxl baseline and every backend; compiled files go to temp_dir."""
+    path = args.file
+    if not path:
+        path = os.path.join(temp_dir, 'td_Benchmark.xlsx')
+        print(f"Creating synthetic workbook with {args.rows} rows...")
+        create_synthetic_workbook(path, args.rows)
+
+    excel = open_backend(path, 'excel')
+    headers = excel.get_headers(args.sheet)
+    id_col = next((headers.index(c) for c in TEST_ID_COLUMNS if c in headers), 0)
+    all_rows = list(excel.iter_rows(args.sheet))
+    population = [(n, row[id_col]) for n, row in enumerate(all_rows, start=2) if row and row[id_col]]
+    sample = random.choices(population, k=args.lookups)
+    test_ids = [test_id for _, test_id in sample]
+    row_numbers = [n for n, _ in sample]
+    print(f"Workbook: {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB, {len(all_rows)} rows in '{args.sheet}')\n")
+
+    results = []
+    start = time.perf_counter()
+    for test_id in test_ids[:args.baseline_lookups]:
+        openpyxl_lookup(path, args.sheet, test_id)
+    baseline = (time.perf_counter() - start) / max(min(args.baseline_lookups, len(test_ids)), 1)
+    results.append(('openpyxl (load + scan per lookup)', None, baseline, None))
+
+    by_id, by_row = time_lookups(excel, args.sheet, test_ids, row_numbers)
+    results.append(('excel + WorkbookCache (warm)', None, by_id, by_row))
+
+    for fmt in [f.strip() for f in args.formats.split(',') if f.strip()]:
+        try:
+            start = time.perf_counter()
+            output = compile_workbook(path, fmt, TEST_ID_COLUMNS, output_path=os.path.join(temp_dir, f"bench.{fmt}"))
+            compile_time = time.perf_counter() - start
+            backend = BACKENDS[fmt](path, output)
+            by_id, by_row = time_lookups(backend, args.sheet, test_ids, row_numbers)
+            results.append((fmt, compile_time, by_id, by_row))
+        except ImportError as e:
+            print(f"Skipping {fmt}: {e}")
+
+    print(f"{'Backend':<36}{'compile (s)':>12}{'by Test ID (ms)':>18}{'by row (ms)':>14}{'speedup':>10}")
+    for name, compile_time, by_id, by_row in results:
+        compile_col = f"{compile_time:.2f}" if compile_time is not None else '-'
+        row_col = f"{by_row * 1000:.3f}" if by_row is not None else '-'
+        print(f"{name:<36}{compile_col:>12}{by_id * 1000:>18.3f}{row_col:>14}{baseline / by_id:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()